@@ -0,0 +1 @@
+"""Benchmarking tools for the dbt pipelines in this project."""
@@ -0,0 +1 @@
+"""Baseline capture, comparison and reporting scripts for the benchmark CLI."""
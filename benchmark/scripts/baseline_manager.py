@@ -13,28 +13,119 @@ Features:
 - Handles edge cases and error conditions gracefully
 """
 
-import json
 import logging
+import re
 import subprocess
-import yaml
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple
 import sys
 
-from storage import StorageManager
-from dbt_runner import PipelineRunner
-from metrics_collector import MetricsCollector
-from output_validator import OutputValidator
+from .serialization import load_yaml_file
+from .storage import StorageManager
+from .dbt_runner import PipelineRunner, get_dbt_version
+from .metrics_collector import MetricsCollector
+from .output_validator import OutputValidator
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Sidecar index holding one summary record per baseline file, so listing
+# baselines does not have to open and parse every baseline JSON document.
+INDEX_FILENAME = "baselines_index.jsonl"
+
+# Upper bound on threads used to read baseline files concurrently
+MAX_LOAD_WORKERS = 16
+
+# Parsed baselines kept in memory for load_baseline
+BASELINE_CACHE_SIZE = 32
+
+# Baseline filenames: baseline_<pipeline>_<YYYYMMDD_HHMMSS>.json
+_BASELINE_RE = re.compile(r"baseline_([A-Za-z0-9_]+)_(\d{8}_\d{6})\.json\Z")
+_TIMESTAMP_RE = re.compile(r"\d{8}_\d{6}\Z")
+
+
+def _read_git_head(repo_root: Path) -> Optional[str]:
+    """
+    Resolve HEAD by reading the .git directory directly.
+    
+    Args:
+        repo_root: Directory to start searching for .git from
+    
+    Returns:
+        Commit hash, or None if it can't be resolved without invoking git
+    """
+    for directory in (repo_root, *repo_root.parents):
+        git_dir = directory / ".git"
+        if git_dir.is_dir():
+            break
+        if git_dir.exists():
+            # Worktrees and submodules use a .git file pointing elsewhere
+            return None
+    else:
+        return None
+    
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head or None
+    
+    ref = head[len("ref: "):]
+    ref_path = git_dir / ref
+    if ref_path.is_file():
+        return ref_path.read_text().strip() or None
+    
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    
+    return None
+
+
+@lru_cache(maxsize=4)
+def _git_commit(repo_root: str) -> Optional[str]:
+    """
+    Get the commit hash checked out at repo_root.
+    
+    Reads .git directly and only falls back to `git rev-parse` when that
+    isn't possible.
+    
+    Args:
+        repo_root: Directory inside the git repository
+    
+    Returns:
+        Commit hash or None if not available
+    """
+    try:
+        commit = _read_git_head(Path(repo_root))
+        if commit:
+            return commit
+    except OSError as e:
+        logger.debug(f"Unable to read .git directly: {str(e)}")
+    
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_root,
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        
+        if result.returncode == 0:
+            return result.stdout.strip()
+        
+        return None
+    
+    except Exception as e:
+        logger.debug(f"Unable to get git commit: {str(e)}")
+        return None
+
 
 class BaselineManager:
     """
@@ -63,119 +154,94 @@ class BaselineManager:
         self.config_path = Path(config_path)
         self.pipelines_config_path = Path(pipelines_config_path)
         
-        self.config = {}
-        self.pipelines_config = {}
+        # Collaborators reused across capture_baseline calls
+        self._runner_cache: Dict[Tuple[str, str], PipelineRunner] = {}
+        self._metrics: Optional[MetricsCollector] = None
+        self._validator: Optional[OutputValidator] = None
         
-        # Load configurations
-        self._load_pipelines_config()
-        self._load_config()
+        # Parsed baselines keyed by filename, validated by (mtime_ns, size)
+        self._baseline_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
     
-    def _load_pipelines_config(self) -> bool:
+    @cached_property
+    def pipelines_config(self) -> Dict[str, Any]:
+        """Pipeline configuration from pipelines.yaml, loaded on first access."""
+        return self._load_pipelines_config()
+    
+    @cached_property
+    def config(self) -> Dict[str, Any]:
+        """Baseline configuration from config.yaml, loaded on first access."""
+        return self._load_config()
+    
+    def _load_pipelines_config(self) -> Dict[str, Any]:
         """
         Load pipeline configuration from pipelines.yaml.
         
         Returns:
-            bool: True if loaded successfully
+            Pipelines mapping, or an empty dict if it couldn't be loaded
         """
         try:
             if not self.pipelines_config_path.exists():
                 error_msg = f"Pipelines config not found: {self.pipelines_config_path}"
                 logger.warning(error_msg)
-                return False
+                return {}
             
-            with open(self.pipelines_config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_file(self.pipelines_config_path)
             
             if config and 'pipelines' in config:
-                self.pipelines_config = config['pipelines']
                 logger.info("Pipelines configuration loaded")
-                return True
+                return config['pipelines']
             
             logger.warning("No pipelines found in configuration")
-            return False
+            return {}
         
         except Exception as e:
             logger.warning(f"Error loading pipelines config: {str(e)}")
-            return False
+            return {}
     
-    def _load_config(self) -> bool:
+    def _load_config(self) -> Dict[str, Any]:
         """
         Load baseline configuration from config.yaml.
         
         Returns:
-            bool: True if loaded successfully
+            Baseline settings, or an empty dict if they couldn't be loaded
         """
         try:
             if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f) or {}
-                self.config = config.get('baseline', {})
+                config = load_yaml_file(self.config_path) or {}
                 logger.info("Baseline configuration loaded")
-            else:
-                logger.debug(f"Config file not found: {self.config_path}")
+                return config.get('baseline', {})
             
-            return True
+            logger.debug(f"Config file not found: {self.config_path}")
+            return {}
         
         except Exception as e:
             logger.warning(f"Error loading config: {str(e)}")
-            return False
+            return {}
     
     def _get_git_commit(self) -> Optional[str]:
         """
         Get current git commit hash.
         
+        The result is cached per working directory for the life of the process.
+        
         Returns:
             Commit hash or None if not available
         """
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=".",
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode == 0:
-                return result.stdout.strip()
-            
-            return None
-        
-        except Exception as e:
-            logger.debug(f"Unable to get git commit: {str(e)}")
-            return None
+        return _git_commit(str(Path.cwd()))
     
     def _get_dbt_version(self, project_root: str = ".") -> Optional[str]:
         """
         Get installed dbt version.
         
+        The result is cached per project root for the life of the process.
+        
         Args:
             project_root: Root directory of dbt project
         
         Returns:
             dbt version or None if not available
         """
-        try:
-            result = subprocess.run(
-                ["dbt", "--version"],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if 'dbt version' in line.lower():
-                        parts = line.strip().split()
-                        if len(parts) >= 3:
-                            return parts[2]
-            
-            return None
-        
-        except Exception as e:
-            logger.debug(f"Unable to get dbt version: {str(e)}")
-            return None
+        return get_dbt_version(str(Path(project_root).resolve()))
     
     def _format_timestamp(self, dt: datetime) -> str:
         """
@@ -199,9 +265,15 @@ class BaselineManager:
         Returns:
             Datetime object or None if parsing fails
         """
+        if not _TIMESTAMP_RE.match(timestamp_str):
+            return None
+        
         try:
-            return datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-        except:
+            return datetime(
+                int(timestamp_str[0:4]), int(timestamp_str[4:6]), int(timestamp_str[6:8]),
+                int(timestamp_str[9:11]), int(timestamp_str[11:13]), int(timestamp_str[13:15])
+            )
+        except ValueError:
             return None
     
     def _extract_baseline_metadata(self, filename: str) -> Optional[Tuple[str, str]]:
@@ -216,31 +288,275 @@ class BaselineManager:
         Returns:
             Tuple of (pipeline, timestamp) or None if parsing fails
         """
-        try:
-            if not filename.startswith("baseline_") or not filename.endswith(".json"):
-                return None
-            
-            # Remove prefix and suffix
-            name_without_prefix = filename[len("baseline_"):-len(".json")]
-            
-            # Split by underscore, last part is timestamp (YYYYMMDD_HHMMSS has one underscore)
-            parts = name_without_prefix.rsplit("_", 2)
-            
-            if len(parts) != 3:
-                return None
-            
-            pipeline = parts[0]
-            timestamp = f"{parts[1]}_{parts[2]}"
-            
-            # Validate timestamp format
-            if not self._parse_timestamp(timestamp):
-                return None
-            
-            return (pipeline, timestamp)
+        match = _BASELINE_RE.match(filename)
+        if match is None:
+            return None
         
+        return match.group(1), match.group(2)
+
+    def _scan_baselines(self, pipeline: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        """
+        Scan the storage directory for baseline files.
+        
+        Filenames embed a fixed-width timestamp, so sorting by name orders
+        each pipeline's baselines oldest to newest without reading them.
+        
+        Args:
+            pipeline: Optional pipeline identifier to restrict the scan to
+        
+        Returns:
+            Sorted list of (pipeline, timestamp, filename) tuples
+        """
+        prefix = f"baseline_{pipeline}_" if pipeline else "baseline_"
+        baselines = []
+        
+        for filename in self.storage.list_filenames(prefix):
+            match = _BASELINE_RE.match(filename)
+            # A prefix of baseline_A_ also matches pipelines such as A_B
+            if match and (pipeline is None or match.group(1) == pipeline):
+                baselines.append((match.group(1), match.group(2), filename))
+        
+        return baselines
+
+    def _build_summary(self, filename: str, pipeline: str, timestamp: str,
+                       baseline_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the summary record for a baseline.
+
+        Args:
+            filename: Baseline filename
+            pipeline: Pipeline identifier
+            timestamp: Timestamp in format YYYYMMDD_HHMMSS
+            baseline_data: Full baseline data
+
+        Returns:
+            Summary dictionary as returned by list_baselines
+        """
+        execution_context = baseline_data.get("execution_context", {})
+        return {
+            "filename": filename,
+            "pipeline": pipeline,
+            "timestamp": timestamp,
+            "captured_at": baseline_data.get("captured_at"),
+            "status": baseline_data.get("summary", {}).get("status", "UNKNOWN"),
+            "execution_time": execution_context.get("duration_seconds"),
+            "dbt_version": execution_context.get("dbt_version"),
+            "git_commit": execution_context.get("git_commit"),
+            "models_executed": len(execution_context.get("models_executed", []))
+        }
+
+    def _load_summary(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Build a summary by loading the full baseline file.
+
+        Args:
+            filename: Baseline filename
+
+        Returns:
+            Summary dictionary or None if the file cannot be summarized
+        """
+        metadata = self._extract_baseline_metadata(filename)
+        if not metadata:
+            logger.debug("Could not parse metadata from %s", filename)
+            return None
+
+        try:
+            pipeline, timestamp = metadata
+            baseline_data = self.storage.load_json(filename)
+            return self._build_summary(filename, pipeline, timestamp, baseline_data)
         except Exception as e:
-            logger.debug(f"Error parsing baseline metadata from {filename}: {str(e)}")
+            # Callers report failures in aggregate
+            logger.debug("Error processing baseline %s: %s", filename, e)
             return None
+
+    def _load_summaries(self, filenames: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Summarize several baseline files, reading them concurrently.
+
+        File reads release the GIL, so a small thread pool overlaps the I/O
+        latency of each open/read instead of paying it serially.
+
+        Args:
+            filenames: Baseline filenames to summarize
+
+        Returns:
+            Summaries in the same order as filenames (None for failures)
+        """
+        if len(filenames) <= 1:
+            return [self._load_summary(filename) for filename in filenames]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(filenames))) as executor:
+            return list(executor.map(self._load_summary, filenames))
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the baseline summary index, rebuilding it if it is stale.
+
+        The index is reconciled against the baseline files on disk: records
+        for files that no longer exist are dropped and files without a record
+        are summarized and added, so baselines created or removed outside this
+        manager are still reflected.
+
+        Returns:
+            Dictionary mapping filename to summary record
+        """
+        records = {}
+        index_exists = self.storage.file_exists(INDEX_FILENAME)
+        if index_exists:
+            try:
+                for record in self.storage.load_jsonl(INDEX_FILENAME):
+                    # Later records win, so a forced overwrite supersedes the original
+                    records[record["filename"]] = record
+            except Exception as e:
+                logger.warning(f"Error reading baseline index, rebuilding: {str(e)}")
+                records = {}
+                index_exists = False
+
+        on_disk = {filename for _, _, filename in self._scan_baselines()}
+
+        stale = records.keys() - on_disk
+        missing = on_disk - records.keys()
+
+        if not stale and not missing and index_exists:
+            return records
+
+        for filename in stale:
+            del records[filename]
+
+        failed = 0
+        for summary in self._load_summaries(sorted(missing)):
+            if summary:
+                records[summary["filename"]] = summary
+            else:
+                failed += 1
+        
+        if failed:
+            logger.warning("Skipped %d baseline files that could not be summarized", failed)
+
+        try:
+            self.storage.save_jsonl(list(records.values()), INDEX_FILENAME)
+            logger.debug("Rebuilt baseline index with %d entries", len(records))
+        except Exception as e:
+            logger.warning(f"Could not write baseline index: {str(e)}")
+
+        return records
+
+    def _append_to_index(self, summary: Dict[str, Any]) -> None:
+        """
+        Append a summary record to the baseline index.
+
+        Args:
+            summary: Summary record for a newly saved baseline
+        """
+        try:
+            self.storage.append_jsonl(summary, INDEX_FILENAME)
+        except Exception as e:
+            # The index self-heals on the next list_baselines call
+            logger.warning(f"Could not update baseline index: {str(e)}")
+
+    def _remove_from_index(self, filenames: Set[str]) -> None:
+        """
+        Remove baseline records from the index in a single rewrite.
+
+        Args:
+            filenames: Baseline filenames that were deleted
+        """
+        if not filenames:
+            return
+        try:
+            if not self.storage.file_exists(INDEX_FILENAME):
+                return
+            records = [
+                record for record in self.storage.load_jsonl(INDEX_FILENAME)
+                if record.get("filename") not in filenames
+            ]
+            self.storage.save_jsonl(records, INDEX_FILENAME)
+        except Exception as e:
+            logger.warning(f"Could not update baseline index: {str(e)}")
+
+    def _get_runner(self, pipeline_id: str, project_root: str) -> Optional[PipelineRunner]:
+        """
+        Get a configured PipelineRunner, reusing one from a previous capture.
+        
+        Args:
+            pipeline_id: Pipeline identifier (A, B, C)
+            project_root: Root directory of dbt project
+        
+        Returns:
+            Runner with cleared execution state, or None if its config failed to load
+        """
+        key = (pipeline_id.upper(), project_root)
+        runner = self._runner_cache.get(key)
+        
+        if runner is None:
+            runner = PipelineRunner(pipeline_id, project_root=project_root)
+            if not runner.load_config():
+                return None
+            self._runner_cache[key] = runner
+        else:
+            runner.reset_execution_state()
+        
+        return runner
+    
+    def _get_metrics_collector(self) -> MetricsCollector:
+        """
+        Get the shared MetricsCollector, connecting on first use.
+        
+        Returns:
+            MetricsCollector instance
+        """
+        if self._metrics is None:
+            self._metrics = MetricsCollector()
+        return self._metrics
+    
+    def _get_output_validator(self) -> OutputValidator:
+        """
+        Get the shared OutputValidator, connecting on first use.
+        
+        Returns:
+            OutputValidator instance
+        """
+        if self._validator is None:
+            self._validator = OutputValidator()
+        return self._validator
+    
+    def prepare(self, pipeline_id: str, project_root: str = ".") -> bool:
+        """
+        Load everything a capture of this pipeline needs ahead of time.
+        
+        Parses the pipeline configuration into a cached runner and resolves
+        the dbt version and git commit, so a following capture_baseline call
+        reuses them instead of reading them in the middle of a benchmark.
+        
+        Args:
+            pipeline_id: Pipeline identifier (A, B, C)
+            project_root: Root directory of dbt project
+        
+        Returns:
+            bool: True if the pipeline configuration loaded successfully
+        """
+        # Reading the cached properties parses the YAML files now
+        self.config
+        self.pipelines_config
+        self._get_dbt_version(project_root)
+        self._get_git_commit()
+        return self._get_runner(pipeline_id, project_root) is not None
+    
+    def close(self) -> None:
+        """
+        Close Snowflake connections held by reused collaborators.
+        
+        The manager stays usable; connections are reopened on the next capture.
+        """
+        if self._metrics is not None:
+            self._metrics.close()
+            self._metrics = None
+        
+        if self._validator is not None:
+            self._validator.close()
+            self._validator = None
+        
+        self._runner_cache.clear()
     
     def capture_baseline(self, pipeline_id: str, 
                         project_root: str = ".",
@@ -294,8 +610,8 @@ class BaselineManager:
             baseline_data["execution_context"]["start_time"] = self._format_timestamp(execution_start)
             
             # Run dbt pipeline
-            runner = PipelineRunner(pipeline_id, project_root=project_root)
-            if not runner.load_config():
+            runner = self._get_runner(pipeline_id, project_root)
+            if runner is None:
                 error_msg = "Failed to load pipeline configuration"
                 baseline_data["summary"]["errors"].append(error_msg)
                 logger.error(error_msg)
@@ -303,7 +619,7 @@ class BaselineManager:
             
             # Resolve dependencies and execute
             execution_order = runner.resolve_dependencies()
-            logger.info(f"Execution order: {execution_order}")
+            logger.info("Execution order: %s", execution_order)
             
             for pipeline in execution_order:
                 success, models, stderr = runner.execute_dbt(pipeline, capture_models=True)
@@ -325,7 +641,7 @@ class BaselineManager:
             if metrics_enabled:
                 logger.info("Collecting metrics from Snowflake")
                 try:
-                    metrics_collector = MetricsCollector()
+                    metrics_collector = self._get_metrics_collector()
                     # Note: In a real implementation, we would extract query IDs from execution
                     # For now, we store the collector reference for potential future use
                     baseline_data["metrics"]["collection_enabled"] = True
@@ -338,7 +654,7 @@ class BaselineManager:
             if validation_enabled:
                 logger.info("Validating pipeline outputs")
                 try:
-                    validator = OutputValidator()
+                    validator = self._get_output_validator()
                     
                     # Validate models in the target pipeline schema
                     pipeline_config = self.pipelines_config.get(pipeline_id.upper(), {})
@@ -390,15 +706,19 @@ class BaselineManager:
             timestamp = baseline_data.get("captured_at", self._format_timestamp(datetime.now()))
             
             filename = f"baseline_{pipeline}_{timestamp}.json"
+            self._invalidate_cached(filename)
             
-            # Check if file already exists
-            if self.storage.file_exists(filename) and not force:
+            # Save the file; without force the existence check is atomic with the create
+            try:
+                self.storage.save_json(baseline_data, filename, overwrite=force)
+            except FileExistsError:
                 error_msg = f"Baseline already exists: {filename}. Use force=True to overwrite."
                 logger.warning(error_msg)
                 return False, error_msg
             
-            # Save the file
-            self.storage.save_json(baseline_data, filename)
+            self._append_to_index(
+                self._build_summary(filename, pipeline, timestamp, baseline_data)
+            )
             logger.info(f"Baseline saved successfully: {filename}")
             return True, filename
         
@@ -407,6 +727,92 @@ class BaselineManager:
             logger.error(error_msg)
             return False, error_msg
     
+    def capture_and_save_baseline(self, pipeline_id: str,
+                                  project_root: str = ".",
+                                  metrics_enabled: bool = True,
+                                  validation_enabled: bool = True,
+                                  force: bool = False) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Capture a baseline and save it, keeping only its summary in memory.
+        
+        The full baseline document is serialized straight to disk and released,
+        so callers that only report on the capture never hold it.
+        
+        Args:
+            pipeline_id: Pipeline identifier (A, B, C)
+            project_root: Root directory of dbt project
+            metrics_enabled: Whether to collect metrics (default: True)
+            validation_enabled: Whether to validate outputs (default: True)
+            force: If False, prevent overwriting existing baselines
+        
+        Returns:
+            Tuple of (success, filename_or_error, summary). On success summary is
+            the index record for the saved baseline (as returned by list_baselines);
+            if the capture failed it is the capture's status and errors.
+        """
+        baseline_data = self.capture_baseline(
+            pipeline_id,
+            project_root=project_root,
+            metrics_enabled=metrics_enabled,
+            validation_enabled=validation_enabled
+        )
+        
+        capture_summary = baseline_data["summary"]
+        if capture_summary["status"] != "SUCCESS":
+            return False, "Baseline capture failed", capture_summary
+        
+        success, result = self.save_baseline(baseline_data, force=force)
+        if not success:
+            return False, result, {}
+        
+        summary = self._build_summary(
+            result, baseline_data["pipeline"], baseline_data["captured_at"], baseline_data
+        )
+        return True, result, summary
+    
+    def _load_cached(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a baseline file through the in-memory cache.
+        
+        A cached document is reused while the file's mtime and size are
+        unchanged, so a hit costs one stat instead of a read and parse.
+        Callers share the cached dict and must not mutate it.
+        
+        Args:
+            filename: Baseline filename
+        
+        Returns:
+            Baseline data dict or None if the file doesn't exist
+        """
+        try:
+            stat = self.storage.get_full_path(filename).stat()
+        except FileNotFoundError:
+            self._invalidate_cached(filename)
+            return None
+        
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._baseline_cache.get(filename)
+        if cached is not None and cached[0] == version:
+            self._baseline_cache.move_to_end(filename)
+            return cached[1]
+        
+        baseline_data = self.storage.load_json(filename)
+        self._baseline_cache[filename] = (version, baseline_data)
+        self._baseline_cache.move_to_end(filename)
+        if len(self._baseline_cache) > BASELINE_CACHE_SIZE:
+            self._baseline_cache.popitem(last=False)
+        
+        return baseline_data
+    
+    def _invalidate_cached(self, filename: str) -> None:
+        """
+        Drop a baseline from the load cache after it is written or deleted.
+        
+        Args:
+            filename: Baseline filename
+        """
+        self._baseline_cache.pop(filename, None)
+    
     def load_baseline(self, pipeline_id: str, 
                      timestamp: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
@@ -427,25 +833,22 @@ class BaselineManager:
             # If timestamp provided, load specific baseline
             if timestamp:
                 filename = f"baseline_{pipeline}_{timestamp}.json"
-                if self.storage.file_exists(filename):
-                    return self.storage.load_json(filename)
-                else:
+                baseline_data = self._load_cached(filename)
+                if baseline_data is None:
                     logger.warning(f"Baseline not found: {filename}")
-                    return None
+                return baseline_data
             
             # Otherwise, find and load most recent baseline for pipeline
-            pattern = f"baseline_{pipeline}_*.json"
-            files = self.storage.list_files(pattern)
+            baselines = self._scan_baselines(pipeline)
             
-            if not files:
+            if not baselines:
                 logger.info(f"No baselines found for pipeline {pipeline}")
                 return None
             
-            # Files are already sorted by list_files, last one is most recent
-            most_recent = files[-1]
-            filename = self.storage.get_relative_path(most_recent)
+            # Sorted by filename, so the last one is most recent
+            _, _, filename = baselines[-1]
             
-            return self.storage.load_json(filename)
+            return self._load_cached(filename)
         
         except Exception as e:
             logger.error(f"Error loading baseline: {str(e)}")
@@ -462,46 +865,15 @@ class BaselineManager:
             List of baseline summaries sorted by timestamp (newest first)
         """
         try:
+            records = self._read_index().values()
+
             if pipeline_id:
-                pattern = f"baseline_{pipeline_id.upper()}_*.json"
+                pipeline = pipeline_id.upper()
+                summaries = [r for r in records if r["pipeline"] == pipeline]
             else:
-                pattern = "baseline_*.json"
-            
-            files = self.storage.list_files(pattern)
-            
-            summaries = []
-            for file_path in reversed(files):  # Reverse for newest first
-                try:
-                    filename = file_path.name
-                    metadata = self._extract_baseline_metadata(filename)
-                    
-                    if not metadata:
-                        logger.debug(f"Could not parse metadata from {filename}")
-                        continue
-                    
-                    pipeline, timestamp = metadata
-                    
-                    # Load full baseline to get execution time and status
-                    baseline_data = self.storage.load_json(self.storage.get_relative_path(file_path))
-                    
-                    summary = {
-                        "filename": filename,
-                        "pipeline": pipeline,
-                        "timestamp": timestamp,
-                        "captured_at": baseline_data.get("captured_at"),
-                        "status": baseline_data.get("summary", {}).get("status", "UNKNOWN"),
-                        "execution_time": baseline_data.get("execution_context", {}).get("duration_seconds"),
-                        "dbt_version": baseline_data.get("execution_context", {}).get("dbt_version"),
-                        "git_commit": baseline_data.get("execution_context", {}).get("git_commit"),
-                        "models_executed": len(baseline_data.get("execution_context", {}).get("models_executed", []))
-                    }
-                    
-                    summaries.append(summary)
-                
-                except Exception as e:
-                    logger.warning(f"Error processing baseline {file_path}: {str(e)}")
-                    continue
-            
+                summaries = list(records)
+
+            summaries.sort(key=itemgetter("timestamp", "filename"), reverse=True)
             return summaries
         
         except Exception as e:
@@ -543,6 +915,8 @@ class BaselineManager:
                 return False, error_msg
             
             self.storage.delete_file(filename)
+            self._invalidate_cached(filename)
+            self._remove_from_index({filename})
             msg = f"Baseline deleted successfully: {filename}"
             logger.info(msg)
             return True, msg
@@ -552,6 +926,29 @@ class BaselineManager:
             logger.error(error_msg)
             return False, error_msg
     
+    def _delete_by_filename(self, filename: str) -> bool:
+        """
+        Delete a baseline file the caller already knows exists.
+        
+        Skips the confirm gate and existence check of delete_baseline; used by
+        cleanup, which takes filenames straight from list_baselines. The index
+        is left to the caller, so a batch of deletions rewrites it once.
+        
+        Args:
+            filename: Baseline filename
+        
+        Returns:
+            bool: True if deleted successfully
+        """
+        try:
+            self.storage.delete_file(filename)
+        except Exception as e:
+            logger.warning(f"Error deleting baseline {filename}: {str(e)}")
+            return False
+        
+        self._invalidate_cached(filename)
+        return True
+    
     def cleanup_old_baselines(self, pipeline_id: Optional[str] = None,
                              max_age_days: Optional[int] = None,
                              max_count: Optional[int] = None,
@@ -576,59 +973,34 @@ class BaselineManager:
             if max_count is None:
                 max_count = baseline_config.get("max_count", 10)
             
+            # Newest first, so anything past max_count is the oldest remainder
             summaries = self.list_baselines(pipeline_id)
-            deleted_files = []
-            deleted_count = 0
+            to_delete = set()
             
-            # Delete old baselines based on age
+            # Select old baselines based on age
             if max_age_days:
                 cutoff_date = datetime.now().timestamp() - (max_age_days * 86400)
                 
                 for summary in summaries:
-                    try:
-                        timestamp = self._parse_timestamp(summary["timestamp"])
-                        if timestamp and timestamp.timestamp() < cutoff_date:
-                            filename = summary["filename"]
-                            
-                            if dry_run:
-                                logger.info(f"[DRY RUN] Would delete: {filename}")
-                                deleted_files.append(filename)
-                            else:
-                                success, msg = self.delete_baseline(
-                                    summary["pipeline"],
-                                    summary["timestamp"],
-                                    confirm=True
-                                )
-                                if success:
-                                    deleted_files.append(filename)
-                                    deleted_count += 1
-                    
-                    except Exception as e:
-                        logger.warning(f"Error processing baseline {summary.get('filename')}: {str(e)}")
-            
-            # Delete extras if over max_count
-            if max_count and len(summaries) > max_count:
-                # Keep only the most recent max_count baselines
-                for summary in summaries[max_count:]:
-                    filename = summary["filename"]
-                    
-                    if dry_run:
-                        logger.info(f"[DRY RUN] Would delete: {filename}")
-                        deleted_files.append(filename)
-                    else:
-                        success, msg = self.delete_baseline(
-                            summary["pipeline"],
-                            summary["timestamp"],
-                            confirm=True
-                        )
-                        if success:
-                            deleted_files.append(filename)
-                            deleted_count += 1
-            
-            msg = f"Cleanup complete: {deleted_count} baselines deleted"
+                    timestamp = self._parse_timestamp(summary["timestamp"])
+                    if timestamp and timestamp.timestamp() < cutoff_date:
+                        to_delete.add(summary["filename"])
+            
+            # Select extras if the survivors are over max_count
+            if max_count:
+                survivors = [s for s in summaries if s["filename"] not in to_delete]
+                to_delete.update(s["filename"] for s in survivors[max_count:])
+            
+            deleted_files = [s["filename"] for s in summaries if s["filename"] in to_delete]
+            
             if dry_run:
-                msg = f"[DRY RUN] " + msg
-            logger.info(msg)
+                logger.info(f"[DRY RUN] Cleanup complete: would delete {len(deleted_files)} baselines: {deleted_files}")
+                return 0, deleted_files
+            
+            deleted_files = [f for f in deleted_files if self._delete_by_filename(f)]
+            self._remove_from_index(set(deleted_files))
+            deleted_count = len(deleted_files)
+            logger.info(f"Cleanup complete: {deleted_count} baselines deleted")
             
             return deleted_count, deleted_files
         
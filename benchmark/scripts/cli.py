@@ -11,14 +11,56 @@ Provides user-friendly commands for all benchmarking operations:
 import argparse
 import sys
 import logging
-from pathlib import Path
-from typing import Optional, List
-from datetime import datetime
-import json
+import traceback
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterator, Optional, List, Tuple
 
-from baseline_manager import BaselineManager
-from comparison_engine import ComparisonEngine
-from report_generator import ReportGenerator
+# BaselineManager, ComparisonEngine and ReportGenerator pull in the Snowflake
+# connector and other heavy modules, so commands import them on demand.
+
+
+@lru_cache(maxsize=1)
+def _get_baseline_manager():
+    """Create the BaselineManager shared by commands run in this process."""
+    from .baseline_manager import BaselineManager
+    return BaselineManager()
+
+
+@lru_cache(maxsize=1)
+def _get_comparison_engine():
+    """Create the ComparisonEngine shared by commands run in this process."""
+    from .comparison_engine import ComparisonEngine
+    return ComparisonEngine()
+
+
+# Program name shown in usage and help text
+_PROG = "python -m benchmark"
+
+# Fields shown by _format_baseline_summary as (label, key, default, format).
+# A default of None marks an optional field that is omitted when empty; the
+# status line sits between the two groups.
+_SUMMARY_HEAD_FIELDS = (
+    ('Pipeline', 'pipeline', 'unknown', None),
+    ('Timestamp', 'captured_at', 'unknown', None),
+)
+_SUMMARY_FIELDS = (
+    ('Duration', 'execution_time', None, '{:.2f}s'),
+    ('Models', 'models_executed', 0, None),
+    ('dbt', 'dbt_version', None, None),
+    ('Git', 'git_commit', None, '{:.8}...'),
+    ('Filename', 'filename', None, None),
+)
+
+# Violation summary line, with its labels in display order
+_VIOL_FMT = "  %-8s %3d violations"
+_VIOL_LABELS = (("Info:", 'INFO'), ("Warning:", 'WARNING'), ("Error:", 'ERROR'))
+
+# Pipelines the CLI accepts
+_VALID_PIPELINES = frozenset(('A', 'B', 'C'))
+
+# Section separator used in listings
+_SEP80 = "-" * 80
 
 
 # Color codes for terminal output
@@ -37,6 +79,33 @@ class Colors:
     MAGENTA = '\033[35m'
     CYAN = '\033[36m'
     WHITE = '\033[37m'
+    
+    # Combined sequences
+    HEADER = CYAN + BOLD
+
+
+def _plain(text: str) -> str:
+    """Return text unstyled; used for every style when color is disabled."""
+    return text
+
+
+@lru_cache(maxsize=16)
+def _rule(width: int) -> str:
+    """Return the header underline for a title of the given width."""
+    return '=' * width
+
+
+def _plain_header(text: str) -> str:
+    """Format an underlined header without color."""
+    return f"\n{text}\n{_rule(len(text))}"
+
+
+def _format_violation_counts(violation_counts: dict) -> str:
+    """Format the per-severity violation count lines of a results summary."""
+    return "\n".join(
+        _VIOL_FMT % (label, violation_counts[severity])
+        for label, severity in _VIOL_LABELS
+    )
 
 
 class OutputFormatter:
@@ -50,59 +119,85 @@ class OutputFormatter:
             use_color: Whether to use colored output
         """
         self.use_color = use_color
+        
+        # Resolve escape sequences once
+        if use_color:
+            self._success = Colors.GREEN
+            self._error = Colors.RED
+            self._warning = Colors.YELLOW
+            self._info = Colors.BLUE
+            self._header = Colors.HEADER
+            self._bold = Colors.BOLD
+            self._dim = Colors.DIM
+            self._reset = Colors.RESET
+        else:
+            # Plain output: bind the style methods straight to pass-throughs
+            self.success = self.error = self.warning = self.info = _plain
+            self.subheader = self.dim = _plain
+            self.header = _plain_header
     
-    def _colorize(self, text: str, color: str) -> str:
-        """Apply color to text if color is enabled."""
-        if not self.use_color:
-            return text
-        return f"{color}{text}{Colors.RESET}"
+    def _colorize(self, text: str, prefix: str) -> str:
+        """Wrap text in an escape prefix and the reset suffix (color enabled only)."""
+        return f"{prefix}{text}{self._reset}"
     
     def success(self, text: str) -> str:
         """Format success message in green."""
-        return self._colorize(text, Colors.GREEN)
+        return self._colorize(text, self._success)
     
     def error(self, text: str) -> str:
         """Format error message in red."""
-        return self._colorize(text, Colors.RED)
+        return self._colorize(text, self._error)
     
     def warning(self, text: str) -> str:
         """Format warning message in yellow."""
-        return self._colorize(text, Colors.YELLOW)
+        return self._colorize(text, self._warning)
     
     def info(self, text: str) -> str:
         """Format info message in blue."""
-        return self._colorize(text, Colors.BLUE)
+        return self._colorize(text, self._info)
     
     def header(self, text: str) -> str:
         """Format header in bold cyan."""
-        return self._colorize(f"\n{text}\n{'=' * len(text)}", Colors.CYAN + Colors.BOLD)
+        return self._colorize(f"\n{text}\n{_rule(len(text))}", self._header)
     
     def subheader(self, text: str) -> str:
         """Format subheader in bold."""
-        return self._colorize(f"{text}", Colors.BOLD)
+        return self._colorize(text, self._bold)
     
     def dim(self, text: str) -> str:
         """Format text in dim color."""
-        return self._colorize(text, Colors.DIM)
+        return self._colorize(text, self._dim)
 
 
 class ProgressIndicator:
     """Simple progress indicator for long-running operations."""
     
+    __slots__ = ('use_color', 'formatter', 'logger', '_enabled')
+    
     def __init__(self, use_color: bool = True):
         """Initialize ProgressIndicator."""
         self.use_color = use_color
         self.formatter = OutputFormatter(use_color)
+        self.logger = logging.getLogger(__name__)
+        
+        # Styled progress lines only render on an interactive, colored terminal
+        self._enabled = use_color and sys.stdout.isatty()
     
     def step(self, step_num: int, total: int, message: str) -> None:
-        """Print a progress step."""
-        progress = f"[{step_num}/{total}]"
+        """Print a progress step, or log it when output isn't an interactive terminal."""
+        if not self._enabled:
+            self.logger.info("[%d/%d] %s", step_num, total, message)
+            return
+        
+        progress = "[%d/%d]" % (step_num, total)
         print(f"{self.formatter.dim(progress)} {message}")
 
 
 class BenchmarkCLI:
     """Main CLI class for benchmark operations."""
     
+    __slots__ = ('use_color', 'verbose', 'formatter', 'progress', 'logger', '_status_cache')
+    
     def __init__(self, use_color: bool = True, verbose: bool = False):
         """
         Initialize BenchmarkCLI.
@@ -115,16 +210,16 @@ class BenchmarkCLI:
         self.verbose = verbose
         self.formatter = OutputFormatter(use_color)
         self.progress = ProgressIndicator(use_color)
-        
-        # Configure logging
-        log_level = logging.DEBUG if verbose else logging.INFO
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
         self.logger = logging.getLogger(__name__)
+        
+        # Only three statuses exist, so render each once up front
+        self._status_cache = {
+            'PASS': self.formatter.success("✓ PASS"),
+            'WARNING': self.formatter.warning("⚠ WARNING"),
+            'ERROR': self.formatter.error("✗ ERROR"),
+        }
     
-    def _validate_pipeline(self, pipeline: str) -> bool:
+    def _validate_pipeline(self, pipeline: str) -> Tuple[bool, str]:
         """
         Validate that pipeline is A, B, or C.
         
@@ -132,13 +227,14 @@ class BenchmarkCLI:
             pipeline: Pipeline identifier
         
         Returns:
-            bool: True if valid, False otherwise
+            Tuple of (valid: bool, normalized upper-case pipeline: str)
         """
-        if pipeline.upper() not in ['A', 'B', 'C']:
+        normalized = pipeline.upper()
+        if normalized not in _VALID_PIPELINES:
             print(self.formatter.error(f"Error: Invalid pipeline '{pipeline}'"))
             print(f"Valid pipelines are: A, B, C")
-            return False
-        return True
+            return False, normalized
+        return True, normalized
     
     def _format_baseline_summary(self, summary: dict) -> str:
         """
@@ -150,35 +246,30 @@ class BenchmarkCLI:
         Returns:
             Formatted string for display
         """
-        lines = []
-        
-        # Basic info
-        lines.append(f"  Pipeline:  {summary.get('pipeline', 'unknown')}")
-        lines.append(f"  Timestamp: {summary.get('captured_at', 'unknown')}")
-        lines.append(f"  Status:    {self.formatter.success(summary.get('status', 'unknown')) if summary.get('status') == 'SUCCESS' else self.formatter.error(summary.get('status', 'unknown'))}")
-        
-        # Execution details
-        exec_time = summary.get('execution_time')
-        if exec_time:
-            lines.append(f"  Duration:  {exec_time:.2f}s")
-        
-        models_count = summary.get('models_executed', 0)
-        lines.append(f"  Models:    {models_count}")
+        return "\n".join(self._iter_summary_lines(summary))
+    
+    def _iter_summary_lines(self, summary: dict) -> Iterator[str]:
+        """
+        Yield the display lines of a baseline summary, skipping empty optional fields.
         
-        # Optional metadata
-        dbt_version = summary.get('dbt_version')
-        if dbt_version:
-            lines.append(f"  dbt:       {dbt_version}")
+        Args:
+            summary: Baseline summary dictionary
         
-        git_commit = summary.get('git_commit')
-        if git_commit:
-            lines.append(f"  Git:       {git_commit[:8]}...")
+        Yields:
+            One formatted line per shown field
+        """
+        get = summary.get
+        for label, key, default, fmt in _SUMMARY_HEAD_FIELDS:
+            value = get(key, default)
+            yield f"  {label + ':':<11}{fmt.format(value) if fmt else value}"
         
-        filename = summary.get('filename')
-        if filename:
-            lines.append(f"  Filename:  {filename}")
+        status = get('status', 'unknown')
+        yield f"  Status:    {self.formatter.success(status) if status == 'SUCCESS' else self.formatter.error(status)}"
         
-        return "\n".join(lines)
+        for label, key, default, fmt in _SUMMARY_FIELDS:
+            value = get(key, default)
+            if value or default is not None:
+                yield f"  {label + ':':<11}{fmt.format(value) if fmt else value}"
     
     def capture_baseline_command(self, pipeline: str, output_dir: Optional[str] = None) -> int:
         """
@@ -192,65 +283,56 @@ class BenchmarkCLI:
             Exit code (0 for success, 1 for failure)
         """
         # Validate pipeline
-        if not self._validate_pipeline(pipeline):
+        ok, pipeline = self._validate_pipeline(pipeline)
+        if not ok:
             return 1
         
-        pipeline = pipeline.upper()
-        
         print(self.formatter.header(f"Capturing Baseline for Pipeline {pipeline}"))
         
         try:
             # Initialize baseline manager
-            self.progress.step(1, 4, "Initializing baseline manager...")
-            manager = BaselineManager()
+            self.progress.step(1, 3, "Initializing baseline manager...")
+            manager = _get_baseline_manager()
             
-            # Capture baseline
-            self.progress.step(2, 4, f"Running pipeline {pipeline}...")
-            baseline_data = manager.capture_baseline(
+            # Capture and save baseline
+            self.progress.step(2, 3, f"Running pipeline {pipeline}...")
+            success, result, summary = manager.capture_and_save_baseline(
                 pipeline,
                 project_root=".",
                 metrics_enabled=True,
-                validation_enabled=True
+                validation_enabled=True,
+                force=False
             )
-            
-            # Check if capture was successful
-            if baseline_data.get('summary', {}).get('status') != 'SUCCESS':
-                errors = baseline_data.get('summary', {}).get('errors', [])
-                print(self.formatter.error("❌ Failed to capture baseline"))
-                for error in errors:
-                    print(f"  - {error}")
-                return 1
-            
-            # Save baseline
-            self.progress.step(3, 4, "Saving baseline...")
-            success, result = manager.save_baseline(baseline_data, force=False)
+            manager.close()
             
             if not success:
-                print(self.formatter.error(f"❌ Failed to save baseline: {result}"))
+                if 'errors' in summary:
+                    print(self.formatter.error("❌ Failed to capture baseline"))
+                    for error in summary['errors']:
+                        print(f"  - {error}")
+                else:
+                    print(self.formatter.error(f"❌ Failed to save baseline: {result}"))
                 return 1
             
             # Display results
-            self.progress.step(4, 4, "Baseline captured successfully")
+            self.progress.step(3, 3, "Baseline captured successfully")
             print()
             print(self.formatter.success("✓ Baseline captured successfully"))
             print(f"  Filename: {result}")
             print(f"  Pipeline: {pipeline}")
             
             # Show execution details
-            exec_context = baseline_data.get('execution_context', {})
-            if exec_context.get('duration_seconds'):
-                print(f"  Duration: {exec_context['duration_seconds']:.2f}s")
+            if summary.get('execution_time'):
+                print(f"  Duration: {summary['execution_time']:.2f}s")
             
-            models_executed = exec_context.get('models_executed', [])
-            print(f"  Models:   {len(models_executed)}")
+            print(f"  Models:   {summary['models_executed']}")
             
             return 0
         
         except Exception as e:
             print(self.formatter.error(f"❌ Error capturing baseline: {str(e)}"))
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                sys.stderr.write(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
             return 1
     
     def run_benchmark_command(self, pipeline: str, output_dir: Optional[str] = None) -> int:
@@ -265,18 +347,18 @@ class BenchmarkCLI:
             Exit code (0 for pass, 1 for warning, 2 for error)
         """
         # Validate pipeline
-        if not self._validate_pipeline(pipeline):
+        ok, pipeline = self._validate_pipeline(pipeline)
+        if not ok:
             return 1
         
-        pipeline = pipeline.upper()
-        
         print(self.formatter.header(f"Running Benchmark for Pipeline {pipeline}"))
         
         try:
             # Initialize managers
             self.progress.step(1, 5, "Initializing managers...")
-            baseline_manager = BaselineManager()
-            comparison_engine = ComparisonEngine()
+            baseline_manager = _get_baseline_manager()
+            comparison_engine = _get_comparison_engine()
+            baseline_manager.prepare(pipeline, project_root=".")
             
             # Load latest baseline
             self.progress.step(2, 5, f"Loading baseline for pipeline {pipeline}...")
@@ -298,9 +380,11 @@ class BenchmarkCLI:
                 metrics_enabled=True,
                 validation_enabled=True
             )
+            baseline_manager.close()
             
-            if candidate_data.get('summary', {}).get('status') != 'SUCCESS':
-                errors = candidate_data.get('summary', {}).get('errors', [])
+            candidate_summary = candidate_data.get('summary') or {}
+            if candidate_summary.get('status') != 'SUCCESS':
+                errors = candidate_summary.get('errors', [])
                 print(self.formatter.error("❌ Failed to run pipeline"))
                 for error in errors:
                     print(f"  - {error}")
@@ -317,10 +401,11 @@ class BenchmarkCLI:
             # Generate report
             self.progress.step(5, 5, "Generating report...")
             report_output_dir = output_dir or "benchmark/results"
+            from .report_generator import ReportGenerator
             report_generator = ReportGenerator(pipeline, output_directory=report_output_dir)
             
             # Add metadata and results to report
-            exec_context = candidate_data.get('execution_context', {})
+            exec_context = candidate_data.get('execution_context') or {}
             report_generator.add_metadata(
                 git_commit=exec_context.get('git_commit'),
                 dbt_version=exec_context.get('dbt_version')
@@ -348,9 +433,7 @@ class BenchmarkCLI:
             # Show violation summary
             print()
             print(self.formatter.subheader("Violation Summary"))
-            print(f"  Info:    {violation_counts['INFO']:>3} violations")
-            print(f"  Warning: {violation_counts['WARNING']:>3} violations")
-            print(f"  Error:   {violation_counts['ERROR']:>3} violations")
+            print(_format_violation_counts(violation_counts))
             
             if exit_code == 0:
                 print()
@@ -370,8 +453,7 @@ class BenchmarkCLI:
         except Exception as e:
             print(self.formatter.error(f"❌ Error running benchmark: {str(e)}"))
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                sys.stderr.write(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
             return 2
     
     def list_baselines_command(self, pipeline: Optional[str] = None) -> int:
@@ -384,15 +466,17 @@ class BenchmarkCLI:
         Returns:
             Exit code (0 for success, 1 for failure)
         """
-        if pipeline and not self._validate_pipeline(pipeline):
-            return 1
-        
-        pipeline = pipeline.upper() if pipeline else None
+        if pipeline:
+            ok, pipeline = self._validate_pipeline(pipeline)
+            if not ok:
+                return 1
+        else:
+            pipeline = None
         
         print(self.formatter.header("Available Baselines"))
         
         try:
-            manager = BaselineManager()
+            manager = _get_baseline_manager()
             baselines = manager.list_baselines(pipeline)
             
             if not baselines:
@@ -403,40 +487,43 @@ class BenchmarkCLI:
                     print(f"  Run 'capture-baseline --pipeline <A|B|C>' to create one")
                 return 0
             
-            # Group by pipeline
-            by_pipeline = {}
-            for baseline in baselines:
-                p = baseline.get('pipeline', 'unknown')
-                if p not in by_pipeline:
-                    by_pipeline[p] = []
-                by_pipeline[p].append(baseline)
+            if pipeline:
+                # The manager already filtered to one pipeline
+                groups = [(pipeline, baselines)]
+            else:
+                by_pipeline = defaultdict(list)
+                for baseline in baselines:
+                    by_pipeline[baseline.get('pipeline', 'unknown')].append(baseline)
+                groups = sorted(by_pipeline.items())
             
-            # Display baselines
-            for p in sorted(by_pipeline.keys()):
-                print()
-                print(self.formatter.subheader(f"Pipeline {p}"))
-                print("-" * 80)
+            # Display baselines, written in one call rather than a print per line
+            lines = []
+            for p, group in groups:
+                lines.append("")
+                lines.append(self.formatter.subheader(f"Pipeline {p}"))
+                lines.append(_SEP80)
                 
-                for i, baseline in enumerate(by_pipeline[p], 1):
-                    print(self._format_baseline_summary(baseline))
-                    if i < len(by_pipeline[p]):
-                        print()
+                for i, baseline in enumerate(group, 1):
+                    lines.append(self._format_baseline_summary(baseline))
+                    if i < len(group):
+                        lines.append("")
             
+            sys.stdout.write("\n".join(lines) + "\n")
             return 0
         
         except Exception as e:
             print(self.formatter.error(f"❌ Error listing baselines: {str(e)}"))
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                sys.stderr.write(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
             return 1
     
-    def delete_baseline_command(self, baseline_id: str) -> int:
+    def delete_baseline_command(self, baseline_id: str, assume_yes: bool = False) -> int:
         """
         Delete a baseline by filename.
         
         Args:
             baseline_id: Baseline filename or identifier
+            assume_yes: Skip the confirmation prompt
         
         Returns:
             Exit code (0 for success, 1 for failure)
@@ -444,7 +531,7 @@ class BenchmarkCLI:
         print(self.formatter.header("Delete Baseline"))
         
         try:
-            manager = BaselineManager()
+            manager = _get_baseline_manager()
             
             # Check if baseline exists
             if not manager.storage.file_exists(baseline_id):
@@ -458,16 +545,21 @@ class BenchmarkCLI:
             print()
             
             # Confirm deletion
-            try:
-                response = input(self.formatter.warning("Are you sure? (yes/no): ")).strip().lower()
-            except KeyboardInterrupt:
-                print()
-                print("Deletion cancelled.")
-                return 0
-            
-            if response != 'yes':
-                print("Deletion cancelled.")
-                return 0
+            if not assume_yes:
+                if not sys.stdin.isatty():
+                    print(self.formatter.error("❌ Refusing to prompt without a terminal; pass --yes to confirm"))
+                    return 1
+                
+                try:
+                    response = input(self.formatter.warning("Are you sure? (yes/no): ")).strip().lower()
+                except KeyboardInterrupt:
+                    print()
+                    print("Deletion cancelled.")
+                    return 0
+                
+                if response != 'yes':
+                    print("Deletion cancelled.")
+                    return 0
             
             # Delete baseline
             try:
@@ -485,8 +577,7 @@ class BenchmarkCLI:
         except Exception as e:
             print(self.formatter.error(f"❌ Error deleting baseline: {str(e)}"))
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                sys.stderr.write(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
             return 1
     
     def compare_command(self, baseline_id: str, candidate_id: str, output_dir: Optional[str] = None) -> int:
@@ -504,29 +595,34 @@ class BenchmarkCLI:
         print(self.formatter.header("Compare Baselines"))
         
         try:
-            manager = BaselineManager()
-            comparison_engine = ComparisonEngine()
+            manager = _get_baseline_manager()
+            comparison_engine = _get_comparison_engine()
             
-            # Load files
-            self.progress.step(1, 4, f"Loading baseline: {baseline_id}...")
-            try:
-                baseline = manager.storage.load_json(baseline_id)
-            except FileNotFoundError:
-                print(self.formatter.error(f"❌ Baseline not found: {baseline_id}"))
-                return 2
-            except Exception as e:
-                print(self.formatter.error(f"❌ Failed to load baseline: {str(e)}"))
-                return 2
-            
-            self.progress.step(2, 4, f"Loading candidate: {candidate_id}...")
-            try:
-                candidate = manager.storage.load_json(candidate_id)
-            except FileNotFoundError:
-                print(self.formatter.error(f"❌ Candidate not found: {candidate_id}"))
-                return 2
-            except Exception as e:
-                print(self.formatter.error(f"❌ Failed to load candidate: {str(e)}"))
-                return 2
+            # Load both files concurrently; the reads are independent
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                baseline_future = executor.submit(manager.storage.load_json, baseline_id)
+                candidate_future = executor.submit(manager.storage.load_json, candidate_id)
+                
+                self.progress.step(1, 4, f"Loading baseline: {baseline_id}...")
+                try:
+                    baseline = baseline_future.result()
+                except FileNotFoundError:
+                    print(self.formatter.error(f"❌ Baseline not found: {baseline_id}"))
+                    return 2
+                except Exception as e:
+                    print(self.formatter.error(f"❌ Failed to load baseline: {str(e)}"))
+                    return 2
+                
+                self.progress.step(2, 4, f"Loading candidate: {candidate_id}...")
+                try:
+                    candidate = candidate_future.result()
+                except FileNotFoundError:
+                    print(self.formatter.error(f"❌ Candidate not found: {candidate_id}"))
+                    return 2
+                except Exception as e:
+                    print(self.formatter.error(f"❌ Failed to load candidate: {str(e)}"))
+                    return 2
             
             # Compare
             self.progress.step(3, 4, "Comparing results...")
@@ -537,6 +633,7 @@ class BenchmarkCLI:
             self.progress.step(4, 4, "Generating report...")
             pipeline = comparison.pipeline_name
             report_output_dir = output_dir or "benchmark/results"
+            from .report_generator import ReportGenerator
             report_generator = ReportGenerator(pipeline, output_directory=report_output_dir)
             
             violation_counts = comparison.count_violations_by_severity()
@@ -563,9 +660,7 @@ class BenchmarkCLI:
             # Show violation summary
             print()
             print(self.formatter.subheader("Violation Summary"))
-            print(f"  Info:    {violation_counts['INFO']:>3} violations")
-            print(f"  Warning: {violation_counts['WARNING']:>3} violations")
-            print(f"  Error:   {violation_counts['ERROR']:>3} violations")
+            print(_format_violation_counts(violation_counts))
             
             print()
             print(f"Report: {report_path}")
@@ -575,8 +670,7 @@ class BenchmarkCLI:
         except Exception as e:
             print(self.formatter.error(f"❌ Error comparing baselines: {str(e)}"))
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                sys.stderr.write(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
             return 2
     
     def _format_status(self, status) -> str:
@@ -590,22 +684,212 @@ class BenchmarkCLI:
             Formatted status string
         """
         status_name = status.name
-        if status_name == 'PASS':
-            return self.formatter.success(f"✓ {status_name}")
-        elif status_name == 'WARNING':
-            return self.formatter.warning(f"⚠ {status_name}")
-        else:  # ERROR
+        cached = self._status_cache.get(status_name)
+        if cached is None:
             return self.formatter.error(f"✗ {status_name}")
+        return cached
+
+
+def _build_capture_parser(subparsers) -> None:
+    """Add the capture-baseline subcommand."""
+    capture_parser = subparsers.add_parser(
+        'capture-baseline',
+        help='Execute and save a baseline for a pipeline'
+    )
+    capture_parser.add_argument(
+        '--pipeline', '-p',
+        required=True,
+        type=str,
+        help='Pipeline to baseline (A, B, or C)'
+    )
+
+
+def _build_run_parser(subparsers) -> None:
+    """Add the run-benchmark subcommand."""
+    run_parser = subparsers.add_parser(
+        'run-benchmark',
+        help='Execute a benchmark and compare against baseline'
+    )
+    run_parser.add_argument(
+        '--pipeline', '-p',
+        required=True,
+        type=str,
+        help='Pipeline to benchmark (A, B, or C)'
+    )
+
+
+def _build_list_parser(subparsers) -> None:
+    """Add the list-baselines subcommand."""
+    list_parser = subparsers.add_parser(
+        'list-baselines',
+        help='Show available baselines'
+    )
+    list_parser.add_argument(
+        '--pipeline', '-p',
+        type=str,
+        default=None,
+        help='Filter by pipeline (A, B, or C) (optional)'
+    )
+
+
+def _build_delete_parser(subparsers) -> None:
+    """Add the delete-baseline subcommand."""
+    delete_parser = subparsers.add_parser(
+        'delete-baseline',
+        help='Remove a baseline'
+    )
+    delete_parser.add_argument(
+        '--id',
+        required=True,
+        type=str,
+        help='Baseline filename to delete'
+    )
+    delete_parser.add_argument(
+        '--yes', '-y',
+        action='store_true',
+        help='Delete without asking for confirmation (required when stdin is not a terminal)'
+    )
+
+
+def _build_compare_parser(subparsers) -> None:
+    """Add the compare subcommand."""
+    compare_parser = subparsers.add_parser(
+        'compare',
+        help='Compare two specific baselines'
+    )
+    compare_parser.add_argument(
+        '--baseline',
+        required=True,
+        type=str,
+        help='Baseline filename'
+    )
+    compare_parser.add_argument(
+        '--candidate',
+        required=True,
+        type=str,
+        help='Candidate filename'
+    )
 
 
-def main() -> int:
+# Subcommand builders in help order
+_SUBCOMMAND_BUILDERS = {
+    'capture-baseline': _build_capture_parser,
+    'run-benchmark': _build_run_parser,
+    'list-baselines': _build_list_parser,
+    'delete-baseline': _build_delete_parser,
+    'compare': _build_compare_parser,
+}
+
+# Global options that consume the following argument as their value
+_GLOBAL_VALUE_OPTIONS = frozenset({'--log-level', '--output-dir', '--config-file'})
+
+
+def _find_command(argv: List[str]) -> Optional[str]:
+    """
+    Find the subcommand named on the command line without a full parse.
+    
+    Args:
+        argv: Command-line arguments
+    
+    Returns:
+        Subcommand name, or None if there is none or help was requested first
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in ('-h', '--help'):
+            return None
+        if arg in _GLOBAL_VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg if arg in _SUBCOMMAND_BUILDERS else None
+    
+    return None
+
+
+# Top-level help, pre-rendered so `--help` and bare invocations skip building
+# the parser. Keep in sync with main(); regenerate the text with
+# `COLUMNS=80 python -m benchmark -v --help`.
+_MAIN_HELP = """\
+usage: python -m benchmark [-h] [--verbose]
+                           [--log-level {DEBUG,INFO,WARNING,ERROR}]
+                           [--output-dir OUTPUT_DIR]
+                           [--config-file CONFIG_FILE] [--no-color]
+                           {capture-baseline,run-benchmark,list-baselines,delete-baseline,compare}
+                           ...
+
+dbt Benchmark Management Tool
+
+positional arguments:
+  {capture-baseline,run-benchmark,list-baselines,delete-baseline,compare}
+                        Available commands
+    capture-baseline    Execute and save a baseline for a pipeline
+    run-benchmark       Execute a benchmark and compare against baseline
+    list-baselines      Show available baselines
+    delete-baseline     Remove a baseline
+    compare             Compare two specific baselines
+
+options:
+  -h, --help            show this help message and exit
+  --verbose, -v         Enable verbose output for debugging
+  --log-level {DEBUG,INFO,WARNING,ERROR}
+                        Logging level (default: DEBUG with --verbose,
+                        otherwise INFO)
+  --output-dir OUTPUT_DIR
+                        Override default output directory for reports
+                        (default: benchmark/results)
+  --config-file CONFIG_FILE
+                        Path to configuration file (default:
+                        benchmark/config/config.yaml)
+  --no-color            Disable colored output
+
+Examples:
+  # Capture a baseline for Pipeline A
+  python -m benchmark capture-baseline --pipeline A
+  
+  # Run benchmark for Pipeline B and compare to baseline
+  python -m benchmark run-benchmark --pipeline B
+  
+  # List all available baselines
+  python -m benchmark list-baselines
+  
+  # List baselines for Pipeline C only
+  python -m benchmark list-baselines --pipeline C
+  
+  # Delete a specific baseline
+  python -m benchmark delete-baseline --id baseline_A_20240101_120000.json
+  
+  # Delete without a confirmation prompt (e.g. in CI)
+  python -m benchmark delete-baseline --id baseline_A_20240101_120000.json --yes
+  
+  # Compare two baselines
+  python -m benchmark compare --baseline baseline_A_20240101_120000.json --candidate baseline_A_20240102_120000.json
+  
+  # Run with verbose output and custom config
+  python -m benchmark --verbose run-benchmark --pipeline A --output-dir /tmp/reports
+        
+"""
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI.
     
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    
     Returns:
         Exit code
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Fast path for top-level help; subcommand help still comes from argparse
+    if not argv or argv[0] in ('-h', '--help'):
+        sys.stdout.write(_MAIN_HELP)
+        return 0 if argv else 1
+    
     parser = argparse.ArgumentParser(
+        prog=_PROG,
         description="dbt Benchmark Management Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -625,6 +909,9 @@ Examples:
   # Delete a specific baseline
   %(prog)s delete-baseline --id baseline_A_20240101_120000.json
   
+  # Delete without a confirmation prompt (e.g. in CI)
+  %(prog)s delete-baseline --id baseline_A_20240101_120000.json --yes
+  
   # Compare two baselines
   %(prog)s compare --baseline baseline_A_20240101_120000.json --candidate baseline_A_20240102_120000.json
   
@@ -640,6 +927,14 @@ Examples:
         help='Enable verbose output for debugging'
     )
     
+    parser.add_argument(
+        '--log-level',
+        type=str.upper,
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        default=None,
+        help='Logging level (default: DEBUG with --verbose, otherwise INFO)'
+    )
+    
     parser.add_argument(
         '--output-dir',
         type=str,
@@ -660,85 +955,49 @@ Examples:
         help='Disable colored output'
     )
     
-    # Subcommands
+    # Subcommands; only the one being invoked is built
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    command = _find_command(argv)
     
-    # capture-baseline command
-    capture_parser = subparsers.add_parser(
-        'capture-baseline',
-        help='Execute and save a baseline for a pipeline'
-    )
-    capture_parser.add_argument(
-        '--pipeline', '-p',
-        required=True,
-        type=str,
-        help='Pipeline to baseline (A, B, or C)'
-    )
-    
-    # run-benchmark command
-    run_parser = subparsers.add_parser(
-        'run-benchmark',
-        help='Execute a benchmark and compare against baseline'
-    )
-    run_parser.add_argument(
-        '--pipeline', '-p',
-        required=True,
-        type=str,
-        help='Pipeline to benchmark (A, B, or C)'
-    )
-    
-    # list-baselines command
-    list_parser = subparsers.add_parser(
-        'list-baselines',
-        help='Show available baselines'
-    )
-    list_parser.add_argument(
-        '--pipeline', '-p',
-        type=str,
-        default=None,
-        help='Filter by pipeline (A, B, or C) (optional)'
-    )
-    
-    # delete-baseline command
-    delete_parser = subparsers.add_parser(
-        'delete-baseline',
-        help='Remove a baseline'
-    )
-    delete_parser.add_argument(
-        '--id',
-        required=True,
-        type=str,
-        help='Baseline filename to delete'
-    )
-    
-    # compare command
-    compare_parser = subparsers.add_parser(
-        'compare',
-        help='Compare two specific baselines'
-    )
-    compare_parser.add_argument(
-        '--baseline',
-        required=True,
-        type=str,
-        help='Baseline filename'
-    )
-    compare_parser.add_argument(
-        '--candidate',
-        required=True,
-        type=str,
-        help='Candidate filename'
-    )
+    if command is not None:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        # Help, no command, or an unknown one: argparse needs every choice
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Handle no command
     if not args.command:
         parser.print_help()
         return 1
     
-    # Initialize CLI
+    # Install the handler only once per process (repeated main() calls or an
+    # embedding harness keep theirs), but always apply the requested level
+    log_level = args.log_level or ('DEBUG' if args.verbose else 'INFO')
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        logging.basicConfig(
+            level=log_level,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+    root_logger.setLevel(log_level)
+    
+    # Keep line buffering on a terminal so progress shows as it happens;
+    # piped output coalesces the many small prints into block writes
     use_color = not args.no_color
+    try:
+        sys.stdout.reconfigure(
+            write_through=False,
+            line_buffering=sys.stdout.isatty()
+        )
+    except (AttributeError, ValueError):
+        # Replaced streams (e.g. io.StringIO in tests) can't be reconfigured
+        pass
+    
+    # Initialize CLI
     cli = BenchmarkCLI(use_color=use_color, verbose=args.verbose)
     
     # Execute command
@@ -753,7 +1012,7 @@ Examples:
             return cli.list_baselines_command(args.pipeline)
         
         elif args.command == 'delete-baseline':
-            return cli.delete_baseline_command(args.id)
+            return cli.delete_baseline_command(args.id, assume_yes=args.yes)
         
         elif args.command == 'compare':
             return cli.compare_command(args.baseline, args.candidate, args.output_dir)
@@ -769,8 +1028,7 @@ Examples:
     except Exception as e:
         print(cli.formatter.error(f"❌ Unexpected error: {str(e)}"))
         if args.verbose:
-            import traceback
-            traceback.print_exc()
+            sys.stderr.write(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
         return 1
 
 
@@ -5,7 +5,7 @@ Evaluates candidate benchmark results against baseline benchmarks with
 configurable regression thresholds and severity classification.
 
 Features:
-- Load baseline and candidate benchmark data
+- Load baseline and candidate benchmark data (memory-mapped and parsed with orjson when installed)
 - Per-model metric comparison with delta calculation
 - Pipeline-level aggregation and comparison
 - Exit code determination for CI/CD integration
@@ -14,13 +14,19 @@ Features:
 
 import logging
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import AbstractSet, Dict, Any, FrozenSet, Iterable, Iterator, Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from statistics import mean, stdev
 
-from thresholds import ThresholdManager, MetricsComparer, Violation, SeverityLevel
+from .serialization import json_dumps, json_load_file
+from .thresholds import ThresholdManager, MetricsComparer, Violation, SeverityLevel
 
 
 # Configure logging
@@ -31,6 +37,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Severity names, looked up once rather than through the enum per violation
+SEVERITY_NAMES = {level: level.name for level in SeverityLevel}
+
+# Report marker for each violation severity, indexed by SeverityLevel.value
+_SEVERITY_MARKERS = ("ℹ", "⚠", "✗")
+
+
 class ComparisonStatus(Enum):
     """Overall comparison status."""
     PASS = 0        # No violations
@@ -38,7 +51,28 @@ class ComparisonStatus(Enum):
     ERROR = 2       # Major violations detected
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to
+# regular instance dicts
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _max_severity(violations: Iterable[Violation]) -> SeverityLevel:
+    """
+    Get the highest severity among violations, INFO if there are none.
+    
+    Stops at the first ERROR, since nothing can outrank it.
+    """
+    best = SeverityLevel.INFO
+    for violation in violations:
+        severity = violation.severity
+        if severity is SeverityLevel.ERROR:
+            return severity
+        if severity.value > best.value:
+            best = severity
+    return best
+
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
 class ModelComparison:
     """Represents comparison results for a single model."""
     model_name: str
@@ -50,50 +84,161 @@ class ModelComparison:
     
     def get_max_severity(self) -> SeverityLevel:
         """Get the maximum severity level among violations."""
-        if not self.violations:
-            return SeverityLevel.INFO
-        return max((v.severity for v in self.violations), key=lambda s: s.value)
+        return _max_severity(self.violations)
 
 
-@dataclass
+@dataclass(eq=False, **_DATACLASS_SLOTS)
 class PipelineComparison:
-    """Represents comparison results for an entire pipeline."""
+    """
+    Represents comparison results for an entire pipeline.
+    
+    The flattened violation list and the per-severity counts are cached on
+    first use, so the text and JSON reports share them. Reassigning
+    model_comparisons or pipeline_violations clears them; call
+    invalidate_violations() after changing either of them, or a
+    violation's severity, in place.
+    """
     pipeline_name: str
     baseline_timestamp: str
     candidate_timestamp: str
     model_comparisons: Dict[str, ModelComparison] = field(default_factory=dict)
     pipeline_violations: List[Violation] = field(default_factory=list)
+    _violations_cache: Optional[Tuple[Violation, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _severity_counts: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ('model_comparisons', 'pipeline_violations'):
+            object.__setattr__(self, '_violations_cache', None)
+            object.__setattr__(self, '_severity_counts', None)
+        object.__setattr__(self, name, value)
+    
+    def invalidate_violations(self) -> None:
+        """Drop the cached violation list and counts after an in-place change."""
+        self._violations_cache = None
+        self._severity_counts = None
     
-    def get_all_violations(self) -> List[Violation]:
+    def _iter_violations(self) -> Iterator[Violation]:
+        """Iterate all violations, from the cache if built, without copying them."""
+        if self._violations_cache is not None:
+            return iter(self._violations_cache)
+        return chain(
+            self.pipeline_violations,
+            chain.from_iterable(
+                model_comp.violations for model_comp in self.model_comparisons.values()
+            )
+        )
+    
+    def get_all_violations(self) -> Tuple[Violation, ...]:
         """Get all violations across all models and pipeline level."""
-        violations = list(self.pipeline_violations)
-        for model_comp in self.model_comparisons.values():
-            violations.extend(model_comp.violations)
-        return violations
+        if self._violations_cache is None:
+            self._violations_cache = tuple(self._iter_violations())
+        return self._violations_cache
     
     def get_max_severity(self) -> SeverityLevel:
         """Get the maximum severity level among all violations."""
-        all_violations = self.get_all_violations()
-        if not all_violations:
-            return SeverityLevel.INFO
-        return max((v.severity for v in all_violations), key=lambda s: s.value)
+        counts = self._severity_counts
+        if counts is None:
+            return _max_severity(self._iter_violations())
+        
+        # Already counted: the highest level with any violations wins
+        for level in (SeverityLevel.ERROR, SeverityLevel.WARNING):
+            if counts[SEVERITY_NAMES[level]]:
+                return level
+        return SeverityLevel.INFO
     
     def count_violations_by_severity(self) -> Dict[str, int]:
         """Count violations by severity level."""
-        all_violations = self.get_all_violations()
-        counts = {
-            'INFO': 0,
-            'WARNING': 0,
-            'ERROR': 0
-        }
-        for violation in all_violations:
-            if violation.severity == SeverityLevel.INFO:
-                counts['INFO'] += 1
-            elif violation.severity == SeverityLevel.WARNING:
-                counts['WARNING'] += 1
-            else:
-                counts['ERROR'] += 1
-        return counts
+        if self._severity_counts is None:
+            # One pass to pull out severities, then list.count per level: the
+            # counting runs in C and compares enum members by identity
+            severities = [violation.severity for violation in self.get_all_violations()]
+            self._severity_counts = {
+                name: severities.count(level) for level, name in SEVERITY_NAMES.items()
+            }
+        return dict(self._severity_counts)
+
+
+def _compare_model_metrics(comparer: MetricsComparer,
+                           model_name: str,
+                           baseline_metrics: Dict[str, Any],
+                           candidate_metrics: Dict[str, Any],
+                           configured_keys: AbstractSet[str]) -> ModelComparison:
+    """
+    Compare one model's metric dictionaries.
+    
+    Module-level so process pool workers can run it.
+    
+    Args:
+        comparer: MetricsComparer holding the threshold table
+        model_name: Name of the model
+        baseline_metrics: Baseline metric values
+        candidate_metrics: Candidate metric values
+        configured_keys: Names of metrics that have a threshold, resolved
+            once by the caller rather than per model
+    
+    Returns:
+        ModelComparison object with violations and missing metrics
+    """
+    # Unchanged model (the common case in CI): every delta is zero, so no
+    # threshold can be exceeded and no metric is missing on either side.
+    # Dict equality runs in C and copes with unhashable values
+    if baseline_metrics == candidate_metrics:
+        return ModelComparison(
+            model_name=model_name,
+            baseline_metrics=baseline_metrics,
+            candidate_metrics=candidate_metrics
+        )
+    
+    # Identify common and missing metrics. Dict key views support set
+    # operations directly, so neither key set is copied first
+    baseline_keys = baseline_metrics.keys()
+    candidate_keys = candidate_metrics.keys()
+    common_keys = baseline_keys & candidate_keys
+    
+    missing_in_baseline = list(candidate_keys - common_keys)
+    missing_in_candidate = list(baseline_keys - common_keys)
+    
+    # Compare common metrics. Only metrics with a configured threshold can
+    # produce a violation, so narrow the set with one set intersection
+    # instead of evaluating (and rejecting) each unconfigured metric
+    violations = comparer.compare_metrics(
+        baseline_metrics,
+        candidate_metrics,
+        metric_names=list(common_keys & configured_keys)
+    )
+    
+    return ModelComparison(
+        model_name=model_name,
+        baseline_metrics=baseline_metrics,
+        candidate_metrics=candidate_metrics,
+        violations=violations,
+        metrics_missing_in_baseline=missing_in_baseline,
+        metrics_missing_in_candidate=missing_in_candidate
+    )
+
+
+# Comparer and configured metric names for this process pool worker,
+# set once per worker by _init_compare_worker
+_worker_state: Optional[Tuple[MetricsComparer, FrozenSet[str]]] = None
+
+
+def _init_compare_worker(comparer: MetricsComparer, configured_keys: FrozenSet[str]) -> None:
+    """Store the comparer a worker process uses for all of its models."""
+    global _worker_state
+    _worker_state = (comparer, configured_keys)
+
+
+def _compare_model_in_worker(payload: Tuple[str, Dict[str, Any], Dict[str, Any]]) -> ModelComparison:
+    """Compare one (model_name, baseline_metrics, candidate_metrics) payload in a worker."""
+    comparer, configured_keys = _worker_state
+    model_name, baseline_metrics, candidate_metrics = payload
+    return _compare_model_metrics(
+        comparer, model_name, baseline_metrics, candidate_metrics, configured_keys
+    )
 
 
 class ComparisonEngine:
@@ -105,20 +250,33 @@ class ComparisonEngine:
     
     def __init__(self,
                  threshold_config_path: str = "benchmark/config/thresholds.yaml",
-                 ignore_improvements: bool = False):
+                 ignore_improvements: bool = False,
+                 max_workers: Optional[int] = 1):
         """
         Initialize ComparisonEngine.
         
         Args:
             threshold_config_path: Path to thresholds configuration
             ignore_improvements: If True, don't report improvements as violations
+            max_workers: Process pool size for model comparisons; None uses
+                the CPU count. Defaults to 1, comparing in this process: each
+                model takes microseconds, so pool startup and pickling cost
+                more than they save even for thousands of models
         """
         self.threshold_manager = ThresholdManager(threshold_config_path)
+        
+        # Threshold table resolved once and shared with the comparer
+        self._threshold_cache = {
+            name: self.threshold_manager.get_threshold(name)
+            for name in self.threshold_manager.get_all_metrics()
+        }
         self.comparer = MetricsComparer(
             self.threshold_manager,
-            ignore_improvements=ignore_improvements
+            ignore_improvements=ignore_improvements,
+            threshold_cache=self._threshold_cache
         )
         self.ignore_improvements = ignore_improvements
+        self.max_workers = max_workers
     
     def load_baseline(self, baseline_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -136,8 +294,7 @@ class ComparisonEngine:
                 logger.error(f"Baseline file not found: {baseline_path}")
                 return None
             
-            with open(path, 'r') as f:
-                baseline = json.load(f)
+            baseline = json_load_file(path)
             
             logger.info(f"Loaded baseline: {baseline_path}")
             return baseline
@@ -165,8 +322,7 @@ class ComparisonEngine:
                 logger.error(f"Candidate file not found: {candidate_path}")
                 return None
             
-            with open(path, 'r') as f:
-                candidate = json.load(f)
+            candidate = json_load_file(path)
             
             logger.info(f"Loaded candidate: {candidate_path}")
             return candidate
@@ -191,33 +347,12 @@ class ComparisonEngine:
         Returns:
             ModelComparison object with violations and missing metrics
         """
-        model_name = baseline.get('model_name', 'unknown')
-        
-        # Extract per-model metrics
-        baseline_metrics = baseline.get('metrics', {})
-        candidate_metrics = candidate.get('metrics', {})
-        
-        # Identify missing metrics
-        baseline_keys = set(baseline_metrics.keys())
-        candidate_keys = set(candidate_metrics.keys())
-        
-        missing_in_baseline = list(candidate_keys - baseline_keys)
-        missing_in_candidate = list(baseline_keys - candidate_keys)
-        
-        # Compare common metrics
-        violations = self.comparer.compare_metrics(
-            baseline_metrics,
-            candidate_metrics,
-            metric_names=list(baseline_keys & candidate_keys)
-        )
-        
-        return ModelComparison(
-            model_name=model_name,
-            baseline_metrics=baseline_metrics,
-            candidate_metrics=candidate_metrics,
-            violations=violations,
-            metrics_missing_in_baseline=missing_in_baseline,
-            metrics_missing_in_candidate=missing_in_candidate
+        return _compare_model_metrics(
+            self.comparer,
+            baseline.get('model_name', 'unknown'),
+            baseline.get('metrics', {}),
+            candidate.get('metrics', {}),
+            self._threshold_cache.keys()
         )
     
     def compare_pipeline(self,
@@ -250,14 +385,32 @@ class ComparisonEngine:
         baseline_models = baseline.get('per_model', {})
         candidate_models = candidate.get('per_model', {})
         
-        all_model_names = set(baseline_models.keys()) | set(candidate_models.keys())
+        all_model_names = baseline_models.keys() | candidate_models.keys()
         
-        for model_name in all_model_names:
+        # Gather each model's metric dicts in name order, so reports can
+        # iterate model_comparisons directly
+        model_names = sorted(all_model_names)
+        payloads = []
+        for model_name in model_names:
             baseline_model = baseline_models.get(model_name, {'model_name': model_name})
             candidate_model = candidate_models.get(model_name, {'model_name': model_name})
-            
-            model_comparison = self.compare_models(baseline_model, candidate_model)
-            comparison.model_comparisons[model_name] = model_comparison
+            payloads.append((
+                baseline_model.get('model_name', 'unknown'),
+                baseline_model.get('metrics', {}),
+                candidate_model.get('metrics', {})
+            ))
+        
+        configured_keys = self._threshold_cache.keys()
+        if len(payloads) > 1 and self.max_workers != 1:
+            results = self._compare_models_parallel(payloads, configured_keys)
+        else:
+            comparer = self.comparer
+            results = [
+                _compare_model_metrics(comparer, name, b_metrics, c_metrics, configured_keys)
+                for name, b_metrics, c_metrics in payloads
+            ]
+        
+        comparison.model_comparisons = dict(zip(model_names, results))
         
         # Compare pipeline-level aggregations
         baseline_agg = baseline.get('pipeline_aggregations', {})
@@ -274,6 +427,41 @@ class ComparisonEngine:
         
         return comparison
     
+    def _compare_models_parallel(self,
+                                 payloads: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+                                 configured_keys: AbstractSet[str]) -> List[ModelComparison]:
+        """
+        Compare models across a process pool.
+        
+        Each worker receives the comparer once through its initializer, and
+        payloads are sent in chunks to keep inter-process traffic low. Falls
+        back to comparing in this process if the pool can't be started.
+        
+        Args:
+            payloads: (model_name, baseline_metrics, candidate_metrics) tuples
+            configured_keys: Names of metrics that have a threshold
+        
+        Returns:
+            ModelComparison objects in payload order
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(payloads) // (workers * 4))
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_compare_worker,
+                initargs=(self.comparer, frozenset(configured_keys))
+            ) as executor:
+                return list(executor.map(_compare_model_in_worker, payloads, chunksize=chunksize))
+        
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Process pool unavailable, comparing models serially: {str(e)}")
+            return [
+                _compare_model_metrics(self.comparer, name, b_metrics, c_metrics, configured_keys)
+                for name, b_metrics, c_metrics in payloads
+            ]
+    
     def generate_summary(self,
                         comparison: PipelineComparison) -> Tuple[ComparisonStatus, int]:
         """
@@ -336,28 +524,25 @@ class ComparisonEngine:
             lines.append("MODEL-LEVEL RESULTS")
             lines.append("-" * 80)
             
-            for model_name in sorted(comparison.model_comparisons.keys()):
-                model_comp = comparison.model_comparisons[model_name]
-                status_str = "PASS" if not model_comp.violations else model_comp.get_max_severity().name
-                
-                lines.append(f"  {model_name}: {status_str}")
+            # compare_pipeline already stores models in name order. Each
+            # model's lines are joined into one block and appended once
+            for model_name, model_comp in comparison.model_comparisons.items():
+                violations = model_comp.violations
+                status_str = "PASS" if not violations else model_comp.get_max_severity().name
                 
-                # Show violations for this model
-                if model_comp.violations:
-                    for violation in model_comp.violations:
-                        severity_marker = {
-                            SeverityLevel.INFO: "ℹ",
-                            SeverityLevel.WARNING: "⚠",
-                            SeverityLevel.ERROR: "✗"
-                        }.get(violation.severity, "•")
-                        
-                        lines.append(f"    {severity_marker} {violation.get_message()}")
+                block = [f"  {model_name}: {status_str}"]
+                block.extend(
+                    f"    {_SEVERITY_MARKERS[violation.severity.value]} {violation.message}"
+                    for violation in violations
+                )
                 
                 # Show missing metrics
                 if model_comp.metrics_missing_in_candidate:
-                    lines.append(f"    ⚠ New metrics in candidate: {', '.join(model_comp.metrics_missing_in_candidate)}")
+                    block.append(f"    ⚠ New metrics in candidate: {', '.join(model_comp.metrics_missing_in_candidate)}")
                 if model_comp.metrics_missing_in_baseline:
-                    lines.append(f"    ℹ Removed metrics: {', '.join(model_comp.metrics_missing_in_baseline)}")
+                    block.append(f"    ℹ Removed metrics: {', '.join(model_comp.metrics_missing_in_baseline)}")
+                
+                lines.append("\n".join(block))
             
             lines.append("")
         
@@ -365,16 +550,10 @@ class ComparisonEngine:
         if comparison.pipeline_violations:
             lines.append("PIPELINE-LEVEL VIOLATIONS")
             lines.append("-" * 80)
-            
-            for violation in comparison.pipeline_violations:
-                severity_marker = {
-                    SeverityLevel.INFO: "ℹ",
-                    SeverityLevel.WARNING: "⚠",
-                    SeverityLevel.ERROR: "✗"
-                }.get(violation.severity, "•")
-                
-                lines.append(f"  {severity_marker} {violation.get_message()}")
-            
+            lines.extend(
+                f"  {_SEVERITY_MARKERS[violation.severity.value]} {violation.message}"
+                for violation in comparison.pipeline_violations
+            )
             lines.append("")
         
         lines.append("=" * 80)
@@ -391,6 +570,8 @@ class ComparisonEngine:
         Returns:
             Dictionary suitable for JSON serialization
         """
+        # Counting first lets generate_summary read the cached counts
+        violation_counts = comparison.count_violations_by_severity()
         status, exit_code = self.generate_summary(comparison)
         
         violations_by_severity = {
@@ -400,8 +581,7 @@ class ComparisonEngine:
         }
         
         for violation in comparison.get_all_violations():
-            severity_name = violation.severity.name
-            violations_by_severity[severity_name].append({
+            violations_by_severity[SEVERITY_NAMES[violation.severity]].append({
                 'metric': violation.metric_name,
                 'baseline': violation.baseline_value,
                 'candidate': violation.candidate_value,
@@ -409,11 +589,9 @@ class ComparisonEngine:
                 'delta_percent': violation.delta_percent,
                 'threshold': violation.threshold,
                 'is_improvement': violation.is_improvement,
-                'message': violation.get_message()
+                'message': violation.message
             })
         
-        violation_counts = comparison.count_violations_by_severity()
-        
         return {
             'pipeline': comparison.pipeline_name,
             'baseline_timestamp': comparison.baseline_timestamp,
@@ -434,7 +612,7 @@ class ComparisonEngine:
                             'metric': v.metric_name,
                             'delta': v.delta,
                             'delta_percent': v.delta_percent,
-                            'message': v.get_message()
+                            'message': v.message
                         }
                         for v in model_comp.violations
                     ],
@@ -444,3 +622,19 @@ class ComparisonEngine:
                 for model_name, model_comp in comparison.model_comparisons.items()
             }
         }
+    
+    def generate_json_bytes(self, comparison: PipelineComparison, indent: bool = False) -> bytes:
+        """
+        Generate the JSON report already encoded, ready to write to a file.
+        
+        Uses the shared serializer, so encoding goes through orjson when it
+        is installed.
+        
+        Args:
+            comparison: PipelineComparison object
+            indent: Pretty-print with two-space indentation
+        
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return json_dumps(self.generate_json_report(comparison), indent=indent)
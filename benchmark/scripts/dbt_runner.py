@@ -3,24 +3,243 @@ dbt Pipeline Execution Wrapper
 
 Orchestrates dbt runs for specific pipelines with automatic dependency resolution.
 Handles pipeline selection, dependency execution, and metadata capture.
+dbt runs in-process through dbtRunner when dbt-core is importable, and as a
+subprocess otherwise.
 """
 
+import atexit
+import re
+import shutil
 import subprocess
+import threading
+import time
 import yaml
 import logging
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+
+from .serialization import json_dumps, load_yaml_file
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Pipelines run concurrently when pipelines.yaml doesn't set max_parallel;
+# concurrency is opt-in since pipelines may share upstream models
+DEFAULT_MAX_PARALLEL = 1
+
+# Seconds a dbt subprocess may run before it is killed; in-process runs
+# can't be interrupted and have no timeout
+DBT_TIMEOUT_SECONDS = 600
+
+# Lines of dbt error output kept in the results of a failed run
+MAX_STDERR_LINES = 200
+
+# Keys every pipeline entry in pipelines.yaml must define
+REQUIRED_PIPELINE_KEYS = frozenset({'name', 'schema', 'models', 'dependencies'})
+
+# Qualified model name on dbt's per-model progress lines, e.g.
+# "1 of 5 OK created sql view model schema.model_name"
+_MODEL_RE = re.compile(r'sql (?:view |table |)model (\S+\.(\S+))')
+
+# dbt-core (major, minor) versions, lower inclusive and upper exclusive, whose
+# adapter_management and cleanup_connections layout _pooled_adapters patches
+ADAPTER_POOL_DBT_VERSIONS = ((1, 5), (1, 9))
+
+# Adapters registered by a pooled invocation are still open
+_adapters_ready = False
+_pool_close_registered = False
+_adapter_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _dbt_executable() -> str:
+    """
+    Resolve the dbt executable to an absolute path, once per process.
+    
+    subprocess only takes its posix_spawn fast path for executables given
+    with a directory.
+    
+    Returns:
+        Path of the dbt executable, or "dbt" if it isn't on PATH
+    """
+    return shutil.which("dbt") or "dbt"
+
+
+def _utc_timestamp(time_ns: int) -> str:
+    """
+    Format a time.time_ns() reading as an ISO 8601 UTC timestamp.
+    
+    Args:
+        time_ns: Nanoseconds since the epoch
+    
+    Returns:
+        Timestamp such as "2024-01-15T10:30:00.123456Z"
+    """
+    return datetime.fromtimestamp(time_ns / 1e9, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _collect_model_names(stream: Iterable[str], models: Optional[List[str]]) -> None:
+    """
+    Consume dbt stdout line by line, appending each newly seen model name.
+    
+    Args:
+        stream: dbt stdout lines
+        models: List to append model names to, or None to only drain the stream
+    """
+    seen = set()
+    for line in stream:
+        if models is None:
+            continue
+        match = _MODEL_RE.search(line)
+        if match is not None and match.group(2) not in seen:
+            seen.add(match.group(2))
+            models.append(match.group(2))
+
+
+def _collect_lines(stream: Iterable[str], lines: List[str]) -> None:
+    """Consume a text stream, appending each line without its newline."""
+    for line in stream:
+        lines.append(line.rstrip('\n'))
+
+
+@lru_cache(maxsize=4)
+def get_dbt_version(project_root: str) -> Optional[str]:
+    """
+    Get the installed dbt version.
+    
+    Uses the dbt-core package metadata and only falls back to running
+    `dbt --version` when dbt-core isn't installed in this environment.
+    The result is cached for the life of the process, so repeated runs
+    never spawn the subprocess more than once per project root.
+    
+    Args:
+        project_root: Root directory of dbt project
+    
+    Returns:
+        dbt version or None if not available
+    """
+    try:
+        return metadata.version("dbt-core")
+    except metadata.PackageNotFoundError:
+        logger.debug("dbt-core package metadata not found, running dbt --version")
+    
+    try:
+        result = subprocess.run(
+            ["dbt", "--version"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        
+        if result.returncode == 0:
+            for line in result.stdout.split('\n'):
+                if 'dbt version' in line.lower():
+                    parts = line.strip().split()
+                    if len(parts) >= 3:
+                        return parts[2]
+        
+        return None
+    
+    except Exception as e:
+        logger.debug("Unable to get dbt version: %s", e)
+        return None
+
+
+def _dbt_core_version() -> Optional[Tuple[int, int]]:
+    """
+    Get the installed dbt-core (major, minor) version.
+    
+    Returns:
+        Version tuple, or None if dbt-core isn't installed or the version
+        can't be parsed
+    """
+    try:
+        major, minor = metadata.version("dbt-core").split(".")[:2]
+        return int(major), int(minor)
+    except (metadata.PackageNotFoundError, ValueError):
+        return None
+
+
+@contextmanager
+def _pooled_adapters():
+    """
+    Keep dbt adapter connections open across the runner's in-process invocations.
+    
+    dbt resets its adapters and closes their connections around every
+    invocation. Inside this context that is patched out: the first pooled
+    invocation resets the adapters as usual and later ones reuse the open
+    connections, which are closed at interpreter exit. An invocation that
+    raises closes the connections and makes the next one start from a clean
+    reset. The patched dbt internals are restored on exit, so other dbt use
+    in the process is unaffected.
+    
+    The patch relies on private dbt-core module layout and is only applied
+    for versions in ADAPTER_POOL_DBT_VERSIONS; otherwise dbt manages its
+    connections itself.
+    """
+    global _pool_close_registered
+    
+    version = _dbt_core_version()
+    if version is None or not ADAPTER_POOL_DBT_VERSIONS[0] <= version < ADAPTER_POOL_DBT_VERSIONS[1]:
+        yield
+        return
+    
+    try:
+        from dbt.adapters import factory
+        from dbt.adapters.base import BaseAdapter
+        from dbt.cli import requires
+    except ImportError:
+        yield
+        return
+    
+    with _adapter_pool_lock:
+        original_management = factory.adapter_management
+        original_requires_management = getattr(requires, 'adapter_management', None)
+        original_cleanup = BaseAdapter.cleanup_connections
+        
+        def close_pooled_connections() -> None:
+            for adapter in list(factory.FACTORY.adapters.values()):
+                try:
+                    original_cleanup(adapter)
+                except Exception as e:
+                    logger.debug("Error closing dbt adapter connections: %s", e)
+        
+        @contextmanager
+        def pooled_adapter_management():
+            global _adapters_ready
+            if not _adapters_ready:
+                factory.reset_adapters()
+                _adapters_ready = True
+            try:
+                yield
+            except BaseException:
+                _adapters_ready = False
+                close_pooled_connections()
+                raise
+        
+        if not _pool_close_registered:
+            atexit.register(close_pooled_connections)
+            _pool_close_registered = True
+        
+        factory.adapter_management = pooled_adapter_management
+        if original_requires_management is not None:
+            requires.adapter_management = pooled_adapter_management
+        BaseAdapter.cleanup_connections = lambda self: None
+        try:
+            yield
+        finally:
+            factory.adapter_management = original_management
+            if original_requires_management is not None:
+                requires.adapter_management = original_requires_management
+            BaseAdapter.cleanup_connections = original_cleanup
+
 
 class PipelineRunner:
     """
@@ -32,6 +251,11 @@ class PipelineRunner:
         project_root: Root directory of dbt project
     """
     
+    __slots__ = (
+        'pipeline_id', 'config_path', 'project_root', 'config', 'pipelines_config',
+        'execution_results', '_cached_order', '_deps', '_exec_fns', '_dbt'
+    )
+    
     def __init__(self, pipeline_id: str, config_path: str = None, project_root: str = None):
         """
         Initialize the PipelineRunner.
@@ -54,6 +278,18 @@ class PipelineRunner:
         
         self.config = None
         self.pipelines_config = None
+        self._cached_order = None
+        self._deps = {}
+        self._exec_fns = {}
+        self._dbt = None
+        self.reset_execution_state()
+    
+    def reset_execution_state(self) -> None:
+        """
+        Clear results from any previous run so the runner can be reused.
+        
+        Loaded configuration is kept.
+        """
         self.execution_results = {
             "pipeline": self.pipeline_id,
             "target_schema": None,
@@ -73,17 +309,12 @@ class PipelineRunner:
         Returns:
             bool: True if config loaded successfully, False otherwise
         """
-        logger.info(f"Loading pipeline configuration from {self.config_path}")
+        logger.info("Loading pipeline configuration from %s", self.config_path)
         
         try:
-            if not self.config_path.exists():
-                error_msg = f"Configuration file not found: {self.config_path}"
-                logger.error(error_msg)
-                self.execution_results["errors"].append(error_msg)
-                return False
-            
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            # load_yaml_file shares its parse with BaselineManager, which reads
+            # the same pipelines.yaml
+            self.config = load_yaml_file(self.config_path)
             
             if not self.config or 'pipelines' not in self.config:
                 error_msg = "Invalid configuration: 'pipelines' key not found"
@@ -92,6 +323,23 @@ class PipelineRunner:
                 return False
             
             self.pipelines_config = self.config['pipelines']
+            self._cached_order = None
+            self._deps = {
+                pipeline_id: tuple(pipeline_config.get('dependencies') or ())
+                for pipeline_id, pipeline_config in self.pipelines_config.items()
+            }
+            
+            # Bind each pipeline's command and schema once; execute_dbt then
+            # only looks up the prepared call
+            self._exec_fns = {
+                pipeline_id: partial(
+                    self._run_dbt,
+                    f"pipeline {pipeline_id}",
+                    ["dbt", "run", "--select", pipeline_config.get('models')],
+                    pipeline_config.get('schema')
+                )
+                for pipeline_id, pipeline_config in self.pipelines_config.items()
+            }
             
             # Validate pipeline exists
             if self.pipeline_id not in self.pipelines_config:
@@ -102,27 +350,30 @@ class PipelineRunner:
             
             # Validate all dependencies exist
             pipeline_config = self.pipelines_config[self.pipeline_id]
-            dependencies = pipeline_config.get('dependencies', [])
-            for dep in dependencies:
-                if dep not in self.pipelines_config:
-                    error_msg = f"Dependency pipeline {dep} not found in configuration"
-                    logger.error(error_msg)
-                    self.execution_results["errors"].append(error_msg)
-                    return False
+            unknown = set(pipeline_config.get('dependencies', [])) - self.pipelines_config.keys()
+            if unknown:
+                error_msg = f"Dependency pipelines not found in configuration: {sorted(unknown)}"
+                logger.error(error_msg)
+                self.execution_results["errors"].append(error_msg)
+                return False
             
             # Validate required keys in pipeline config
-            required_keys = ['name', 'schema', 'models', 'dependencies']
-            for key in required_keys:
-                if key not in pipeline_config:
-                    error_msg = f"Pipeline {self.pipeline_id} missing required key: {key}"
-                    logger.error(error_msg)
-                    self.execution_results["errors"].append(error_msg)
-                    return False
+            missing = REQUIRED_PIPELINE_KEYS - pipeline_config.keys()
+            if missing:
+                error_msg = f"Pipeline {self.pipeline_id} missing required keys: {sorted(missing)}"
+                logger.error(error_msg)
+                self.execution_results["errors"].append(error_msg)
+                return False
             
-            logger.info(f"Pipeline configuration loaded successfully for {self.pipeline_id}")
+            logger.info("Pipeline configuration loaded successfully for %s", self.pipeline_id)
             self.execution_results["target_schema"] = pipeline_config.get('schema')
             return True
         
+        except FileNotFoundError:
+            error_msg = f"Configuration file not found: {self.config_path}"
+            logger.error(error_msg)
+            self.execution_results["errors"].append(error_msg)
+            return False
         except yaml.YAMLError as e:
             error_msg = f"YAML parsing error: {str(e)}"
             logger.error(error_msg)
@@ -138,38 +389,70 @@ class PipelineRunner:
         """
         Resolve the dependency chain for the target pipeline.
         
+        The order is computed once per loaded configuration and reused by
+        later calls.
+        
         Returns:
             List[str]: Ordered list of pipeline IDs to execute (including target pipeline)
         """
-        logger.info(f"Resolving dependencies for pipeline {self.pipeline_id}")
+        if self._cached_order is not None:
+            return list(self._cached_order)
+        
+        logger.info("Resolving dependencies for pipeline %s", self.pipeline_id)
         
         execution_order = []
         visited = set()
         
-        def visit_pipeline(pipeline_id: str):
-            """Recursively visit pipeline and its dependencies."""
+        # Iterative post-order DFS: a pipeline is pushed a second time with
+        # expanded=True and emitted once all of its dependencies have been
+        stack = [(self.pipeline_id, False)]
+        while stack:
+            pipeline_id, expanded = stack.pop()
+            
+            if expanded:
+                execution_order.append(pipeline_id)
+                continue
+            
             if pipeline_id in visited:
-                return
+                continue
             
             visited.add(pipeline_id)
             
-            if pipeline_id not in self.pipelines_config:
-                logger.warning(f"Pipeline {pipeline_id} not found in configuration")
-                return
+            dependencies = self._deps.get(pipeline_id)
+            if dependencies is None:
+                logger.warning("Pipeline %s not found in configuration", pipeline_id)
+                continue
             
-            # Process dependencies first
-            dependencies = self.pipelines_config[pipeline_id].get('dependencies', [])
-            for dep in dependencies:
-                visit_pipeline(dep)
-            
-            # Then add the pipeline itself
-            execution_order.append(pipeline_id)
+            # Dependencies are pushed in reverse so they are visited in listed order
+            stack.append((pipeline_id, True))
+            stack.extend((dep, False) for dep in reversed(dependencies))
+        
+        logger.info("Execution order determined: %s", execution_order)
+        self._cached_order = execution_order
+        return list(execution_order)
+    
+    def resolve_dependency_levels(self) -> List[List[str]]:
+        """
+        Group the dependency chain into levels that can run concurrently.
+        
+        A pipeline's level is the length of the longest dependency path
+        below it, so every pipeline only depends on pipelines in earlier
+        levels. The target pipeline is always alone in the last level.
         
-        # Start with target pipeline
-        visit_pipeline(self.pipeline_id)
+        Returns:
+            List[List[str]]: Pipeline IDs per level, in execution order
+        """
+        depths: Dict[str, int] = {}
+        levels: List[List[str]] = []
         
-        logger.info(f"Execution order determined: {execution_order}")
-        return execution_order
+        for pipeline_id in self.resolve_dependencies():
+            depth = 1 + max((depths[dep] for dep in self._deps[pipeline_id] if dep in depths), default=-1)
+            depths[pipeline_id] = depth
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append(pipeline_id)
+        
+        return levels
     
     def get_dbt_version(self) -> Optional[str]:
         """
@@ -178,121 +461,310 @@ class PipelineRunner:
         Returns:
             str: dbt version or None if unable to retrieve
         """
-        try:
-            result = subprocess.run(
-                ["dbt", "--version"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                # dbt version output typically starts with "dbt version X.Y.Z"
-                for line in result.stdout.split('\n'):
-                    if 'dbt version' in line.lower():
-                        # Extract version string (format: "dbt version X.Y.Z")
-                        parts = line.strip().split()
-                        if len(parts) >= 3:
-                            return parts[2]
-                return None
-            
-            logger.warning("Unable to retrieve dbt version")
-            return None
+        return get_dbt_version(str(self.project_root.resolve()))
+    
+    def _get_dbt_runner(self) -> Optional[Any]:
+        """
+        Get the in-process dbt runner, creating it on first use.
+        
+        The runner is reused for every pipeline this instance executes, so
+        dbt is imported once instead of once per subprocess, and adapter
+        connections stay open between invocations.
+        
+        Returns:
+            dbtRunner instance, or None if dbt-core can't be imported
+        """
+        if self._dbt is None:
+            try:
+                from dbt.cli.main import dbtRunner
+            except ImportError:
+                logger.info("dbt Python API not available, running dbt as a subprocess")
+                self._dbt = False
+            else:
+                self._dbt = dbtRunner()
+        
+        return self._dbt or None
+    
+    def _project_args(self) -> List[str]:
+        """
+        Build the dbt arguments pointing it at the project root.
+        
+        dbt looks for profiles.yml in the working directory before ~/.dbt;
+        since dbt isn't started in the project root, a profiles.yml there is
+        passed explicitly.
+        
+        Returns:
+            List[str]: --project-dir, plus --profiles-dir when the project has one
+        """
+        project_dir = str(self.project_root)
+        args = ["--project-dir", project_dir]
+        if (self.project_root / "profiles.yml").is_file():
+            args += ["--profiles-dir", project_dir]
+        return args
+    
+    def _invoke_dbt(self, dbt_runner: Any, label: str, dbt_command: List[str],
+                    capture_models: bool) -> tuple[bool, List[str], List[str]]:
+        """
+        Execute a dbt run in-process through the dbt Python API.
         
+        Executed models are read from the run results, so no stdout parsing
+        is needed.
+        
+        Unlike the subprocess path, in-process runs have no timeout: dbt
+        can't be interrupted mid-run without leaving its adapter connections
+        and threads in an unknown state, so the call lasts as long as the run.
+        
+        Args:
+            dbt_runner: dbtRunner instance
+            label: Pipelines being executed, for log messages
+            dbt_command: dbt command line, starting with the executable
+            capture_models: Whether to capture executed model names
+        
+        Returns:
+            tuple: (success: bool, models_executed: List[str], error_lines: List[str])
+        """
+        dbt_args = dbt_command[1:] + self._project_args()
+        
+        try:
+            with _pooled_adapters():
+                res = dbt_runner.invoke(dbt_args)
         except Exception as e:
-            logger.warning(f"Error retrieving dbt version: {str(e)}")
-            return None
+            error_msg = f"Error executing dbt for {label}: {str(e)}"
+            logger.error(error_msg)
+            return False, [], [error_msg]
+        
+        models_executed = []
+        error_lines = []
+        
+        for node_result in getattr(res.result, 'results', None) or []:
+            if capture_models:
+                models_executed.append(node_result.node.name)
+            if node_result.status in ("error", "fail"):
+                error_lines.append(f"{node_result.node.name}: {node_result.message}")
+        
+        if res.exception is not None:
+            error_lines.append(str(res.exception))
+        
+        if res.success:
+            logger.info("dbt run succeeded for %s", label)
+        else:
+            logger.error("dbt run failed for %s", label)
+        
+        return res.success, models_executed, error_lines
     
-    def execute_dbt(self, pipeline_id: str, capture_models: bool = False) -> tuple[bool, List[str], List[str]]:
+    def execute_dbt(self, pipeline_id: str, capture_models: bool = False,
+                    isolated: bool = False) -> tuple[bool, List[str], List[str]]:
         """
         Execute a dbt run for a specific pipeline.
         
+        Runs dbt in-process when dbt-core is importable and falls back to
+        the dbt executable otherwise.
+        
         Args:
             pipeline_id: Pipeline identifier to execute
             capture_models: Whether to capture executed model names
+            isolated: Give the run its own target and log directories, so it
+                can run alongside other pipelines of the same project
         
         Returns:
             tuple: (success: bool, models_executed: List[str], stderr_lines: List[str])
         """
-        pipeline_config = self.pipelines_config[pipeline_id]
-        model_selector = pipeline_config.get('models')
-        schema_name = pipeline_config.get('schema')
+        if isolated:
+            return self._exec_fns[pipeline_id](capture_models, extra_args=self._isolation_args(pipeline_id))
+        return self._exec_fns[pipeline_id](capture_models)
+    
+    @staticmethod
+    def _isolation_args(pipeline_id: str) -> List[str]:
+        """
+        Build dbt arguments giving a pipeline's run its own artifacts.
+        
+        Concurrent runs sharing target/ and logs/ overwrite each other's
+        manifest.json, run_results.json and partial_parse.msgpack.
+        
+        Args:
+            pipeline_id: Pipeline identifier
         
+        Returns:
+            List[str]: --target-path and --log-path under the project's defaults
+        """
+        suffix = f"pipeline_{pipeline_id.lower()}"
+        return ["--target-path", f"target/{suffix}", "--log-path", f"logs/{suffix}"]
+    
+    def execute_dbt_combined(self, pipeline_ids: List[str],
+                             capture_models: bool = False) -> tuple[bool, List[str], List[str]]:
+        """
+        Execute several pipelines with a single dbt run.
+        
+        The pipelines' selectors are combined into one --select, so dbt parses
+        the manifest and compiles the graph once and orders the models itself
+        through their ref() dependencies.
+        
+        The run is reported as a whole: captured models cover every selected
+        pipeline, not only the last one, and a failure can't be attributed to
+        a single pipeline. The timeout is DBT_TIMEOUT_SECONDS per pipeline.
+        
+        Args:
+            pipeline_ids: Pipeline identifiers to execute
+            capture_models: Whether to capture executed model names
+        
+        Returns:
+            tuple: (success: bool, models_executed: List[str], stderr_lines: List[str])
+        """
+        model_selector = " ".join(self.pipelines_config[pipeline_id].get('models') for pipeline_id in pipeline_ids)
         dbt_command = ["dbt", "run", "--select", model_selector]
+        return self._run_dbt(f"pipelines {', '.join(pipeline_ids)}", dbt_command, None, capture_models,
+                             timeout=DBT_TIMEOUT_SECONDS * len(pipeline_ids))
+    
+    def _run_dbt(self, label: str, dbt_command: List[str], schema_name: Optional[str],
+                 capture_models: bool, timeout: float = DBT_TIMEOUT_SECONDS,
+                 extra_args: Iterable[str] = ()) -> tuple[bool, List[str], List[str]]:
+        """
+        Run a dbt command, in-process or as a subprocess.
+        
+        Args:
+            label: Pipelines being executed, for log messages
+            dbt_command: dbt command line, starting with the executable
+            schema_name: Target schema to log, if the run has a single one
+            capture_models: Whether to capture executed model names
+            timeout: Seconds the subprocess may run before it is killed
+            extra_args: Arguments appended to dbt_command
         
-        logger.info(f"Executing pipeline {pipeline_id}: {' '.join(dbt_command)}")
-        logger.info(f"Target schema: {schema_name}")
+        Returns:
+            tuple: (success: bool, models_executed: List[str], stderr_lines: List[str])
+        """
+        dbt_command = dbt_command + list(extra_args)
+        logger.info("Executing %s: %s", label, " ".join(dbt_command))
+        if schema_name is not None:
+            logger.info("Target schema: %s", schema_name)
+        
+        dbt_runner = self._get_dbt_runner()
+        if dbt_runner is not None:
+            return self._invoke_dbt(dbt_runner, label, dbt_command, capture_models)
+        
+        models_executed = []
+        stderr_lines = []
         
         try:
-            result = subprocess.run(
-                dbt_command,
-                cwd=self.project_root,
-                capture_output=True,
+            # The project is passed by argument rather than cwd, and fds are
+            # left alone (Python's own are non-inheritable anyway), so
+            # subprocess can use posix_spawn instead of fork + exec
+            with subprocess.Popen(
+                [_dbt_executable()] + dbt_command[1:] + self._project_args(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=600  # 10 minute timeout
-            )
-            
-            # Capture stderr for debugging
-            stderr_lines = result.stderr.split('\n') if result.stderr else []
+                bufsize=1,
+                close_fds=False
+            ) as process:
+                # Model names are parsed while dbt is still running; stderr is
+                # drained alongside so neither pipe can fill up and block dbt
+                readers = [
+                    threading.Thread(
+                        target=_collect_model_names,
+                        args=(process.stdout, models_executed if capture_models else None),
+                        daemon=True
+                    ),
+                    threading.Thread(
+                        target=_collect_lines,
+                        args=(process.stderr, stderr_lines),
+                        daemon=True
+                    ),
+                ]
+                for reader in readers:
+                    reader.start()
+                
+                try:
+                    returncode = process.wait(timeout=timeout)
+                finally:
+                    if process.returncode is None:
+                        process.kill()
+                    for reader in readers:
+                        reader.join()
             
-            # Parse stdout to extract model names if requested
-            models_executed = []
-            if capture_models and result.stdout:
-                models_executed = self._parse_dbt_output(result.stdout)
+            if models_executed:
+                logger.info("Extracted %d model names from dbt output", len(models_executed))
             
-            if result.returncode == 0:
-                logger.info(f"Pipeline {pipeline_id} executed successfully")
+            if returncode == 0:
+                logger.info("dbt run succeeded for %s", label)
                 return True, models_executed, stderr_lines
             else:
-                error_msg = f"dbt run failed for pipeline {pipeline_id}"
+                error_msg = f"dbt run failed for {label}"
                 logger.error(error_msg)
-                logger.error(f"stderr: {result.stderr}")
+                logger.error("stderr: %s", "\n".join(stderr_lines))
                 return False, models_executed, stderr_lines
         
         except subprocess.TimeoutExpired:
-            error_msg = f"dbt execution for pipeline {pipeline_id} timed out"
+            error_msg = f"dbt execution for {label} timed out"
             logger.error(error_msg)
-            return False, [], []
+            return False, [], [error_msg]
         except Exception as e:
-            error_msg = f"Error executing dbt for pipeline {pipeline_id}: {str(e)}"
+            error_msg = f"Error executing dbt for {label}: {str(e)}"
             logger.error(error_msg)
-            return False, [], []
+            return False, [], [error_msg]
     
-    def _parse_dbt_output(self, dbt_output: str) -> List[str]:
+    def _execute_level(self, level: List[str]) -> Dict[str, tuple[bool, List[str], List[str]]]:
         """
-        Parse dbt stdout to extract executed model names.
+        Execute the pipelines of one dependency level.
         
-        dbt output format includes lines like:
-        - "1 of 5 START sql view model schema.model_name"
-        - "1 of 5 OK created sql view model schema.model_name"
+        Levels run serially and stop at the first failure unless
+        pipelines.yaml sets max_parallel above 1. Pipelines in a level don't
+        depend on each other, so dbt subprocesses for them may then run
+        concurrently, each with its own target and log directories. Their
+        selectors must not share upstream models, or those models are built
+        by several runs at once. The in-process dbt runner doesn't support
+        concurrent invocations, so with it the level always runs serially.
         
         Args:
-            dbt_output: stdout from dbt run
+            level: Pipeline IDs with no dependencies among them
         
         Returns:
-            List[str]: List of executed model names
+            Dict mapping each executed pipeline ID, in level order, to its
+            execute_dbt result
         """
-        models = []
-        
-        for line in dbt_output.split('\n'):
-            # Look for lines with model execution info
-            if 'sql view model' in line or 'sql table model' in line or 'sql model' in line:
-                # Try to extract model name (appears after the last dot before status)
-                parts = line.split()
-                for i, part in enumerate(parts):
-                    # Look for qualified model name pattern (schema.model_name)
-                    if '.' in part and not part.startswith('('):
-                        # Extract just the model name (after the last dot)
-                        model_name = part.split('.')[-1]
-                        if model_name and model_name not in models:
-                            models.append(model_name)
-                            break
-        
-        if models:
-            logger.info(f"Extracted {len(models)} model names from dbt output")
+        results = {}
+        max_workers = min(len(level), self.config.get('max_parallel', DEFAULT_MAX_PARALLEL))
+        
+        if max_workers <= 1 or self._get_dbt_runner() is not None:
+            for pipeline_id in level:
+                # Models are only captured for the target pipeline
+                results[pipeline_id] = self.execute_dbt(
+                    pipeline_id,
+                    capture_models=(pipeline_id == self.pipeline_id)
+                )
+                if not results[pipeline_id][0]:
+                    break
+            return results
+        
+        logger.info("Executing pipelines %s with up to %d in parallel", level, max_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.execute_dbt, pipeline_id, pipeline_id == self.pipeline_id, True): pipeline_id
+                for pipeline_id in level
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return {pipeline_id: results[pipeline_id] for pipeline_id in level}
+    
+    def _record_failure(self, label: str, stderr_lines: List[str]) -> None:
+        """
+        Add a failed dbt run and its output to the execution errors.
         
-        return models
+        Args:
+            label: Pipelines that failed
+            stderr_lines: Error output from the dbt run; only the last
+                MAX_STDERR_LINES lines are kept
+        """
+        error_msg = f"Execution failed for {label}"
+        logger.error(error_msg)
+        errors = self.execution_results["errors"]
+        errors.append(error_msg)
+        
+        # The end of dbt's output holds the error; keep only that
+        if len(stderr_lines) > MAX_STDERR_LINES:
+            errors.append(f"[truncated {len(stderr_lines) - MAX_STDERR_LINES} earlier lines]")
+        errors.extend(line.rstrip() for line in stderr_lines[-MAX_STDERR_LINES:])
     
     def run(self) -> Dict[str, Any]:
         """
@@ -310,59 +782,66 @@ class PipelineRunner:
             - success: Boolean success status
             - errors: List of error messages
         """
-        logger.info(f"Starting pipeline execution for {self.pipeline_id}")
+        logger.info("Starting pipeline execution for %s", self.pipeline_id)
         
-        # Record start time
-        self.execution_results["execution_start"] = datetime.now().isoformat() + "Z"
+        self.execution_results["execution_start"] = _utc_timestamp(time.time_ns())
+        try:
+            self._run_pipelines()
+        finally:
+            self.execution_results["execution_end"] = _utc_timestamp(time.time_ns())
         
+        return self.execution_results
+    
+    def _run_pipelines(self) -> None:
+        """Load the configuration and execute the dependency chain, recording results."""
         # Load configuration
         if not self.load_config():
-            self.execution_results["execution_end"] = datetime.now().isoformat() + "Z"
-            return self.execution_results
+            return
         
         # Get dbt version
         dbt_version = self.get_dbt_version()
         if dbt_version:
             self.execution_results["dbt_version"] = dbt_version
-            logger.info(f"dbt version: {dbt_version}")
+            logger.info("dbt version: %s", dbt_version)
         
         # Resolve dependencies
         execution_order = self.resolve_dependencies()
         
-        # Execute each pipeline in order
         dependency_ids = execution_order[:-1]  # All except the last (target pipeline)
         self.execution_results["dependencies_executed"] = dependency_ids
         
-        for i, pipeline_id in enumerate(execution_order):
-            is_target_pipeline = (pipeline_id == self.pipeline_id)
-            
-            # Execute without metrics capture for dependencies
-            success, models, stderr_lines = self.execute_dbt(
-                pipeline_id,
-                capture_models=is_target_pipeline
-            )
-            
-            if is_target_pipeline:
-                # Store results for target pipeline
-                self.execution_results["models_executed"] = models
+        if len(execution_order) > 1 and self.config.get('single_invocation', False):
+            # One dbt run for the whole chain; dbt orders the models itself,
+            # but models and failures are reported for the chain as a whole
+            success, models, stderr_lines = self.execute_dbt_combined(execution_order, capture_models=True)
+            self.execution_results["models_executed"] = models
             
             if not success:
-                error_msg = f"Execution failed for pipeline {pipeline_id}"
-                logger.error(error_msg)
-                self.execution_results["errors"].append(error_msg)
-                if stderr_lines:
-                    self.execution_results["errors"].extend(stderr_lines)
-                self.execution_results["execution_end"] = datetime.now().isoformat() + "Z"
-                return self.execution_results
+                self._record_failure(f"pipelines {', '.join(execution_order)}", stderr_lines)
+                return
+        else:
+            # Execute each dependency level in order
+            for level in self.resolve_dependency_levels():
+                failed = False
+                
+                for pipeline_id, (success, models, stderr_lines) in self._execute_level(level).items():
+                    if pipeline_id == self.pipeline_id:
+                        # Store results for target pipeline
+                        self.execution_results["models_executed"] = models
+                    
+                    if not success:
+                        self._record_failure(f"pipeline {pipeline_id}", stderr_lines)
+                        failed = True
+                
+                if failed:
+                    return
         
         # All pipelines executed successfully
         self.execution_results["success"] = True
-        self.execution_results["execution_end"] = datetime.now().isoformat() + "Z"
-        
-        logger.info(f"Pipeline {self.pipeline_id} execution completed successfully")
-        logger.info(f"Execution took {len(execution_order)} pipeline(s) and {len(self.execution_results['models_executed'])} models")
         
-        return self.execution_results
+        logger.info("Pipeline %s execution completed successfully", self.pipeline_id)
+        logger.info("Execution took %d pipeline(s) and %d models",
+                    len(execution_order), len(self.execution_results['models_executed']))
 
 
 def main():
@@ -377,6 +856,13 @@ def main():
         config_path: Optional path to pipelines.yaml
         project_root: Optional path to dbt project root
     """
+    # Configured here rather than at import so embedding processes keep
+    # control of their own logging setup
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     if len(sys.argv) < 2:
         print("Usage: python dbt_runner.py <pipeline_id> [config_path] [project_root]")
         print("Example: python dbt_runner.py C")
@@ -390,11 +876,13 @@ def main():
     results = runner.run()
     
     # Print results as structured output
-    import json
     print("\n" + "="*60)
     print("EXECUTION RESULTS")
     print("="*60)
-    print(json.dumps(results, indent=2))
+    # Encoded straight to bytes; skips building an intermediate str
+    sys.stdout.flush()
+    sys.stdout.buffer.write(json_dumps(results, indent=True) + b"\n")
+    sys.stdout.buffer.flush()
     
     # Exit with appropriate code
     sys.exit(0 if results["success"] else 1)
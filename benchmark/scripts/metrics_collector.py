@@ -7,15 +7,30 @@ Includes retry logic for ACCOUNT_USAGE views with up to 45-minute latency.
 """
 
 import snowflake.connector
-import json
+import atexit
+import hashlib
 import logging
+import queue
+import sqlite3
+import threading
 import time
 import re
 import os
-from typing import Dict, List, Optional, Any
+from decimal import Decimal
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-import yaml
+
+from .serialization import json_dumps, json_loads, yaml_load
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 
 # Configure logging
@@ -25,6 +40,297 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Metrics are only looked up for queries that started this recently
+DEFAULT_HISTORY_WINDOW_HOURS = 24
+
+# Query IDs are bound as one JSON array parameter and expanded server-side,
+# so the SQL text doesn't change with the IDs and its compiled plan is reused
+_QUERY_ID_LIST = "SELECT VALUE::STRING FROM TABLE(FLATTEN(input => PARSE_JSON(?)))"
+
+# Lower bound on START_TIME so query history scans prune to recent
+# micro-partitions; binds the window length in hours
+_HISTORY_WINDOW_START = "DATEADD(hour, -?, CURRENT_TIMESTAMP())"
+
+_PROFILE_QUERY = "SELECT SYSTEM$GET_QUERY_PROFILE(?)"
+
+# dbt query comment, e.g. /* {"app": "dbt", "node_id": "model.project.name"} */,
+# for scanning NUL-joined query texts in one pass; matches never span two texts
+_NODE_ID_BATCH_RE = re.compile(r'/\*\s*(\{[^}\x00]*"node_id"[^}\x00]*\})\s*\*/')
+_ENV_VAR_RE = re.compile(r'\{\{\s*env_var\([\'"](\w+)[\'"]\)\s*\}\}')
+
+
+# Metric keys and the result columns they're read from
+_BASIC_FIELDS = (
+    ('execution_time_ms', 'EXECUTION_TIME_MS'),
+    ('compilation_time_ms', 'COMPILATION_TIME_MS'),
+    ('bytes_scanned', 'BYTES_SCANNED'),
+    ('rows_scanned', 'ROWS_SCANNED'),
+    ('partitions_scanned', 'PARTITIONS_SCANNED'),
+    ('partitions_total', 'PARTITIONS_TOTAL'),
+    ('query_text', 'QUERY_TEXT'),
+)
+
+_CREDIT_FIELDS = (
+    ('warehouse_credits', 'WAREHOUSE_CREDITS'),
+    ('spilling_to_local_storage_bytes', 'SPILLING_TO_LOCAL_STORAGE_BYTES'),
+    ('spilling_to_remote_storage_bytes', 'SPILLING_TO_REMOTE_STORAGE_BYTES'),
+)
+
+
+def _field_positions(columns: List[str],
+                     fields: Tuple[Tuple[str, str], ...]) -> Tuple[int, List[Tuple[str, int]]]:
+    """
+    Resolve result column names to row positions.
+    
+    Args:
+        columns: Column names of the result
+        fields: Pairs of (metric key, column name)
+    
+    Returns:
+        Tuple of (QUERY_ID position, list of (metric key, position))
+    """
+    positions = {column: pos for pos, column in enumerate(columns)}
+    return positions['QUERY_ID'], [(key, positions[column]) for key, column in fields]
+
+
+def _query_id_params(query_ids: List[str]) -> Tuple[str]:
+    """Build the bind parameters for a query filtered by _QUERY_ID_LIST."""
+    return (json_dumps(list(query_ids)).decode("utf-8"),)
+
+
+class _ConnectionPool:
+    """
+    Process-wide pool of authenticated Snowflake connections.
+    
+    Connections are grouped by their connect() arguments, so collectors with
+    different credentials or targets never share a session. Released
+    connections are kept open for the next collector, skipping the TLS
+    handshake and login round trip.
+    
+    Attributes:
+        max_size: Maximum number of idle connections kept per connection key
+    """
+    
+    def __init__(self, max_size: int = 10, **session_options: Any):
+        self.max_size = max_size
+        self._session_options = session_options
+        self._idle: Dict[Tuple, queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+    
+    def _queue(self, key: Tuple) -> queue.LifoQueue:
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue(maxsize=self.max_size)
+            return self._idle[key]
+    
+    def acquire(self, **connect_kwargs: Any) -> Tuple[Tuple, Any]:
+        """
+        Take an idle connection for the given arguments, opening one if none is free.
+        
+        Returns:
+            Tuple of (pool key, connection); pass both back to release()
+        """
+        key = tuple(sorted(connect_kwargs.items()))
+        idle = self._queue(key)
+        
+        while True:
+            try:
+                connection = idle.get_nowait()
+            except queue.Empty:
+                break
+            if not connection.is_closed():
+                return key, connection
+        
+        connection = snowflake.connector.connect(**connect_kwargs, **self._session_options)
+        return key, connection
+    
+    def release(self, key: Tuple, connection: Any) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        if connection.is_closed():
+            return
+        try:
+            self._queue(key).put_nowait(connection)
+        except queue.Full:
+            connection.close()
+    
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            queues = list(self._idle.values())
+            self._idle.clear()
+        
+        for idle in queues:
+            while True:
+                try:
+                    connection = idle.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    connection.close()
+                except Exception as e:
+                    logger.warning(f"Error closing pooled connection: {str(e)}")
+
+
+class _ProfileCache:
+    """
+    On-disk cache of parsed query profile metrics, keyed by query ID.
+    
+    A completed query's profile never changes, so entries don't expire.
+    The database is opened on first use; if it can't be opened the cache
+    disables itself and every lookup misses.
+    
+    Attributes:
+        path: Location of the SQLite database
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+    
+    def _open(self) -> Optional[sqlite3.Connection]:
+        if self._db is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(str(self.path), check_same_thread=False)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS profiles "
+                    "(query_id TEXT PRIMARY KEY, payload TEXT NOT NULL)"
+                )
+                self._db = db
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Query profile cache unavailable at {self.path}: {str(e)}")
+                self._disabled = True
+        return self._db
+    
+    def get_many(self, query_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up cached profile metrics.
+        
+        Args:
+            query_ids: Query IDs to look up
+        
+        Returns:
+            Dict mapping each cached query_id to its profile metrics
+        """
+        cached: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            db = self._open()
+            if db is None or not query_ids:
+                return cached
+            
+            try:
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(query_ids), 500):
+                    chunk = query_ids[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows = db.execute(
+                        f"SELECT query_id, payload FROM profiles WHERE query_id IN ({placeholders})",
+                        chunk
+                    )
+                    for query_id, payload in rows:
+                        cached[query_id] = json_loads(payload)
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning(f"Error reading query profile cache: {str(e)}")
+        
+        return cached
+    
+    def put_many(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Store profile metrics in a single transaction.
+        
+        Args:
+            entries: Dict mapping query_id to profile metrics
+        """
+        with self._lock:
+            db = self._open()
+            if db is None or not entries:
+                return
+            
+            try:
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO profiles (query_id, payload) VALUES (?, ?)",
+                        [(query_id, json_dumps(metrics).decode("utf-8"))
+                         for query_id, metrics in entries.items()]
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Error writing query profile cache: {str(e)}")
+    
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+PROFILE_CACHE_PATH = Path.home() / ".dbt_benchmark" / "profile_cache.sqlite"
+
+METRICS_CACHE_DIR = Path.home() / ".dbt_benchmark" / "metrics_cache"
+METRICS_CACHE_TTL_SECONDS = 3600
+
+_PROFILE_CACHE = _ProfileCache(PROFILE_CACHE_PATH)
+atexit.register(_PROFILE_CACHE.close)
+
+
+def _metrics_cache_path(query_ids: List[str]) -> Path:
+    """Cache file for collect_metrics output, keyed by the set of query IDs."""
+    key = hashlib.blake2b(','.join(sorted(set(query_ids))).encode('utf-8'), digest_size=16)
+    return METRICS_CACHE_DIR / f"{key.hexdigest()}.json"
+
+
+def _read_metrics_cache(path: Path, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Read cached collect_metrics output.
+    
+    Args:
+        path: Cache file
+        max_age: Maximum age in seconds, or None to accept any age
+    
+    Returns:
+        Cached metrics, or None if missing, too old or unreadable
+    """
+    try:
+        if max_age is not None and path.stat().st_mtime <= time.time() - max_age:
+            return None
+        return json_loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable metrics cache {path}: {str(e)}")
+        return None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode values JSON can't represent, such as NUMBER columns fetched as Decimal."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _write_metrics_cache(path: Path, metrics: Dict[str, Any]) -> None:
+    """Atomically write collect_metrics output to its cache file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(json_dumps(metrics, default=_json_default))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Could not write metrics cache {path}: {str(e)}")
+
+
+# Session settings are applied once when a pooled connection is opened rather
+# than with ALTER SESSION on every checkout
+_POOL = _ConnectionPool(
+    max_size=10,
+    # Server-side binding keeps the SQL text identical across calls
+    paramstyle='qmark',
+    session_parameters={'QUERY_TAG': 'metrics_collector'},
+)
+atexit.register(_POOL.close_all)
+
 
 class MetricsCollector:
     """
@@ -49,9 +355,12 @@ class MetricsCollector:
         
         self.config_path = Path(config_path)
         self.connection = None
+        self._pool_key = None
+        self._idle_cursors: queue.LifoQueue = queue.LifoQueue()
         self.database = None
         self.warehouse = None
         self.config = None
+        self.history_window_hours = DEFAULT_HISTORY_WINDOW_HOURS
         
         # Load configuration and establish connection
         self._load_config()
@@ -72,8 +381,8 @@ class MetricsCollector:
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
             
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            with open(self.config_path, 'rb') as f:
+                config = yaml_load(f.read())
             
             if not config or 'snowflake' not in config:
                 error_msg = "Invalid configuration: 'snowflake' key not found"
@@ -83,6 +392,9 @@ class MetricsCollector:
             self.config = config['snowflake']
             self.database = self.config.get('database')
             self.warehouse = self.config.get('warehouse')
+            self.history_window_hours = int(
+                self.config.get('query_history_window_hours', DEFAULT_HISTORY_WINDOW_HOURS)
+            )
             
             logger.info(f"Configuration loaded: database={self.database}, warehouse={self.warehouse}")
             return True
@@ -103,8 +415,7 @@ class MetricsCollector:
         Returns:
             str: Resolved value
         """
-        pattern = r'\{\{\s*env_var\([\'"](\w+)[\'"]\)\s*\}\}'
-        match = re.match(pattern, value)
+        match = _ENV_VAR_RE.match(value)
         
         if match:
             var_name = match.group(1)
@@ -119,6 +430,9 @@ class MetricsCollector:
         """
         Establish Snowflake connection using config credentials.
         
+        Reuses an idle pooled connection opened with the same credentials
+        when one is available.
+        
         Returns:
             bool: True if connection successful, False otherwise
         """
@@ -129,7 +443,7 @@ class MetricsCollector:
             user = self._resolve_env_var(self.config.get('user'))
             password = self._resolve_env_var(self.config.get('password'))
             
-            self.connection = snowflake.connector.connect(
+            self._pool_key, self.connection = _POOL.acquire(
                 account=account,
                 user=user,
                 password=password,
@@ -145,31 +459,65 @@ class MetricsCollector:
             logger.error(f"Error connecting to Snowflake: {str(e)}")
             raise
     
-    def _execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    @contextmanager
+    def _cursor(self):
+        """
+        Borrow a cursor on the connection for the duration of a with block.
+        
+        Cursors are kept open and reused across queries instead of being
+        created and closed each time. Each borrower gets a cursor to itself,
+        so queries running on different threads never share one.
+        
+        Yields:
+            Snowflake cursor
+        """
+        try:
+            cursor = self._idle_cursors.get_nowait()
+        except queue.Empty:
+            cursor = self.connection.cursor()
+        
+        try:
+            yield cursor
+        finally:
+            self._idle_cursors.put(cursor)
+    
+    def _execute_query(self, query: str, params: Optional[Tuple[Any, ...]] = None) -> Tuple[List[str], List[Tuple[Any, ...]]]:
         """
         Execute a query against Snowflake.
         
+        Rows are returned as plain tuples; callers map column names to
+        positions once per result rather than building a dict per row. When
+        pyarrow is installed, Arrow result sets are decoded in bulk instead
+        of converting each row through Python.
+        
         Args:
             query: SQL query to execute
-            params: Optional query parameters
+            params: Optional values for the query's ? placeholders
         
         Returns:
-            List[Dict]: Query results as list of dictionaries
+            Tuple of (column names, rows as tuples)
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            
-            # Fetch column names
-            columns = [desc[0] for desc in cursor.description]
-            
-            # Fetch all rows and convert to dicts
-            rows = []
-            for row in cursor.fetchall():
-                rows.append(dict(zip(columns, row)))
+            with self._cursor() as cursor:
+                cursor.execute(query, params)
+                
+                # Fetch column names
+                columns = [desc[0] for desc in cursor.description]
+                
+                rows = None
+                if pyarrow is not None:
+                    try:
+                        table = cursor.fetch_arrow_all()
+                        rows = (list(zip(*(column.to_pylist() for column in table.columns)))
+                                if table is not None else [])
+                    except snowflake.connector.NotSupportedError:
+                        # Result wasn't returned in Arrow format
+                        pass
+                
+                if rows is None:
+                    rows = cursor.fetchall()
             
-            cursor.close()
-            return rows
+            return columns, rows
         
         except Exception as e:
             logger.error(f"Error executing query: {str(e)}")
@@ -207,24 +555,18 @@ class MetricsCollector:
             QUERY_TEXT
         FROM INFORMATION_SCHEMA.QUERY_HISTORY
         WHERE QUERY_ID IN ({})
+            AND START_TIME >= {}
         ORDER BY START_TIME DESC
-        """.format(','.join(f"'{qid}'" for qid in query_ids))
+        """.format(_QUERY_ID_LIST, _HISTORY_WINDOW_START)
+        params = _query_id_params(query_ids) + (self.history_window_hours,)
         
         try:
-            results = self._execute_query(query)
+            columns, rows = self._execute_query(query, params)
+            query_id_pos, basic_pos = _field_positions(columns, _BASIC_FIELDS)
             metrics_dict = {}
             
-            for row in results:
-                query_id = row['QUERY_ID']
-                metrics_dict[query_id] = {
-                    'execution_time_ms': row['EXECUTION_TIME_MS'],
-                    'compilation_time_ms': row['COMPILATION_TIME_MS'],
-                    'bytes_scanned': row['BYTES_SCANNED'],
-                    'rows_scanned': row['ROWS_SCANNED'],
-                    'partitions_scanned': row['PARTITIONS_SCANNED'],
-                    'partitions_total': row['PARTITIONS_TOTAL'],
-                    'query_text': row['QUERY_TEXT']
-                }
+            for row in rows:
+                metrics_dict[row[query_id_pos]] = {key: row[pos] for key, pos in basic_pos}
             
             logger.info(f"Extracted basic metrics for {len(metrics_dict)} queries")
             return metrics_dict
@@ -233,15 +575,84 @@ class MetricsCollector:
             logger.error(f"Error extracting basic metrics: {str(e)}")
             raise
     
-    def _get_credit_metrics(self, query_ids: List[str], max_retries: int = 3) -> Dict[str, Dict[str, Any]]:
+    def _get_combined_metrics(self, query_ids: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Extract basic and credit metrics with a single query.
+        
+        INFORMATION_SCHEMA.QUERY_HISTORY is left-joined to
+        ACCOUNT_USAGE.QUERY_HISTORY, so both metric sets cost one round-trip.
+        Queries that haven't reached ACCOUNT_USAGE yet get no credit entry;
+        the caller retries those with _get_credit_metrics.
+        
+        Args:
+            query_ids: List of query IDs to extract metrics for
+        
+        Returns:
+            Tuple of (basic metrics, credit metrics), each mapping query_id to metrics
+        """
+        logger.info(f"Extracting combined metrics for {len(query_ids)} queries")
+        
+        query = """
+        SELECT
+            ih.QUERY_ID,
+            ih.TOTAL_ELAPSED_TIME as execution_time_ms,
+            ih.COMPILATION_TIME as compilation_time_ms,
+            ih.BYTES_SCANNED as bytes_scanned,
+            ih.ROWS_PRODUCED as rows_scanned,
+            ih.PARTITIONS_SCANNED as partitions_scanned,
+            ih.PARTITIONS_TOTAL as partitions_total,
+            ih.QUERY_TEXT,
+            au.QUERY_ID as account_usage_query_id,
+            au.CREDITS_USED_CLOUD_SERVICES as warehouse_credits,
+            au.BYTES_SPILLED_TO_LOCAL_STORAGE as spilling_to_local_storage_bytes,
+            au.BYTES_SPILLED_TO_REMOTE_STORAGE as spilling_to_remote_storage_bytes
+        FROM INFORMATION_SCHEMA.QUERY_HISTORY ih
+        LEFT JOIN SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY au
+            ON au.QUERY_ID = ih.QUERY_ID
+            AND au.START_TIME >= {window}
+        WHERE ih.QUERY_ID IN ({ids})
+            AND ih.START_TIME >= {window}
+        ORDER BY ih.START_TIME DESC
+        """.format(ids=_QUERY_ID_LIST, window=_HISTORY_WINDOW_START)
+        # Placeholders in textual order: join window, query IDs, where window
+        params = (
+            (self.history_window_hours,)
+            + _query_id_params(query_ids)
+            + (self.history_window_hours,)
+        )
+        
+        columns, rows = self._execute_query(query, params)
+        query_id_pos, basic_pos = _field_positions(columns, _BASIC_FIELDS)
+        _, credit_pos = _field_positions(columns, _CREDIT_FIELDS)
+        account_usage_pos = columns.index('ACCOUNT_USAGE_QUERY_ID')
+        basic_metrics = {}
+        credit_metrics = {}
+        
+        for row in rows:
+            query_id = row[query_id_pos]
+            basic_metrics[query_id] = {key: row[pos] for key, pos in basic_pos}
+            
+            if row[account_usage_pos] is not None:
+                credit_metrics[query_id] = {key: row[pos] for key, pos in credit_pos}
+        
+        logger.info(f"Extracted basic metrics for {len(basic_metrics)} and credit metrics for {len(credit_metrics)} queries")
+        return basic_metrics, credit_metrics
+    
+    def _get_credit_metrics(self, query_ids: List[str], max_retries: int = 3,
+                            first_attempt: int = 0) -> Dict[str, Dict[str, Any]]:
         """
         Extract credit metrics from ACCOUNT_USAGE.QUERY_HISTORY with retry logic.
         
-        ACCOUNT_USAGE has 45-minute latency, so implements exponential backoff.
+        ACCOUNT_USAGE has up to 45-minute latency, so queries whose rows
+        haven't landed yet are retried with capped exponential backoff. Each
+        retry only asks for the IDs still missing; when every ID is found the
+        method returns without waiting.
         
         Args:
             query_ids: List of query IDs to extract metrics for
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts
+            first_attempt: Number of attempts already made by the caller; a
+                non-zero value backs off before the first query
         
         Returns:
             Dict mapping query_id to credit metrics
@@ -256,62 +667,134 @@ class MetricsCollector:
             BYTES_SPILLED_TO_REMOTE_STORAGE as spilling_to_remote_storage_bytes
         FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY
         WHERE QUERY_ID IN ({})
+            AND START_TIME >= {}
         ORDER BY START_TIME DESC
-        """.format(','.join(f"'{qid}'" for qid in query_ids))
+        """.format(_QUERY_ID_LIST, _HISTORY_WINDOW_START)
         
         metrics_dict = {}
-        
-        for attempt in range(max_retries):
+        missing = list(dict.fromkeys(query_ids))
+        reason = f"{len(missing)} queries not yet in ACCOUNT_USAGE"
+        
+        for attempt in range(first_attempt, max_retries):
+            if attempt > 0:
+                # Exponential backoff from 60s, capped at 5 minutes
+                wait_time = min(60 * 2 ** (attempt - 1), 300)
+                logger.warning(f"{reason}. Retrying in {wait_time}s...")
+                time.sleep(wait_time)
+            
             try:
-                results = self._execute_query(query)
+                columns, rows = self._execute_query(
+                    query, _query_id_params(missing) + (self.history_window_hours,)
+                )
+                query_id_pos, credit_pos = _field_positions(columns, _CREDIT_FIELDS)
                 
-                for row in results:
-                    query_id = row['QUERY_ID']
-                    metrics_dict[query_id] = {
-                        'warehouse_credits': row['WAREHOUSE_CREDITS'],
-                        'spilling_to_local_storage_bytes': row['SPILLING_TO_LOCAL_STORAGE_BYTES'],
-                        'spilling_to_remote_storage_bytes': row['SPILLING_TO_REMOTE_STORAGE_BYTES']
-                    }
+                for row in rows:
+                    metrics_dict[row[query_id_pos]] = {key: row[pos] for key, pos in credit_pos}
                 
-                logger.info(f"Extracted credit metrics for {len(metrics_dict)} queries")
-                return metrics_dict
+                missing = [query_id for query_id in missing if query_id not in metrics_dict]
+                if not missing:
+                    logger.info(f"Extracted credit metrics for {len(metrics_dict)} queries")
+                    return metrics_dict
+                
+                reason = f"{len(missing)} queries not yet in ACCOUNT_USAGE"
             
             except Exception as e:
-                if attempt < max_retries - 1:
-                    # Calculate exponential backoff: 2^attempt * 120 seconds
-                    wait_time = (2 ** attempt) * 120
-                    logger.warning(f"Attempt {attempt + 1} failed: {str(e)}. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    # Final attempt failed, log and return empty dict
-                    logger.warning(f"Failed to extract credit metrics after {max_retries} attempts. Continuing without credit data.")
-                    return metrics_dict
+                reason = f"Attempt {attempt + 1} failed: {str(e)}"
         
+        # Final attempt left some queries without data, continue without it
+        logger.warning(
+            f"No credit metrics for {len(missing)} queries after {max_retries} attempts. "
+            f"Continuing without credit data."
+        )
         return metrics_dict
     
-    def _get_query_profile(self, query_id: str) -> Optional[Dict[str, Any]]:
+    def _get_query_profiles_async(self, query_ids: List[str]) -> Dict[str, Optional[str]]:
         """
-        Retrieve detailed query profile using SYSTEM$GET_QUERY_PROFILE.
+        Fetch raw query profiles for many queries in one batch.
+        
+        Every SYSTEM$GET_QUERY_PROFILE call is submitted with execute_async
+        before any result is read, so Snowflake runs them concurrently and
+        the batch costs about one round-trip of latency instead of one per
+        query. Results are read back in submission order; fetching waits for
+        each query to finish.
         
         Args:
-            query_id: Query ID to get profile for
+            query_ids: Query IDs to get profiles for
         
         Returns:
-            Parsed query profile JSON or None if unavailable
+            Dict mapping query_id to the profile JSON string, or None if unavailable
         """
-        try:
-            query = f"SELECT SYSTEM$GET_QUERY_PROFILE('{query_id}')"
-            results = self._execute_query(query)
-            
-            if results and len(results) > 0:
-                profile_json_str = results[0].get('SYSTEM$GET_QUERY_PROFILE(\'{}\')')
-                if profile_json_str:
-                    return json.loads(profile_json_str)
+        profiles: Dict[str, Optional[str]] = {}
+        submitted: Dict[str, str] = {}
+        
+        if not query_ids:
+            return profiles
+        
+        with self._cursor() as cursor:
+            for query_id in query_ids:
+                try:
+                    cursor.execute_async(_PROFILE_QUERY, (query_id,))
+                    submitted[query_id] = cursor.sfqid
+                except Exception as e:
+                    logger.warning(f"Error submitting query profile request for {query_id}: {str(e)}")
+                    profiles[query_id] = None
             
+            for query_id, sfqid in submitted.items():
+                try:
+                    cursor.get_results_from_sfqid(sfqid)
+                    profiles[query_id] = self._fetch_scalar(cursor)
+                except Exception as e:
+                    logger.warning(f"Error retrieving query profile for {query_id}: {str(e)}")
+                    profiles[query_id] = None
+        
+        logger.info(f"Retrieved {sum(p is not None for p in profiles.values())} of {len(query_ids)} query profiles")
+        return profiles
+    
+    def _fetch_scalar(self, cursor: Any) -> Any:
+        """
+        Read the first column of the first row of a cursor's result.
+        
+        Profiles for complex plans can run to several MB, so with pyarrow the
+        result is read one Arrow batch at a time and only the batch holding
+        the value is decoded, rather than buffering the whole result first.
+        
+        Args:
+            cursor: Cursor with an executed single-column query
+        
+        Returns:
+            The value, or None if the query returned no rows
+        """
+        if pyarrow is not None:
+            try:
+                for batch in cursor.fetch_arrow_batches():
+                    if batch.num_rows:
+                        return batch.column(0)[0].as_py()
+                return None
+            except snowflake.connector.NotSupportedError:
+                # Result wasn't returned in Arrow format
+                pass
+        
+        row = cursor.fetchone()
+        return row[0] if row else None
+    
+    def _decode_query_profile(self, query_id: str, profile_json_str: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Decode a query profile JSON string.
+        
+        Args:
+            query_id: Query ID the profile belongs to, for log messages
+            profile_json_str: Profile JSON returned by SYSTEM$GET_QUERY_PROFILE
+        
+        Returns:
+            Parsed query profile or None if missing or malformed
+        """
+        if not profile_json_str:
             return None
         
-        except Exception as e:
-            logger.warning(f"Error retrieving query profile for {query_id}: {str(e)}")
+        try:
+            return json_loads(profile_json_str)
+        except ValueError as e:
+            logger.warning(f"Error parsing query profile for {query_id}: {str(e)}")
             return None
     
     def _parse_query_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
@@ -345,14 +828,15 @@ class MetricsCollector:
             
             operators = data['plan']['operators']
             
-            # Count joins and window functions
-            for operator in operators:
-                operator_type = operator.get('type', '')
-                
+            # Count joins and window functions, testing each distinct
+            # operator type once instead of once per operator
+            type_counts = Counter(operator.get('type', '') for operator in operators)
+            
+            for operator_type, count in type_counts.items():
                 if 'Join' in operator_type:
-                    metrics['join_count'] += 1
+                    metrics['join_count'] += count
                 elif 'WindowFunction' in operator_type:
-                    metrics['window_function_count'] += 1
+                    metrics['window_function_count'] += count
             
             # Calculate subquery depth by analyzing nested references
             # This is determined by the depth property in the plan
@@ -366,43 +850,70 @@ class MetricsCollector:
             logger.warning(f"Error parsing query profile: {str(e)}")
             return metrics
     
-    def _extract_dbt_model_id(self, query_text: str) -> Optional[str]:
+    def _extract_dbt_model_ids(self, query_texts: List[Optional[str]]) -> List[Optional[str]]:
         """
-        Parse dbt model name from query text JSON comment.
+        Parse dbt model names from many query texts in one regex scan.
         
         dbt inserts comments like:
         /* {"app": "dbt", "dbt_version": "1.7.0", "node_id": "model.project.fact_portfolio_performance"} */
         
+        The texts are joined with NUL separators, which the comment pattern
+        can't cross, and scanned once; each match is mapped back to its text
+        by offset. Only the first dbt comment of each text is used.
+        
         Args:
-            query_text: SQL query text
+            query_texts: SQL query texts
         
         Returns:
-            Extracted node_id or None
+            Model name or None for each text, in input order
         """
-        try:
-            # Look for JSON comment at start of query
-            # Pattern: /* {...} */
-            pattern = r'/\*\s*(\{[^}]*"node_id"[^}]*\})\s*\*/'
-            match = re.search(pattern, query_text)
-            
-            if match:
-                json_str = match.group(1)
-                comment_json = json.loads(json_str)
-                node_id = comment_json.get('node_id')
-                
-                if node_id:
-                    # Extract model name from node_id
-                    # Format: model.project.model_name
-                    parts = node_id.split('.')
-                    if len(parts) >= 3:
-                        return '.'.join(parts[-2:])  # Return project.model_name
-                    return node_id
-            
-            return None
+        model_ids: List[Optional[str]] = [None] * len(query_texts)
+        
+        texts = [text or '' for text in query_texts]
+        buffer = '\0'.join(texts)
+        if '"node_id"' not in buffer:
+            return model_ids
+        
+        # Offset at which each text starts within the buffer
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        for match in _NODE_ID_BATCH_RE.finditer(buffer):
+            index = bisect_right(starts, match.start()) - 1
+            if model_ids[index] is not None:
+                continue
+            try:
+                model_ids[index] = self._model_id_from_comment(match.group(1))
+            except Exception as e:
+                logger.debug(f"Error extracting dbt model ID: {str(e)}")
         
-        except Exception as e:
-            logger.debug(f"Error extracting dbt model ID: {str(e)}")
-            return None
+        return model_ids
+    
+    def _model_id_from_comment(self, json_str: str) -> Optional[str]:
+        """
+        Convert a dbt query comment to a project.model_name identifier.
+        
+        Args:
+            json_str: JSON object from the dbt query comment
+        
+        Returns:
+            Model identifier, or None if the comment has no node_id
+        """
+        comment_json = json_loads(json_str)
+        node_id = comment_json.get('node_id')
+        
+        if node_id:
+            # Extract model name from node_id
+            # Format: model.project.model_name
+            parts = node_id.split('.')
+            if len(parts) >= 3:
+                return '.'.join(parts[-2:])  # Return project.model_name
+            return node_id
+        
+        return None
     
     def _calculate_partition_pruning_ratio(self, partitions_scanned: Optional[int], partitions_total: Optional[int]) -> Optional[float]:
         """
@@ -490,28 +1001,105 @@ class MetricsCollector:
                 'pipeline_aggregations': {}
             }
         
-        # Collect metrics from different sources
-        basic_metrics = self._get_basic_metrics(query_ids)
-        credit_metrics = self._get_credit_metrics(query_ids)
+        # Results for the same set of queries are reused for an hour, and any
+        # older result is served if Snowflake can't be queried
+        cache_path = _metrics_cache_path(query_ids)
+        cached = _read_metrics_cache(cache_path, max_age=METRICS_CACHE_TTL_SECONDS)
+        if cached is not None:
+            logger.info(f"Using cached metrics from {cache_path}")
+            cached['pipeline_name'] = pipeline_name
+            return cached
+        
+        try:
+            metrics = self._collect_fresh_metrics(query_ids, pipeline_name)
+        except Exception as e:
+            stale = _read_metrics_cache(cache_path)
+            if stale is None:
+                raise
+            logger.warning(f"Metrics collection failed, using stale cached metrics: {str(e)}")
+            stale['pipeline_name'] = pipeline_name
+            return stale
+        
+        # Don't pin results while ACCOUNT_USAGE is still catching up
+        if all(model['warehouse_credits'] is not None for model in metrics['per_model'].values()):
+            _write_metrics_cache(cache_path, metrics)
+        
+        return metrics
+    
+    def _collect_fresh_metrics(self, query_ids: List[str], pipeline_name: Optional[str]) -> Dict[str, Any]:
+        """
+        Query Snowflake for the metrics returned by collect_metrics.
+        
+        Args:
+            query_ids: Non-empty list of Snowflake query IDs
+            pipeline_name: Optional name for pipeline-level aggregation
+        
+        Returns:
+            Dict with the structure documented on collect_metrics
+        """
+        # Profile metrics are cached on disk by query ID; only misses are
+        # fetched, in one batch, and decoded per model below
+        cached_profiles = _PROFILE_CACHE.get_many(list(dict.fromkeys(query_ids)))
+        missing_profiles = [
+            query_id for query_id in dict.fromkeys(query_ids) if query_id not in cached_profiles
+        ]
+        
+        # The profile batch and the metrics query are independent round-trips,
+        # so they run concurrently on separate cursors of the shared connection
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            profiles_future = executor.submit(self._get_query_profiles_async, missing_profiles)
+            metrics_future = executor.submit(self._get_combined_metrics, query_ids)
+            
+            # Collect basic and credit metrics in one round-trip; querying the
+            # sources separately remains the fallback, e.g. without access to
+            # SNOWFLAKE.ACCOUNT_USAGE, where credit metrics are optional
+            try:
+                basic_metrics, credit_metrics = metrics_future.result()
+                
+                # The joined query counts as the first attempt; queries whose
+                # ACCOUNT_USAGE rows haven't landed yet get the usual retries
+                missing_credits = [
+                    query_id for query_id in basic_metrics if query_id not in credit_metrics
+                ]
+                if missing_credits:
+                    credit_metrics.update(self._get_credit_metrics(missing_credits, first_attempt=1))
+            except Exception as e:
+                logger.warning(f"Combined metrics query failed, querying sources separately: {str(e)}")
+                basic_future = executor.submit(self._get_basic_metrics, query_ids)
+                credit_metrics = self._get_credit_metrics(query_ids)
+                basic_metrics = basic_future.result()
+            
+            raw_profiles = profiles_future.result()
+        
+        new_profiles = {}
         
         per_model_metrics = {}
         
+        # Extract dbt model names from all query texts in one scan
+        model_names = self._extract_dbt_model_ids(
+            [basic_metric.get('query_text', '') for basic_metric in basic_metrics.values()]
+        )
+        
         # Combine metrics per model
-        for query_id, basic_metric in basic_metrics.items():
-            # Extract dbt model name from query text
-            model_name = self._extract_dbt_model_id(basic_metric.get('query_text', ''))
+        for (query_id, basic_metric), model_name in zip(basic_metrics.items(), model_names):
             
             if not model_name:
                 # Fallback to query_id if model name not found
                 model_name = f"unknown_{query_id[:8]}"
             
             # Get query profile
-            profile = self._get_query_profile(query_id)
-            profile_metrics = self._parse_query_profile(profile) if profile else {
-                'join_count': 0,
-                'subquery_depth': 0,
-                'window_function_count': 0
-            }
+            profile_metrics = cached_profiles.get(query_id)
+            if profile_metrics is None:
+                profile = self._decode_query_profile(query_id, raw_profiles.get(query_id))
+                if profile:
+                    profile_metrics = self._parse_query_profile(profile)
+                    new_profiles[query_id] = profile_metrics
+                else:
+                    profile_metrics = {
+                        'join_count': 0,
+                        'subquery_depth': 0,
+                        'window_function_count': 0
+                    }
             
             # Get credit metrics for this query
             credit_metric = credit_metrics.get(query_id, {})
@@ -542,6 +1130,8 @@ class MetricsCollector:
             
             per_model_metrics[model_name] = model_metrics
         
+        _PROFILE_CACHE.put_many(new_profiles)
+        
         # Calculate pipeline-level aggregations
         pipeline_aggregations = self._aggregate_pipeline_metrics(per_model_metrics)
         
@@ -565,76 +1155,54 @@ class MetricsCollector:
         if not per_model_metrics:
             return {}
         
-        aggregations = {
-            'total_execution_time_ms': 0,
-            'total_compilation_time_ms': 0,
-            'total_bytes_scanned': 0,
-            'total_rows_scanned': 0,
-            'total_warehouse_credits': 0,
-            'total_spilling_bytes': 0,
-            'model_count': len(per_model_metrics),
-            'avg_execution_time_ms': 0,
-            'avg_join_count': 0,
-            'avg_subquery_depth': 0,
-            'avg_window_function_count': 0
-        }
+        models = list(per_model_metrics.values())
+        model_count = len(models)
         
-        join_counts = []
-        subquery_depths = []
-        window_counts = []
+        def column(key: str) -> List[Any]:
+            """Non-null values of one metric across all models."""
+            # Single comprehension; the one-tuple loop binds the value without
+            # building an intermediate list
+            return [value for metrics in models for value in (metrics.get(key),)
+                    if value is not None]
         
-        for metrics in per_model_metrics.values():
-            # Sum totals
-            if metrics.get('execution_time_ms') is not None:
-                aggregations['total_execution_time_ms'] += metrics['execution_time_ms']
-            
-            if metrics.get('compilation_time_ms') is not None:
-                aggregations['total_compilation_time_ms'] += metrics['compilation_time_ms']
-            
-            if metrics.get('bytes_scanned') is not None:
-                aggregations['total_bytes_scanned'] += metrics['bytes_scanned']
-            
-            if metrics.get('rows_scanned') is not None:
-                aggregations['total_rows_scanned'] += metrics['rows_scanned']
-            
-            if metrics.get('warehouse_credits') is not None:
-                aggregations['total_warehouse_credits'] += metrics['warehouse_credits']
-            
-            spill_local = metrics.get('spilling_to_local_storage_bytes') or 0
-            spill_remote = metrics.get('spilling_to_remote_storage_bytes') or 0
-            aggregations['total_spilling_bytes'] += spill_local + spill_remote
-            
-            # Collect for averages
-            if metrics.get('join_count') is not None:
-                join_counts.append(metrics['join_count'])
-            
-            if metrics.get('subquery_depth') is not None:
-                subquery_depths.append(metrics['subquery_depth'])
-            
-            if metrics.get('window_function_count') is not None:
-                window_counts.append(metrics['window_function_count'])
-        
-        # Calculate averages
-        if per_model_metrics:
-            aggregations['avg_execution_time_ms'] = aggregations['total_execution_time_ms'] / len(per_model_metrics)
-        
-        if join_counts:
-            aggregations['avg_join_count'] = sum(join_counts) / len(join_counts)
+        def mean(values: List[Any]) -> float:
+            return sum(values) / len(values) if values else 0
         
-        if subquery_depths:
-            aggregations['avg_subquery_depth'] = sum(subquery_depths) / len(subquery_depths)
+        # One column per metric, each reduced with a single builtin sum
+        total_execution_time_ms = sum(column('execution_time_ms'))
         
-        if window_counts:
-            aggregations['avg_window_function_count'] = sum(window_counts) / len(window_counts)
+        aggregations = {
+            'total_execution_time_ms': total_execution_time_ms,
+            'total_compilation_time_ms': sum(column('compilation_time_ms')),
+            'total_bytes_scanned': sum(column('bytes_scanned')),
+            'total_rows_scanned': sum(column('rows_scanned')),
+            'total_warehouse_credits': sum(column('warehouse_credits')),
+            'total_spilling_bytes': (
+                sum(column('spilling_to_local_storage_bytes'))
+                + sum(column('spilling_to_remote_storage_bytes'))
+            ),
+            'model_count': model_count,
+            'avg_execution_time_ms': total_execution_time_ms / model_count,
+            'avg_join_count': mean(column('join_count')),
+            'avg_subquery_depth': mean(column('subquery_depth')),
+            'avg_window_function_count': mean(column('window_function_count'))
+        }
         
         return aggregations
     
     def close(self):
-        """Close Snowflake connection."""
+        """Return the Snowflake connection to the pool."""
         try:
+            while True:
+                try:
+                    self._idle_cursors.get_nowait().close()
+                except queue.Empty:
+                    break
+            
             if self.connection:
-                self.connection.close()
-                logger.info("Snowflake connection closed")
+                _POOL.release(self._pool_key, self.connection)
+                self.connection = None
+                logger.info("Snowflake connection released")
         except Exception as e:
             logger.warning(f"Error closing connection: {str(e)}")
 
@@ -685,7 +1253,7 @@ def main():
         print("\n" + "="*60)
         print("METRICS COLLECTION RESULTS")
         print("="*60)
-        print(json.dumps(metrics, indent=2))
+        print(json_dumps(metrics, indent=True).decode("utf-8"))
         
         collector.close()
     
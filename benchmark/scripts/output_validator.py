@@ -6,9 +6,11 @@ using order-agnostic hash comparison.
 
 Validates datasets by:
 1. Comparing row counts (fast check)
-2. Computing order-agnostic row hashes using Snowflake HASH()
-3. Aggregating row hashes for deterministic comparison
-4. Storing and comparing baseline hashes
+2. Computing an order-agnostic table fingerprint with Snowflake HASH_AGG(*)
+3. Storing and comparing baseline fingerprints
+
+Sorted per-row HASH() values aggregated with SHA256 remain available as a
+fallback for accounts without HASH_AGG.
 """
 
 import snowflake.connector
@@ -20,7 +22,8 @@ import re
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from pathlib import Path
-import yaml
+
+from .serialization import yaml_load
 
 
 # Configure logging
@@ -30,6 +33,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fingerprint schemes recorded in baseline files
+HASH_METHOD_HASH_AGG = "hash_agg"
+HASH_METHOD_SHA256 = "sha256"
+
 
 class OutputValidator:
     """
@@ -43,13 +50,16 @@ class OutputValidator:
         pipelines_config: Pipeline configuration from pipelines.yaml
     """
     
-    def __init__(self, config_path: str = None, pipelines_config_path: str = None):
+    def __init__(self, config_path: str = None, pipelines_config_path: str = None,
+                 use_hash_agg: bool = True):
         """
         Initialize OutputValidator with Snowflake connection.
         
         Args:
             config_path: Path to snowflake.yaml (defaults to benchmark/config/snowflake.yaml)
             pipelines_config_path: Path to pipelines.yaml (defaults to benchmark/config/pipelines.yaml)
+            use_hash_agg: Fingerprint tables with HASH_AGG(*) in Snowflake; when
+                False, row hashes are fetched and aggregated with SHA256 locally
         """
         if config_path is None:
             config_path = "benchmark/config/snowflake.yaml"
@@ -63,6 +73,7 @@ class OutputValidator:
         self.warehouse = None
         self.config = None
         self.pipelines_config = None
+        self.use_hash_agg = use_hash_agg
         
         # Load configurations and establish connection
         self._load_config()
@@ -84,8 +95,8 @@ class OutputValidator:
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
             
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            with open(self.config_path, 'rb') as f:
+                config = yaml_load(f.read())
             
             if not config or 'snowflake' not in config:
                 error_msg = "Invalid configuration: 'snowflake' key not found"
@@ -118,8 +129,8 @@ class OutputValidator:
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
             
-            with open(self.pipelines_config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            with open(self.pipelines_config_path, 'rb') as f:
+                config = yaml_load(f.read())
             
             if not config or 'pipelines' not in config:
                 error_msg = "Invalid pipeline configuration: 'pipelines' key not found"
@@ -341,6 +352,42 @@ class OutputValidator:
         
         return aggregate_hash
     
+    @property
+    def hash_method(self) -> str:
+        """Name of the fingerprint scheme in use, as recorded in baselines."""
+        return HASH_METHOD_HASH_AGG if self.use_hash_agg else HASH_METHOD_SHA256
+    
+    def _get_count_and_fingerprint(self, schema: str, table: str) -> Tuple[int, str]:
+        """
+        Get a table's row count and order-agnostic fingerprint in one query.
+        
+        With HASH_AGG(*) both values come from a single scan inside
+        Snowflake, so no per-row hashes are sorted or transferred. Otherwise
+        the sorted row hashes are fetched, counted and aggregated with SHA256.
+        Either way one statement reads the table, so the count and the
+        fingerprint describe the same snapshot.
+        
+        Args:
+            schema: Schema name
+            table: Table/view name
+        
+        Returns:
+            Tuple of (row count, fingerprint string)
+        """
+        if not self.use_hash_agg:
+            row_hashes = self._get_row_hashes(schema, table)
+            return len(row_hashes), self._compute_aggregate_hash(row_hashes)
+        
+        try:
+            query = f"SELECT COUNT(*) as row_count, HASH_AGG(*) as fingerprint FROM {schema}.{table}"
+            results = self._execute_query(query)
+            
+            return results[0]['ROW_COUNT'], str(results[0]['FINGERPRINT'])
+        
+        except Exception as e:
+            logger.error(f"Error computing fingerprint for {schema}.{table}: {str(e)}")
+            raise
+    
     def _get_baseline_path(self, pipeline_id: str, model_name: str) -> Path:
         """
         Get the file path for baseline hashes.
@@ -384,7 +431,8 @@ class OutputValidator:
                 "table": table,
                 "captured_at": datetime.now().isoformat() + "Z",
                 "row_count": row_count,
-                "aggregate_hash": aggregate_hash
+                "aggregate_hash": aggregate_hash,
+                "hash_method": self.hash_method
             }
             
             with open(baseline_path, 'w') as f:
@@ -481,8 +529,18 @@ class OutputValidator:
             result["hash_baseline"] = baseline.get('aggregate_hash')
             result["row_count_baseline"] = baseline.get('row_count')
             
-            # Get current row count
-            row_count = self._get_row_count(schema, model_name)
+            # Fingerprints from different schemes never match; baselines
+            # written before hash_method was recorded used SHA256
+            baseline_method = baseline.get('hash_method', HASH_METHOD_SHA256)
+            if baseline_method != self.hash_method:
+                result["error"] = (
+                    f"Baseline for {pipeline_id}.{model_name} was hashed with {baseline_method}, "
+                    f"validator uses {self.hash_method}; re-capture it with --baseline"
+                )
+                return result
+            
+            # Get current row count and fingerprint in one round-trip
+            row_count, aggregate_hash = self._get_count_and_fingerprint(schema, model_name)
             result["row_count_candidate"] = row_count
             
             # Compare row counts
@@ -492,12 +550,6 @@ class OutputValidator:
                 return result
             
             result["row_count_match"] = True
-            
-            # Get current row hashes
-            row_hashes = self._get_row_hashes(schema, model_name)
-            
-            # Compute aggregate hash
-            aggregate_hash = self._compute_aggregate_hash(row_hashes)
             result["hash_candidate"] = aggregate_hash
             
             # Compare hashes
@@ -546,14 +598,8 @@ class OutputValidator:
                 logger.info(f"Capturing baseline for {pipeline_id}.{model_name}")
                 
                 try:
-                    # Get row count
-                    row_count = self._get_row_count(schema, model_name)
-                    
-                    # Get row hashes
-                    row_hashes = self._get_row_hashes(schema, model_name)
-                    
-                    # Compute aggregate hash
-                    aggregate_hash = self._compute_aggregate_hash(row_hashes)
+                    # Get row count and fingerprint in one round-trip
+                    row_count, aggregate_hash = self._get_count_and_fingerprint(schema, model_name)
                     
                     # Save baseline
                     self._save_baseline(pipeline_id, model_name, schema, model_name, row_count, aggregate_hash)
@@ -653,6 +699,7 @@ def main():
         --models <list>: Space-separated list of model names
         --baseline: Capture baseline instead of validating
         --config <path>: Path to snowflake.yaml (optional)
+        --no-hash-agg: Fingerprint with SHA256 over row hashes instead of HASH_AGG
     """
     import sys
     
@@ -666,6 +713,7 @@ def main():
     model_names = []
     capture_baseline = False
     config_path = None
+    use_hash_agg = True
     
     i = 1
     while i < len(sys.argv):
@@ -686,6 +734,9 @@ def main():
         elif arg == '--config' and i + 1 < len(sys.argv):
             config_path = sys.argv[i + 1]
             i += 2
+        elif arg == '--no-hash-agg':
+            use_hash_agg = False
+            i += 1
         else:
             i += 1
     
@@ -701,9 +752,9 @@ def main():
     try:
         # Initialize validator
         if config_path:
-            validator = OutputValidator(config_path=config_path)
+            validator = OutputValidator(config_path=config_path, use_hash_agg=use_hash_agg)
         else:
-            validator = OutputValidator()
+            validator = OutputValidator(use_hash_agg=use_hash_agg)
         
         # Perform operation
         if capture_baseline:
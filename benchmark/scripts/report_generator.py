@@ -26,6 +26,8 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 import os
 
+from .serialization import json_dumps
+
 
 # Configure logging
 logging.basicConfig(
@@ -437,11 +439,8 @@ class ReportGenerator:
             JSON string representation of report
         """
         # Convert report to JSON
-        json_str = json.dumps(
-            self.report,
-            indent=2 if pretty_print else None,
-            default=str
-        )
+        json_bytes = json_dumps(self.report, indent=pretty_print, default=str)
+        json_str = json_bytes.decode('utf-8')
         
         # Write to file atomically if specified
         if output_file:
@@ -450,12 +449,12 @@ class ReportGenerator:
             
             # Write to temporary file first
             with tempfile.NamedTemporaryFile(
-                mode='w',
+                mode='wb',
                 suffix='.json',
                 dir=output_path.parent,
                 delete=False
             ) as tmp_file:
-                tmp_file.write(json_str)
+                tmp_file.write(json_bytes)
                 tmp_path = tmp_file.name
             
             try:
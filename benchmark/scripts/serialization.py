@@ -0,0 +1,158 @@
+"""
+Serialization Helpers
+
+Fast JSON and YAML (de)serialization shared by the benchmark modules.
+
+Features:
+- Uses orjson for JSON when it is installed, falling back to the stdlib json module
+- Decodes JSON files from a memory map when orjson is available
+- Uses the LibYAML-backed CSafeLoader when PyYAML was built with it
+- Caches parsed YAML files keyed by path, modification time and size
+"""
+
+import copy
+import json
+import logging
+import mmap
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+logger = logging.getLogger(__name__)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this regardless of which backend decoded the document.
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_load_file(path: Union[str, Path]) -> Any:
+    """
+    Decode a JSON file.
+    
+    With orjson the file is memory-mapped and decoded in place, so large
+    files aren't first copied into a bytes object; the stdlib fallback
+    reads the file normally.
+    
+    Args:
+        path: Path to the JSON file
+    
+    Returns:
+        Decoded Python object
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file; let the decoder report it
+            return json_loads(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def json_dumps(data: Any, indent: bool = False,
+               default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes.
+
+    Falls back to the stdlib encoder for values orjson rejects (such as
+    integers wider than 64 bits) so output never depends on the backend.
+
+    Args:
+        data: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Called for objects JSON can't represent, as in json.dumps.
+            Datetimes and dataclasses are routed to it too, matching stdlib output.
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except orjson.JSONEncodeError as e:
+            logger.debug(f"orjson could not encode value, using stdlib json: {str(e)}")
+
+    return json.dumps(data, indent=2 if indent else None, default=default).encode("utf-8")
+
+
+def yaml_load(stream: Any) -> Any:
+    """
+    Parse a YAML document with the fastest available safe loader.
+
+    Args:
+        stream: YAML text, bytes or an open file
+
+    Returns:
+        Parsed Python object
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; the stat fields only participate in the cache key."""
+    with open(path, 'rb') as f:
+        return yaml_load(f)
+
+
+def load_yaml_file(path: Union[str, Path]) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Each caller receives its own deep copy, so mutating the result never
+    leaks into other users of the cache.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    stat = Path(path).stat()
+    parsed = _parse_yaml_file(str(path), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(parsed)
@@ -19,12 +19,9 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+from .serialization import json_dumps, json_loads
+
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -64,21 +61,25 @@ class StorageManager:
             logger.error(f"Error creating directory {self.base_dir}: {str(e)}")
             raise
     
-    def save_json(self, data: Dict[str, Any], file_path: str) -> bool:
+    def save_json(self, data: Dict[str, Any], file_path: str,
+                  overwrite: bool = True) -> bool:
         """
         Save data to JSON file with atomic writes.
         
-        Writes to temporary file first, then atomically renames to final location.
-        This prevents corruption if the process is interrupted.
+        Writes to temporary file first, fsyncs it, then atomically moves it to
+        the final location. This prevents corruption if the process is interrupted.
         
         Args:
             data: Dictionary to serialize as JSON
             file_path: Relative path from base_dir for the file
+            overwrite: If False, fail instead of replacing an existing file.
+                The existence check and the create happen atomically.
         
         Returns:
             bool: True if saved successfully
         
         Raises:
+            FileExistsError: If overwrite is False and the file already exists
             Exception: If save operation fails
         """
         try:
@@ -88,15 +89,20 @@ class StorageManager:
             full_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Write to temporary file in same directory (ensures same filesystem)
-            temp_fd, temp_path = tempfile.mkstemp(dir=full_path.parent, text=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=full_path.parent)
             
             try:
                 # Write JSON data to temp file
-                with os.fdopen(temp_fd, 'w') as f:
-                    json.dump(data, f, indent=2)
+                with os.fdopen(temp_fd, 'wb') as f:
+                    f.write(json_dumps(data, indent=True))
+                    f.flush()
+                    os.fsync(f.fileno())
                 
-                # Atomically rename temp file to final location
-                os.replace(temp_path, full_path)
+                if overwrite:
+                    # Atomically rename temp file to final location
+                    os.replace(temp_path, full_path)
+                else:
+                    self._link_no_clobber(temp_path, full_path)
                 
                 logger.info(f"Saved JSON to {full_path}")
                 return True
@@ -109,10 +115,38 @@ class StorageManager:
                     pass
                 raise
         
+        except FileExistsError:
+            raise
         except Exception as e:
             logger.error(f"Error saving JSON to {file_path}: {str(e)}")
             raise
     
+    def _link_no_clobber(self, temp_path: str, full_path: Path) -> None:
+        """
+        Move a temp file into place only if the destination doesn't exist.
+        
+        A hard link fails atomically when the destination exists. Filesystems
+        without hard link support fall back to a check followed by a rename.
+        
+        Args:
+            temp_path: Fully written temporary file
+            full_path: Final destination
+        
+        Raises:
+            FileExistsError: If the destination already exists
+        """
+        try:
+            os.link(temp_path, full_path)
+        except FileExistsError:
+            raise
+        except OSError:
+            if full_path.exists():
+                raise FileExistsError(f"File already exists: {full_path}")
+            os.replace(temp_path, full_path)
+            return
+        
+        os.unlink(temp_path)
+    
     def load_json(self, file_path: str) -> Dict[str, Any]:
         """
         Load data from JSON file with validation.
@@ -136,10 +170,10 @@ class StorageManager:
                 logger.error(error_msg)
                 raise FileNotFoundError(error_msg)
             
-            with open(full_path, 'r') as f:
-                data = json.load(f)
+            with open(full_path, 'rb') as f:
+                data = json_loads(f.read())
             
-            logger.debug(f"Loaded JSON from {full_path}")
+            logger.debug("Loaded JSON from %s", full_path)
             return data
         
         except json.JSONDecodeError as e:
@@ -150,6 +184,104 @@ class StorageManager:
             logger.error(f"Error loading JSON from {file_path}: {str(e)}")
             raise
     
+    def append_jsonl(self, record: Dict[str, Any], file_path: str) -> bool:
+        """
+        Append a single record to a JSON Lines file.
+
+        The line is written in one call and fsynced so a crash can leave at
+        most one torn trailing line, which load_jsonl skips.
+
+        Args:
+            record: Dictionary to serialize as one JSON line
+            file_path: Relative path from base_dir for the file
+
+        Returns:
+            bool: True if appended successfully
+        """
+        try:
+            full_path = self.base_dir / file_path
+            line = json_dumps(record) + b"\n"
+
+            with open(full_path, 'ab') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+            logger.debug("Appended record to %s", full_path)
+            return True
+
+        except Exception as e:
+            logger.error(f"Error appending to {file_path}: {str(e)}")
+            raise
+
+    def load_jsonl(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Load all records from a JSON Lines file.
+
+        Blank and corrupted lines are skipped.
+
+        Args:
+            file_path: Relative path from base_dir for the file
+
+        Returns:
+            List of decoded records in file order
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        full_path = self.base_dir / file_path
+        records = []
+        skipped = 0
+
+        with open(full_path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json_loads(line))
+                except json.JSONDecodeError:
+                    skipped += 1
+
+        if skipped:
+            logger.warning(f"Skipped {skipped} corrupted lines in {full_path}")
+
+        return records
+
+    def save_jsonl(self, records: List[Dict[str, Any]], file_path: str) -> bool:
+        """
+        Atomically replace a JSON Lines file with the given records.
+
+        Args:
+            records: Records to write, one per line
+            file_path: Relative path from base_dir for the file
+
+        Returns:
+            bool: True if saved successfully
+        """
+        try:
+            full_path = self.base_dir / file_path
+            temp_fd, temp_path = tempfile.mkstemp(dir=full_path.parent)
+
+            try:
+                with os.fdopen(temp_fd, 'wb') as f:
+                    f.write(b"".join(json_dumps(record) + b"\n" for record in records))
+
+                os.replace(temp_path, full_path)
+                logger.debug(f"Saved {len(records)} records to {full_path}")
+                return True
+
+            except Exception:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+
+        except Exception as e:
+            logger.error(f"Error saving JSON lines to {file_path}: {str(e)}")
+            raise
+
     def list_files(self, pattern: Optional[str] = None) -> List[Path]:
         """
         List all files in the base directory, optionally filtered by pattern.
@@ -167,13 +299,42 @@ class StorageManager:
                 # Get all JSON files
                 files = sorted(self.base_dir.glob("*.json"))
             
-            logger.debug(f"Found {len(files)} files matching pattern '{pattern}'")
+            logger.debug("Found %d files matching pattern '%s'", len(files), pattern)
             return files
         
         except Exception as e:
             logger.error(f"Error listing files: {str(e)}")
             raise
     
+    def list_filenames(self, prefix: str = "", suffix: str = ".json") -> List[str]:
+        """
+        List names of files in the base directory by prefix and suffix.
+        
+        Reads the directory once with os.scandir and matches on the names
+        alone, so no per-file stat or glob translation is needed.
+        
+        Args:
+            prefix: Required filename prefix (e.g., "baseline_A_")
+            suffix: Required filename suffix
+        
+        Returns:
+            Sorted list of filenames relative to base_dir
+        """
+        try:
+            with os.scandir(self.base_dir) as entries:
+                names = [
+                    entry.name for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                ]
+            
+            names.sort()
+            logger.debug("Found %d files with prefix '%s'", len(names), prefix)
+            return names
+        
+        except Exception as e:
+            logger.error(f"Error listing files: {str(e)}")
+            raise
+    
     def file_exists(self, file_path: str) -> bool:
         """
         Check if a file exists.
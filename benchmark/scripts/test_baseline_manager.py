@@ -13,8 +13,8 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
-from baseline_manager import BaselineManager
-from storage import StorageManager
+from benchmark.scripts.baseline_manager import BaselineManager, INDEX_FILENAME
+from benchmark.scripts.storage import StorageManager
 
 
 # Configure logging for tests
@@ -68,6 +68,17 @@ def test_storage_manager_atomic_writes():
         full_path = storage.get_full_path("test_atomic.json")
         assert full_path.exists(), "File should exist after atomic write"
         logger.info("✓ Atomic write successful")
+        
+        # Refuse to replace an existing file when overwrite is disabled
+        try:
+            storage.save_json({"test": "clobbered"}, "test_atomic.json", overwrite=False)
+            assert False, "Should raise FileExistsError"
+        except FileExistsError:
+            pass
+        
+        assert storage.load_json("test_atomic.json") == test_data, "Original file should be kept"
+        assert [p.name for p in Path(tmpdir).iterdir()] == ["test_atomic.json"], "Temp file should be removed"
+        logger.info("✓ No-clobber write preserved existing file")
 
 
 def test_storage_manager_missing_directory():
@@ -141,6 +152,11 @@ def test_storage_manager_list_files():
         a_files = storage.list_files("baseline_A_*.json")
         assert len(a_files) == 3, "Should find 3 files for pipeline A"
         logger.info("✓ Listed files with pattern successfully")
+        
+        # List filenames by prefix
+        a_names = storage.list_filenames("baseline_A_")
+        assert a_names == sorted(a_names) and len(a_names) == 3, "Should find 3 sorted names for pipeline A"
+        logger.info("✓ Listed filenames by prefix successfully")
 
 
 def test_storage_manager_delete_file():
@@ -305,6 +321,61 @@ def test_baseline_manager_load_most_recent():
         logger.info("✓ Loaded most recent baseline successfully")
 
 
+def test_baseline_manager_load_cache():
+    """Test that loaded baselines are cached and invalidated on change."""
+    logger.info("\n=== Test: Baseline Manager - Load Cache ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BaselineManager(tmpdir)
+        
+        baseline_data = {
+            "pipeline": "A",
+            "captured_at": "20240115_143022",
+            "status": "SUCCESS"
+        }
+        manager.save_baseline(baseline_data)
+        
+        first = manager.load_baseline("A", "20240115_143022")
+        second = manager.load_baseline("A")
+        assert first is second, "Repeated loads should be served from the cache"
+        logger.info("✓ Repeated loads served from cache")
+        
+        # Overwriting invalidates the cached document
+        baseline_data["status"] = "UPDATED"
+        manager.save_baseline(baseline_data, force=True)
+        reloaded = manager.load_baseline("A", "20240115_143022")
+        assert reloaded["status"] == "UPDATED", "Overwrite should invalidate cache"
+        logger.info("✓ Overwrite invalidated cached baseline")
+        
+        # A deleted baseline reads as missing until it is saved again
+        manager.delete_baseline("A", "20240115_143022", confirm=True)
+        assert manager.load_baseline("A", "20240115_143022") is None
+        manager.save_baseline(baseline_data)
+        assert manager.load_baseline("A", "20240115_143022") is not None
+        logger.info("✓ Delete and re-save kept cache consistent")
+        
+        # Files seen as missing are found once written by someone else
+        filename = "baseline_A_20240116_090000.json"
+        assert manager._load_cached(filename) is None
+        manager.storage.save_json({"pipeline": "A", "status": "EXTERNAL"}, filename)
+        loaded = manager._load_cached(filename)
+        assert loaded is not None and loaded["status"] == "EXTERNAL", \
+            "A file created after a miss should be loaded"
+        logger.info("✓ Baseline created after a miss is visible")
+
+
+def test_baseline_manager_prepare_unknown_pipeline():
+    """Test that prepare reports a pipeline whose config can't be loaded."""
+    logger.info("\n=== Test: Baseline Manager - Prepare Unknown Pipeline ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BaselineManager(tmpdir)
+        
+        assert not manager.prepare("Z", project_root=tmpdir), "Unknown pipeline should not prepare"
+        assert not manager._runner_cache, "Failed runner should not be cached"
+        logger.info("✓ Unknown pipeline rejected without caching a runner")
+
+
 def test_baseline_manager_list_baselines():
     """Test listing baselines with summary metadata."""
     logger.info("\n=== Test: Baseline Manager - List Baselines ===")
@@ -347,6 +418,48 @@ def test_baseline_manager_list_baselines():
             logger.info("✓ Summary includes all required fields")
 
 
+def test_baseline_manager_summary_index():
+    """Test that the summary index tracks saves, deletes and external changes."""
+    logger.info("\n=== Test: Baseline Manager - Summary Index ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BaselineManager(tmpdir)
+        
+        for i in range(2):
+            manager.save_baseline({
+                "pipeline": "A",
+                "captured_at": f"2024011{i}_143022",
+                "execution_context": {"models_executed": ["m1", "m2", "m3"]},
+                "summary": {"status": "SUCCESS"}
+            })
+        
+        index_path = Path(tmpdir) / "baselines_index.jsonl"
+        assert index_path.exists(), "Index should be written on save"
+        
+        summaries = manager.list_baselines("A")
+        assert [s["timestamp"] for s in summaries] == ["20240111_143022", "20240110_143022"]
+        assert summaries[0]["models_executed"] == 3
+        logger.info("✓ Index written on save")
+        
+        manager.delete_baseline("A", "20240110_143022", confirm=True)
+        assert "20240110_143022" not in index_path.read_text()
+        logger.info("✓ Index updated on delete")
+        
+        # Files added or removed behind the manager's back are reconciled
+        manager.storage.save_json({"pipeline": "B", "captured_at": "20240112_100000"},
+                                  "baseline_B_20240112_100000.json")
+        manager.storage.delete_file("baseline_A_20240111_143022.json")
+        summaries = manager.list_baselines()
+        assert [s["filename"] for s in summaries] == ["baseline_B_20240112_100000.json"]
+        logger.info("✓ Index reconciled with directory contents")
+        
+        # A missing index is rebuilt from the baseline files
+        index_path.unlink()
+        assert len(manager.list_baselines()) == 1
+        assert index_path.exists(), "Index should be rebuilt"
+        logger.info("✓ Missing index rebuilt")
+
+
 def test_baseline_manager_delete_with_safeguard():
     """Test deletion with confirmation requirement."""
     logger.info("\n=== Test: Baseline Manager - Delete with Safeguard ===")
@@ -460,6 +573,50 @@ def test_baseline_manager_cleanup_by_count():
         logger.info("✓ Correct number of baselines retained")
 
 
+def test_baseline_manager_cleanup_rewrites_index_once():
+    """Test that cleanup removes all deleted baselines from the index in one rewrite."""
+    logger.info("\n=== Test: Baseline Manager - Cleanup Index Rewrite ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BaselineManager(tmpdir)
+        
+        for i in range(5):
+            baseline_data = {
+                "pipeline": "A",
+                "captured_at": f"202401{10+i}_14302{i}",
+                "sequence": i
+            }
+            manager.save_baseline(baseline_data)
+        
+        # Build the index before counting rewrites
+        manager.list_baselines("A")
+        
+        index_writes = []
+        save_jsonl = manager.storage.save_jsonl
+        
+        def counting_save_jsonl(records, filename):
+            index_writes.append(filename)
+            return save_jsonl(records, filename)
+        
+        manager.storage.save_jsonl = counting_save_jsonl
+        
+        deleted_count, deleted_files = manager.cleanup_old_baselines(
+            "A",
+            max_age_days=0,
+            max_count=2,
+            dry_run=False
+        )
+        
+        assert deleted_count == 3, f"Should delete 3, deleted {deleted_count}"
+        assert index_writes == [INDEX_FILENAME], f"Index rewritten {len(index_writes)} times"
+        logger.info("✓ Index rewritten once for the whole cleanup")
+        
+        indexed = {record["filename"] for record in manager.storage.load_jsonl(INDEX_FILENAME)}
+        assert not indexed & set(deleted_files), "Deleted baselines still in index"
+        assert len(indexed) == 2, f"Index should list 2 baselines, lists {len(indexed)}"
+        logger.info("✓ Index lists only the retained baselines")
+
+
 def run_all_tests():
     """Run all test cases."""
     logger.info("\n" + "="*60)
@@ -479,11 +636,15 @@ def run_all_tests():
         ("Baseline: Save and Load", test_baseline_manager_save_and_load),
         ("Baseline: Prevent Overwrite", test_baseline_manager_prevent_overwrite),
         ("Baseline: Load Most Recent", test_baseline_manager_load_most_recent),
+        ("Baseline: Load Cache", test_baseline_manager_load_cache),
+        ("Baseline: Prepare Unknown Pipeline", test_baseline_manager_prepare_unknown_pipeline),
         ("Baseline: List Baselines", test_baseline_manager_list_baselines),
+        ("Baseline: Summary Index", test_baseline_manager_summary_index),
         ("Baseline: Delete with Safeguard", test_baseline_manager_delete_with_safeguard),
         ("Baseline: Delete Requires Timestamp", test_baseline_manager_missing_timestamp_for_delete),
         ("Baseline: Cleanup by Age", test_baseline_manager_cleanup_by_age),
         ("Baseline: Cleanup by Count", test_baseline_manager_cleanup_by_count),
+        ("Baseline: Cleanup Index Rewrite", test_baseline_manager_cleanup_rewrites_index_once),
     ]
     
     passed = 0
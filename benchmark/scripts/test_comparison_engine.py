@@ -12,11 +12,11 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any
 
-from thresholds import (
+from benchmark.scripts.thresholds import (
     ThresholdManager, MetricsComparer, SeverityLevel,
     Violation
 )
-from comparison_engine import (
+from benchmark.scripts.comparison_engine import (
     ComparisonEngine, PipelineComparison, ModelComparison,
     ComparisonStatus
 )
@@ -409,6 +409,7 @@ def test_comparison_engine_report_generation():
         assert json_report['status'] == 'WARNING'
         assert json_report['exit_code'] == 1
         assert json_report['summary']['warning'] == 1
+        assert json.loads(engine.generate_json_bytes(comparison)) == json_report
         logger.info("✓ JSON report generated successfully")
 
 
@@ -465,6 +466,123 @@ def test_comparison_engine_missing_metrics():
         logger.info(f"✓ Missing metric detected: {model_comp.metrics_missing_in_baseline}")
 
 
+def test_comparison_engine_unconfigured_metrics():
+    """Test that metrics without a threshold never produce violations."""
+    logger.info("\n=== Test: ComparisonEngine - Unconfigured Metrics ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "thresholds.yaml"
+        with open(config_path, 'w') as f:
+            yaml.dump(create_test_thresholds(), f)
+        
+        engine = ComparisonEngine(str(config_path))
+        
+        model_comp = engine.compare_models(
+            {'model_name': 'model_a', 'metrics': {'execution_time_ms': 100, 'custom_metric': 1}},
+            {'model_name': 'model_a', 'metrics': {'execution_time_ms': 200, 'custom_metric': 1000}}
+        )
+        
+        assert [v.metric_name for v in model_comp.violations] == ['execution_time_ms']
+        logger.info("✓ Only configured metrics were evaluated")
+        
+        metrics = {'execution_time_ms': 100, 'details': {'nested': [1, 2]}}
+        model_comp = engine.compare_models(
+            {'model_name': 'model_a', 'metrics': metrics},
+            {'model_name': 'model_a', 'metrics': dict(metrics)}
+        )
+        assert not model_comp.violations
+        assert not model_comp.metrics_missing_in_baseline
+        assert not model_comp.metrics_missing_in_candidate
+        logger.info("✓ Identical metrics short-circuited")
+
+
+def test_pipeline_comparison_violation_cache():
+    """Test that cached violation views follow changes to the comparison."""
+    logger.info("\n=== Test: PipelineComparison - Violation Cache ===")
+    
+    def make_violation(severity):
+        return Violation(
+            metric_name='test',
+            baseline_value=100,
+            candidate_value=120,
+            delta=20,
+            delta_percent=20.0,
+            threshold=10,
+            threshold_type='percent',
+            severity=severity
+        )
+    
+    comparison = PipelineComparison(
+        pipeline_name='test',
+        baseline_timestamp='20240115_100000',
+        candidate_timestamp='20240115_110000'
+    )
+    assert comparison.count_violations_by_severity() == {'INFO': 0, 'WARNING': 0, 'ERROR': 0}
+    
+    comparison.pipeline_violations = [make_violation(SeverityLevel.WARNING)]
+    assert comparison.count_violations_by_severity() == {'INFO': 0, 'WARNING': 1, 'ERROR': 0}
+    
+    comparison.model_comparisons['model_a'] = ModelComparison(
+        model_name='model_a',
+        baseline_metrics={},
+        candidate_metrics={},
+        violations=[make_violation(SeverityLevel.ERROR)]
+    )
+    comparison.invalidate_violations()
+    assert comparison.count_violations_by_severity() == {'INFO': 0, 'WARNING': 1, 'ERROR': 1}
+    assert comparison.get_max_severity() == SeverityLevel.ERROR
+    
+    logger.info("✓ Violation cache refreshed after reassignment and invalidation")
+
+
+def test_comparison_engine_parallel_models():
+    """Test that pooled model comparison matches the serial path."""
+    logger.info("\n=== Test: ComparisonEngine - Parallel Model Comparison ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "thresholds.yaml"
+        with open(config_path, 'w') as f:
+            yaml.dump(create_test_thresholds(), f)
+        
+        model_count = 20
+        baseline = {
+            'pipeline': 'test',
+            'captured_at': '20240115_100000',
+            'per_model': {
+                f'model_{i:02d}': {
+                    'model_name': f'model_{i:02d}',
+                    'metrics': {'execution_time_ms': 100, 'warehouse_credits': 10}
+                }
+                for i in range(model_count)
+            }
+        }
+        candidate = {
+            'pipeline': 'test',
+            'captured_at': '20240115_110000',
+            'per_model': {
+                f'model_{i:02d}': {
+                    'model_name': f'model_{i:02d}',
+                    'metrics': {'execution_time_ms': 100 + 10 * i, 'warehouse_credits': 10}
+                }
+                for i in range(model_count)
+            }
+        }
+        
+        def summarize(comparison):
+            return {
+                name: sorted((v.metric_name, v.severity.name) for v in model_comp.violations)
+                for name, model_comp in comparison.model_comparisons.items()
+            }
+        
+        serial = ComparisonEngine(str(config_path), max_workers=1).compare_pipeline(baseline, candidate)
+        pooled = ComparisonEngine(str(config_path), max_workers=2).compare_pipeline(baseline, candidate)
+        
+        assert list(pooled.model_comparisons) == sorted(baseline['per_model'])
+        assert summarize(pooled) == summarize(serial)
+        assert pooled.count_violations_by_severity() == serial.count_violations_by_severity()
+        logger.info(f"✓ {model_count} models compared identically in a process pool")
+
+
 def run_all_tests():
     """Run all tests."""
     logger.info("\n" + "=" * 80)
@@ -480,7 +598,10 @@ def run_all_tests():
         test_comparison_engine_pipeline_comparison,
         test_comparison_engine_exit_codes,
         test_comparison_engine_report_generation,
-        test_comparison_engine_missing_metrics
+        test_comparison_engine_missing_metrics,
+        test_comparison_engine_unconfigured_metrics,
+        test_pipeline_comparison_violation_cache,
+        test_comparison_engine_parallel_models
     ]
     
     passed = 0
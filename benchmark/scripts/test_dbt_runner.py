@@ -0,0 +1,439 @@
+"""
+Test Suite for dbt Pipeline Runner
+
+Tests dependency resolution, level scheduling, failure recording and dbt
+command construction without invoking dbt.
+"""
+
+import logging
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import yaml
+
+from benchmark.scripts import dbt_runner
+from benchmark.scripts.dbt_runner import (
+    PipelineRunner,
+    DBT_TIMEOUT_SECONDS,
+    MAX_STDERR_LINES
+)
+
+
+# Configure logging for tests
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def create_diamond_config() -> Dict[str, Any]:
+    """Create a pipeline config where B and C both depend on A, D on both, E on D."""
+    def pipeline(name: str, dependencies: List[str]) -> Dict[str, Any]:
+        return {
+            "name": f"Pipeline {name}",
+            "schema": f"pipeline_{name.lower()}",
+            "models": f"+pipeline_{name.lower()}.*",
+            "dependencies": dependencies
+        }
+    
+    return {
+        "pipelines": {
+            "A": pipeline("A", []),
+            "B": pipeline("B", ["A"]),
+            "C": pipeline("C", ["A"]),
+            "D": pipeline("D", ["B", "C"]),
+            "E": pipeline("E", ["D"])
+        }
+    }
+
+
+def write_config(tmpdir: str, config: Dict[str, Any]) -> Path:
+    """Write a pipelines.yaml into tmpdir and return its path."""
+    config_path = Path(tmpdir) / "pipelines.yaml"
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f)
+    return config_path
+
+
+class StubRunner(PipelineRunner):
+    """
+    PipelineRunner whose dbt calls are recorded instead of executed.
+    
+    Attributes:
+        outcomes: Success flag returned for each pipeline (default True)
+        delays: Seconds each pipeline's execution sleeps before returning
+        in_process: Whether to behave as if the dbt Python API were available
+        calls: Pipeline IDs in the order execute_dbt was called
+        isolated: Pipeline IDs executed with their own target and log directories
+        dbt_calls: Arguments passed to _run_dbt
+    """
+    
+    def __init__(self, *args, in_process: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.outcomes: Dict[str, bool] = {}
+        self.delays: Dict[str, float] = {}
+        self.in_process = in_process
+        self.calls: List[str] = []
+        self.isolated: List[str] = []
+        self.dbt_calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+    
+    def _get_dbt_runner(self) -> Optional[Any]:
+        return object() if self.in_process else None
+    
+    def execute_dbt(self, pipeline_id: str, capture_models: bool = False,
+                    isolated: bool = False):
+        time.sleep(self.delays.get(pipeline_id, 0))
+        with self._lock:
+            self.calls.append(pipeline_id)
+            if isolated:
+                self.isolated.append(pipeline_id)
+        models = [f"model_{pipeline_id.lower()}"] if capture_models else []
+        return self.outcomes.get(pipeline_id, True), models, [f"stderr {pipeline_id}"]
+    
+    def _run_dbt(self, label, dbt_command, schema_name, capture_models,
+                 timeout=DBT_TIMEOUT_SECONDS, extra_args=()):
+        self.dbt_calls.append({
+            "label": label,
+            "command": dbt_command + list(extra_args),
+            "schema": schema_name,
+            "capture_models": capture_models,
+            "timeout": timeout
+        })
+        return True, [], []
+
+
+def test_resolve_dependency_levels_diamond():
+    """Test that a diamond dependency graph resolves into ordered levels."""
+    logger.info("\n=== Test: Resolve Dependency Levels - Diamond ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = PipelineRunner("E", str(config_path), tmpdir)
+        assert runner.load_config(), "Config should load"
+        
+        levels = runner.resolve_dependency_levels()
+        assert [sorted(level) for level in levels] == [["A"], ["B", "C"], ["D"], ["E"]], \
+            f"Unexpected levels: {levels}"
+        logger.info("✓ Levels resolved: %s", levels)
+        
+        order = runner.resolve_dependencies()
+        assert order[0] == "A" and order[-1] == "E", f"Unexpected order: {order}"
+        assert order.index("D") > max(order.index("B"), order.index("C")), \
+            f"D must follow B and C: {order}"
+        logger.info("✓ Flat execution order respects dependencies: %s", order)
+
+
+def test_resolve_dependency_levels_no_dependencies():
+    """Test that a pipeline without dependencies is a single level."""
+    logger.info("\n=== Test: Resolve Dependency Levels - No Dependencies ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = PipelineRunner("A", str(config_path), tmpdir)
+        assert runner.load_config(), "Config should load"
+        
+        assert runner.resolve_dependency_levels() == [["A"]]
+        logger.info("✓ Single level for independent pipeline")
+
+
+def test_execute_level_preserves_level_order():
+    """Test that parallel level results are returned in level order."""
+    logger.info("\n=== Test: Execute Level - Result Order ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = StubRunner("E", str(config_path), tmpdir)
+        assert runner.load_config(), "Config should load"
+        
+        # B finishes after C, but results must still follow the level
+        runner.config['max_parallel'] = 2
+        runner.delays = {"B": 0.05}
+        results = runner._execute_level(["B", "C"])
+        
+        assert list(results) == ["B", "C"], f"Results out of order: {list(results)}"
+        assert runner.calls == ["C", "B"], f"Expected C to finish first: {runner.calls}"
+        logger.info("✓ Results follow level order regardless of completion order")
+        
+        assert sorted(runner.isolated) == ["B", "C"], \
+            f"Concurrent runs should be isolated: {runner.isolated}"
+        logger.info("✓ Concurrent runs use their own artifact directories")
+
+
+def test_execute_level_serial_by_default():
+    """Test that without max_parallel a level runs serially in shared directories."""
+    logger.info("\n=== Test: Execute Level - Serial by Default ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = StubRunner("E", str(config_path), tmpdir)
+        assert runner.load_config(), "Config should load"
+        
+        # Run serially, C would only start after the slower B
+        runner.delays = {"B": 0.05}
+        runner.outcomes = {"B": False}
+        results = runner._execute_level(["B", "C"])
+        
+        assert list(results) == ["B"], f"C should not run after B failed: {list(results)}"
+        assert runner.calls == ["B"] and runner.isolated == [], \
+            f"Unexpected calls: {runner.calls}, isolated: {runner.isolated}"
+        logger.info("✓ Level ran serially without isolation")
+
+
+def test_execute_dbt_isolated_paths():
+    """Test that isolated runs get per-pipeline target and log paths."""
+    logger.info("\n=== Test: Execute dbt - Isolated Paths ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = StubRunner("E", str(config_path), tmpdir)
+        assert runner.load_config(), "Config should load"
+        
+        PipelineRunner.execute_dbt(runner, "B", isolated=True)
+        PipelineRunner.execute_dbt(runner, "C")
+        
+        isolated, shared = (call["command"] for call in runner.dbt_calls)
+        assert isolated == ["dbt", "run", "--select", "+pipeline_b.*",
+                            "--target-path", "target/pipeline_b",
+                            "--log-path", "logs/pipeline_b"], f"Unexpected command: {isolated}"
+        assert shared == ["dbt", "run", "--select", "+pipeline_c.*"], f"Unexpected command: {shared}"
+        logger.info("✓ Isolated run has its own target and log paths")
+
+
+def test_execute_level_in_process_stops_on_failure():
+    """Test that serial level execution stops at the first failed pipeline."""
+    logger.info("\n=== Test: Execute Level - Stop on Failure ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = StubRunner("E", str(config_path), tmpdir, in_process=True)
+        assert runner.load_config(), "Config should load"
+        
+        runner.outcomes = {"B": False}
+        results = runner._execute_level(["B", "C"])
+        
+        assert list(results) == ["B"], f"C should not run after B failed: {list(results)}"
+        assert runner.calls == ["B"], f"Unexpected calls: {runner.calls}"
+        logger.info("✓ Serial level stopped after first failure")
+
+
+def test_run_stops_after_failed_level():
+    """Test that run() records the failure and skips later levels."""
+    logger.info("\n=== Test: Run - Failed Level ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = StubRunner("E", str(config_path), tmpdir)
+        runner.outcomes = {"C": False}
+        
+        results = runner.run()
+        
+        assert not results["success"], "Run should fail"
+        assert "D" not in runner.calls and "E" not in runner.calls, \
+            f"Later levels should not run: {runner.calls}"
+        assert results["errors"] == ["Execution failed for pipeline C", "stderr C"], \
+            f"Unexpected errors: {results['errors']}"
+        logger.info("✓ Run stopped after failed level with failure recorded")
+
+
+def test_run_captures_target_models():
+    """Test that models are captured only for the target pipeline."""
+    logger.info("\n=== Test: Run - Target Models ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = StubRunner("E", str(config_path), tmpdir)
+        
+        results = runner.run()
+        
+        assert results["success"], f"Run should succeed: {results['errors']}"
+        assert results["models_executed"] == ["model_e"], \
+            f"Unexpected models: {results['models_executed']}"
+        assert sorted(results["dependencies_executed"]) == ["A", "B", "C", "D"]
+        logger.info("✓ Target models captured")
+
+
+def test_record_failure_truncates_stderr():
+    """Test that only the tail of long dbt error output is recorded."""
+    logger.info("\n=== Test: Record Failure - Truncation ===")
+    
+    runner = PipelineRunner("A")
+    stderr_lines = [f"line {i}\n" for i in range(MAX_STDERR_LINES + 50)]
+    
+    runner._record_failure("pipeline A", stderr_lines)
+    errors = runner.execution_results["errors"]
+    
+    assert errors[0] == "Execution failed for pipeline A"
+    assert errors[1] == "[truncated 50 earlier lines]", f"Unexpected marker: {errors[1]}"
+    assert len(errors) == MAX_STDERR_LINES + 2, f"Unexpected length: {len(errors)}"
+    assert errors[2] == "line 50" and errors[-1] == f"line {MAX_STDERR_LINES + 49}", \
+        "Should keep the last lines without trailing newlines"
+    logger.info("✓ Error output truncated to the last %d lines", MAX_STDERR_LINES)
+
+
+def test_record_failure_short_stderr():
+    """Test that short dbt error output is recorded without a truncation marker."""
+    logger.info("\n=== Test: Record Failure - Short Output ===")
+    
+    runner = PipelineRunner("A")
+    runner._record_failure("pipeline A", ["error one\n", "error two"])
+    
+    assert runner.execution_results["errors"] == [
+        "Execution failed for pipeline A", "error one", "error two"
+    ]
+    logger.info("✓ Short error output recorded as is")
+
+
+def test_execute_dbt_combined_selector():
+    """Test that a combined run joins the pipelines' selectors and scales the timeout."""
+    logger.info("\n=== Test: Execute dbt Combined - Selector ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = write_config(tmpdir, create_diamond_config())
+        runner = StubRunner("D", str(config_path), tmpdir)
+        assert runner.load_config(), "Config should load"
+        
+        runner.execute_dbt_combined(["A", "B", "D"], capture_models=True)
+        
+        call = runner.dbt_calls[0]
+        assert call["command"] == [
+            "dbt", "run", "--select", "+pipeline_a.* +pipeline_b.* +pipeline_d.*"
+        ], f"Unexpected command: {call['command']}"
+        assert call["timeout"] == DBT_TIMEOUT_SECONDS * 3, f"Unexpected timeout: {call['timeout']}"
+        assert call["capture_models"], "Models should be captured"
+        logger.info("✓ Combined selector and timeout built")
+
+
+def test_single_invocation_opt_in():
+    """Test that the combined run is used only when single_invocation is enabled."""
+    logger.info("\n=== Test: Single Invocation - Opt In ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = create_diamond_config()
+        config_path = write_config(tmpdir, config)
+        runner = StubRunner("E", str(config_path), tmpdir)
+        runner.run()
+        assert not runner.dbt_calls, "Combined run should be off by default"
+        logger.info("✓ Level scheduling used by default")
+        
+        config["single_invocation"] = True
+        config_path = write_config(tmpdir, config)
+        runner = StubRunner("E", str(config_path), tmpdir)
+        results = runner.run()
+        
+        assert results["success"], f"Run should succeed: {results['errors']}"
+        assert len(runner.dbt_calls) == 1, f"Expected one dbt call: {runner.dbt_calls}"
+        assert not runner.calls, "Pipelines should not run individually"
+        logger.info("✓ Single dbt run when enabled")
+
+
+def install_fake_dbt() -> Dict[str, types.ModuleType]:
+    """Register minimal dbt.adapters and dbt.cli modules, returning them by name."""
+    class FakeAdapter:
+        def cleanup_connections(self):
+            pass
+    
+    modules = {name: types.ModuleType(name) for name in (
+        "dbt", "dbt.adapters", "dbt.adapters.factory", "dbt.adapters.base", "dbt.cli", "dbt.cli.requires"
+    )}
+    modules["dbt.adapters.factory"].adapter_management = lambda: None
+    modules["dbt.adapters.factory"].reset_adapters = lambda: None
+    modules["dbt.adapters.factory"].FACTORY = types.SimpleNamespace(adapters={})
+    modules["dbt.adapters.base"].BaseAdapter = FakeAdapter
+    modules["dbt.cli.requires"].adapter_management = modules["dbt.adapters.factory"].adapter_management
+    modules["dbt.adapters"].factory = modules["dbt.adapters.factory"]
+    modules["dbt.adapters"].base = modules["dbt.adapters.base"]
+    modules["dbt.cli"].requires = modules["dbt.cli.requires"]
+    return modules
+
+
+def test_pooled_adapters_restores_dbt_internals():
+    """Test that the adapter pool only patches dbt for the duration of an invocation."""
+    logger.info("\n=== Test: Adapter Pool - Scoped Patch ===")
+    
+    modules = install_fake_dbt()
+    factory = modules["dbt.adapters.factory"]
+    requires = modules["dbt.cli.requires"]
+    adapter_class = modules["dbt.adapters.base"].BaseAdapter
+    original = (factory.adapter_management, requires.adapter_management, adapter_class.cleanup_connections)
+    saved_modules = {name: sys.modules.get(name) for name in modules}
+    saved_version = dbt_runner._dbt_core_version
+    
+    sys.modules.update(modules)
+    try:
+        dbt_runner._dbt_core_version = lambda: (1, 7)
+        with dbt_runner._pooled_adapters():
+            assert factory.adapter_management is not original[0], "adapter_management should be pooled"
+            assert requires.adapter_management is factory.adapter_management
+            assert adapter_class.cleanup_connections is not original[2], "cleanup should be disabled"
+        patched_back = (factory.adapter_management, requires.adapter_management, adapter_class.cleanup_connections)
+        assert patched_back == original, "dbt internals should be restored after the invocation"
+        logger.info("✓ dbt internals patched only inside the context")
+        
+        dbt_runner._dbt_core_version = lambda: dbt_runner.ADAPTER_POOL_DBT_VERSIONS[1]
+        with dbt_runner._pooled_adapters():
+            assert factory.adapter_management is original[0], "Unsupported versions should not be patched"
+        logger.info("✓ Unsupported dbt-core version left unpatched")
+    finally:
+        dbt_runner._dbt_core_version = saved_version
+        for name, module in saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def run_all_tests():
+    """Run all test cases."""
+    logger.info("\n" + "="*60)
+    logger.info("DBT PIPELINE RUNNER - TEST SUITE")
+    logger.info("="*60)
+    
+    tests = [
+        ("Levels: Diamond", test_resolve_dependency_levels_diamond),
+        ("Levels: No Dependencies", test_resolve_dependency_levels_no_dependencies),
+        ("Execute Level: Result Order", test_execute_level_preserves_level_order),
+        ("Execute Level: Serial by Default", test_execute_level_serial_by_default),
+        ("Execute dbt: Isolated Paths", test_execute_dbt_isolated_paths),
+        ("Execute Level: Stop on Failure", test_execute_level_in_process_stops_on_failure),
+        ("Run: Failed Level", test_run_stops_after_failed_level),
+        ("Run: Target Models", test_run_captures_target_models),
+        ("Record Failure: Truncation", test_record_failure_truncates_stderr),
+        ("Record Failure: Short Output", test_record_failure_short_stderr),
+        ("Combined: Selector", test_execute_dbt_combined_selector),
+        ("Combined: Opt In", test_single_invocation_opt_in),
+        ("Adapter Pool: Scoped Patch", test_pooled_adapters_restores_dbt_internals),
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"✗ FAILED: {test_name}")
+            logger.error(f"  Error: {str(e)}")
+            failed += 1
+        except Exception as e:
+            logger.error(f"✗ ERROR: {test_name}")
+            logger.error(f"  Error: {str(e)}")
+            failed += 1
+    
+    logger.info("\n" + "="*60)
+    logger.info(f"TEST RESULTS: {passed} passed, {failed} failed")
+    logger.info("="*60 + "\n")
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
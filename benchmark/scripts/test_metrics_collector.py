@@ -0,0 +1,215 @@
+"""
+Test Suite for Metrics Collector
+
+Tests the collect_metrics result cache and ACCOUNT_USAGE credit retries
+without connecting to Snowflake.
+"""
+
+import logging
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from benchmark.scripts import metrics_collector
+from benchmark.scripts.metrics_collector import (
+    MetricsCollector,
+    _ProfileCache,
+    _read_metrics_cache,
+    _write_metrics_cache
+)
+
+
+# Configure logging for tests
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def test_metrics_cache_decimal_round_trip():
+    """Test that Decimal values from NUMBER columns survive a cache write and read."""
+    logger.info("\n=== Test: Metrics Cache - Decimal Round Trip ===")
+    
+    metrics = {
+        'pipeline_name': 'pipeline_a',
+        'per_model': {
+            'model_a': {
+                'execution_time_ms': 1200,
+                'warehouse_credits': Decimal('0.000123'),
+                'spilling_to_local_storage_bytes': Decimal('0')
+            }
+        },
+        'pipeline_aggregations': {'total_credits': Decimal('1.5')}
+    }
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "metrics_cache" / "entry.json"
+        _write_metrics_cache(cache_path, metrics)
+        assert cache_path.exists(), "Cache file should be written"
+        logger.info("✓ Decimal-bearing metrics written to cache")
+        
+        cached = _read_metrics_cache(cache_path)
+        assert cached is not None, "Cache should read back"
+        model = cached['per_model']['model_a']
+        assert model['warehouse_credits'] == 0.000123, \
+            f"Unexpected credits: {model['warehouse_credits']}"
+        assert model['spilling_to_local_storage_bytes'] == 0
+        assert model['execution_time_ms'] == 1200
+        assert cached['pipeline_aggregations']['total_credits'] == 1.5
+        logger.info("✓ Decimal values read back as numbers")
+        
+        assert list(cache_path.parent.iterdir()) == [cache_path], \
+            "No temporary files should be left behind"
+        logger.info("✓ No temporary files left behind")
+
+
+def test_metrics_cache_unencodable_value_skips_write():
+    """Test that a value JSON can't encode skips the cache instead of raising."""
+    logger.info("\n=== Test: Metrics Cache - Unencodable Value ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "entry.json"
+        _write_metrics_cache(cache_path, {'per_model': {'model_a': {'value': object()}}})
+        assert _read_metrics_cache(cache_path) is None, "Nothing should be cached"
+        logger.info("✓ Unencodable metrics are not cached")
+
+
+class StubCollector(MetricsCollector):
+    """MetricsCollector that answers queries from in-memory ACCOUNT_USAGE rows."""
+    
+    def __init__(self, account_usage: Dict[str, Tuple[Any, ...]]):
+        super().__init__()
+        self.account_usage = account_usage
+        self.queries: List[Tuple[Any, ...]] = []
+        self.credit_calls: List[Tuple[List[str], int]] = []
+    
+    def _load_config(self) -> bool:
+        return True
+    
+    def _connect(self) -> None:
+        pass
+    
+    def _execute_query(self, query: str, params: Optional[Tuple[Any, ...]] = None):
+        self.queries.append(params)
+        columns = ['QUERY_ID', 'WAREHOUSE_CREDITS', 'SPILLING_TO_LOCAL_STORAGE_BYTES',
+                   'SPILLING_TO_REMOTE_STORAGE_BYTES']
+        rows = [(query_id,) + row for query_id, row in self.account_usage.items()
+                if query_id in params[0]]
+        return columns, rows
+    
+    def _get_combined_metrics(self, query_ids: List[str]):
+        basic_metrics = {
+            query_id: {'execution_time_ms': 100, 'partitions_scanned': 1,
+                       'partitions_total': 2, 'query_text': 'select 1'}
+            for query_id in query_ids
+        }
+        credit_metrics = {
+            'q1': {'warehouse_credits': 0.5, 'spilling_to_local_storage_bytes': 0,
+                   'spilling_to_remote_storage_bytes': 0}
+        }
+        return basic_metrics, credit_metrics
+    
+    def _get_credit_metrics(self, query_ids: List[str], max_retries: int = 3,
+                            first_attempt: int = 0):
+        self.credit_calls.append((query_ids, first_attempt))
+        return super()._get_credit_metrics(query_ids, max_retries, first_attempt)
+    
+    def _get_query_profiles_async(self, query_ids: List[str]):
+        return {}
+
+
+def test_collect_retries_credits_missing_from_join():
+    """Test that queries without an ACCOUNT_USAGE row in the joined query are retried."""
+    logger.info("\n=== Test: Collect Metrics - Credit Retry After Join ===")
+    
+    collector = StubCollector({'q2': (0.25, 0, 0)})
+    original_sleep = metrics_collector.time.sleep
+    original_cache = metrics_collector._PROFILE_CACHE
+    sleeps = []
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        metrics_collector.time.sleep = sleeps.append
+        metrics_collector._PROFILE_CACHE = _ProfileCache(Path(tmpdir) / "profiles.sqlite")
+        try:
+            metrics = collector._collect_fresh_metrics(['q1', 'q2'], 'pipeline_a')
+        finally:
+            metrics_collector.time.sleep = original_sleep
+            metrics_collector._PROFILE_CACHE.close()
+            metrics_collector._PROFILE_CACHE = original_cache
+    
+    assert collector.credit_calls == [(['q2'], 1)], \
+        f"Only q2 should be retried, as a second attempt: {collector.credit_calls}"
+    assert sleeps == [60], f"Should back off once before the retry: {sleeps}"
+    logger.info("✓ Missing credit rows retried after backing off")
+    
+    credits = {model['query_id']: model['warehouse_credits']
+               for model in metrics['per_model'].values()}
+    assert credits == {'q1': 0.5, 'q2': 0.25}, f"Unexpected credits: {credits}"
+    logger.info("✓ Retried credit metrics merged with the joined result")
+
+
+def test_get_credit_metrics_gives_up_after_max_retries():
+    """Test that credit retries stop at max_retries and return what was found."""
+    logger.info("\n=== Test: Credit Metrics - Retry Limit ===")
+    
+    collector = StubCollector({'q1': (0.5, 0, 0)})
+    original_sleep = metrics_collector.time.sleep
+    sleeps = []
+    
+    metrics_collector.time.sleep = sleeps.append
+    try:
+        credit_metrics = collector._get_credit_metrics(['q1', 'q2'], first_attempt=1)
+    finally:
+        metrics_collector.time.sleep = original_sleep
+    
+    assert sleeps == [60, 120], f"Unexpected backoff: {sleeps}"
+    assert len(collector.queries) == 2, f"Expected two queries, got {len(collector.queries)}"
+    logger.info("✓ Backoff continues from the attempts already made")
+    
+    assert list(credit_metrics) == ['q1'], f"Unexpected credit metrics: {credit_metrics}"
+    assert '"q2"' in collector.queries[-1][0] and '"q1"' not in collector.queries[-1][0], \
+        "Later attempts should only ask for missing IDs"
+    logger.info("✓ Found credits returned, missing IDs left out")
+
+
+def run_all_tests():
+    """Run all test cases."""
+    logger.info("\n" + "="*60)
+    logger.info("METRICS COLLECTOR - TEST SUITE")
+    logger.info("="*60)
+    
+    tests = [
+        ("Cache: Decimal Round Trip", test_metrics_cache_decimal_round_trip),
+        ("Cache: Unencodable Value", test_metrics_cache_unencodable_value_skips_write),
+        ("Collect: Credit Retry After Join", test_collect_retries_credits_missing_from_join),
+        ("Credit Metrics: Retry Limit", test_get_credit_metrics_gives_up_after_max_retries),
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"✗ FAILED: {test_name}")
+            logger.error(f"  Error: {str(e)}")
+            failed += 1
+        except Exception as e:
+            logger.error(f"✗ ERROR: {test_name}")
+            logger.error(f"  Error: {str(e)}")
+            failed += 1
+    
+    logger.info("\n" + "="*60)
+    logger.info(f"TEST RESULTS: {passed} passed, {failed} failed")
+    logger.info("="*60 + "\n")
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
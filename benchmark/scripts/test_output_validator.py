@@ -0,0 +1,182 @@
+"""
+Test Suite for Output Validator
+
+Tests fingerprint computation, baseline hash method checks and validation
+without connecting to Snowflake.
+"""
+
+import hashlib
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from benchmark.scripts.output_validator import (
+    OutputValidator,
+    HASH_METHOD_HASH_AGG,
+    HASH_METHOD_SHA256
+)
+
+
+# Configure logging for tests
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+ROW_HASHES = [-5, 12, 7340]
+HASH_AGG_FINGERPRINT = 998877
+
+
+class StubValidator(OutputValidator):
+    """OutputValidator with canned query results and baselines in a temp directory."""
+    
+    def __init__(self, baselines_dir: str, use_hash_agg: bool = True):
+        self.baselines_dir = Path(baselines_dir)
+        self.queries: List[str] = []
+        super().__init__(use_hash_agg=use_hash_agg)
+    
+    def _load_config(self) -> bool:
+        return True
+    
+    def _load_pipelines_config(self) -> bool:
+        self.pipelines_config = {'A': {'schema': 'pipeline_a'}}
+        return True
+    
+    def _connect(self) -> bool:
+        return True
+    
+    def _execute_query(self, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        self.queries.append(query)
+        if 'HASH_AGG(*)' in query:
+            return [{'ROW_COUNT': len(ROW_HASHES), 'FINGERPRINT': HASH_AGG_FINGERPRINT}]
+        if 'HASH(*)' in query:
+            return [{'ROW_HASH': row_hash} for row_hash in ROW_HASHES]
+        raise AssertionError(f"Unexpected query: {query}")
+    
+    def _get_baseline_path(self, pipeline_id: str, model_name: str) -> Path:
+        return self.baselines_dir / f"baseline_{pipeline_id.lower()}_{model_name.lower()}.json"
+
+
+def test_count_and_fingerprint_sha256_fallback():
+    """Test that the SHA256 fallback counts row hashes and aggregates them in order."""
+    logger.info("\n=== Test: Fingerprint - SHA256 Fallback ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        validator = StubValidator(tmpdir, use_hash_agg=False)
+        row_count, fingerprint = validator._get_count_and_fingerprint('pipeline_a', 'fct_orders')
+    
+    expected = hashlib.sha256(''.join(str(h) for h in ROW_HASHES).encode()).hexdigest()
+    assert row_count == len(ROW_HASHES), f"Unexpected row count: {row_count}"
+    assert fingerprint == expected, f"Unexpected fingerprint: {fingerprint}"
+    logger.info("✓ Row count and SHA256 fingerprint computed from row hashes")
+    
+    assert len(validator.queries) == 1 and 'HASH_AGG' not in validator.queries[0], \
+        f"Fallback should fetch row hashes in one query: {validator.queries}"
+    assert validator.hash_method == HASH_METHOD_SHA256
+    logger.info("✓ Single row-hash query, recorded as %s", validator.hash_method)
+
+
+def test_count_and_fingerprint_hash_agg():
+    """Test that HASH_AGG returns the count and fingerprint from one query."""
+    logger.info("\n=== Test: Fingerprint - HASH_AGG ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        validator = StubValidator(tmpdir)
+        row_count, fingerprint = validator._get_count_and_fingerprint('pipeline_a', 'fct_orders')
+    
+    assert (row_count, fingerprint) == (len(ROW_HASHES), str(HASH_AGG_FINGERPRINT)), \
+        f"Unexpected result: {(row_count, fingerprint)}"
+    assert len(validator.queries) == 1, f"Expected one query: {validator.queries}"
+    assert validator.hash_method == HASH_METHOD_HASH_AGG
+    logger.info("✓ Count and fingerprint from one HASH_AGG query")
+
+
+def test_validate_model_hash_method_mismatch():
+    """Test that a baseline captured with another hash method fails without querying."""
+    logger.info("\n=== Test: Validate Model - Hash Method Mismatch ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        capture = StubValidator(tmpdir)
+        results = capture.capture_baseline('A', ['fct_orders'])
+        assert results['models_captured'] == 1, f"Capture failed: {results}"
+        
+        baseline = json.loads(capture._get_baseline_path('A', 'fct_orders').read_text())
+        assert baseline['hash_method'] == HASH_METHOD_HASH_AGG, \
+            f"Unexpected hash method: {baseline.get('hash_method')}"
+        logger.info("✓ Baseline records its hash method")
+        
+        validator = StubValidator(tmpdir, use_hash_agg=False)
+        result = validator.validate_model('A', 'fct_orders')
+    
+    assert result['status'] == 'FAIL', f"Unexpected status: {result['status']}"
+    assert HASH_METHOD_HASH_AGG in result['error'] and HASH_METHOD_SHA256 in result['error'], \
+        f"Error should name both methods: {result['error']}"
+    assert validator.queries == [], "Mismatched baselines should not query the table"
+    logger.info("✓ Mismatch reported without querying: %s", result['error'])
+
+
+def test_validate_model_legacy_baseline():
+    """Test that baselines without hash_method are treated as SHA256."""
+    logger.info("\n=== Test: Validate Model - Legacy Baseline ===")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        capture = StubValidator(tmpdir, use_hash_agg=False)
+        capture.capture_baseline('A', ['fct_orders'])
+        baseline_path = capture._get_baseline_path('A', 'fct_orders')
+        baseline = json.loads(baseline_path.read_text())
+        del baseline['hash_method']
+        baseline_path.write_text(json.dumps(baseline))
+        
+        result = StubValidator(tmpdir).validate_model('A', 'fct_orders')
+        assert result['status'] == 'FAIL' and HASH_METHOD_SHA256 in result['error'], \
+            f"HASH_AGG validator should reject legacy baseline: {result}"
+        logger.info("✓ Legacy baseline rejected by HASH_AGG validator")
+        
+        result = StubValidator(tmpdir, use_hash_agg=False).validate_model('A', 'fct_orders')
+        assert result['status'] == 'PASS', f"Legacy baseline should validate: {result}"
+        assert result['row_count_match'] and result['hash_match']
+        logger.info("✓ Legacy baseline validated with SHA256")
+
+
+def run_all_tests():
+    """Run all test cases."""
+    logger.info("\n" + "="*60)
+    logger.info("OUTPUT VALIDATOR - TEST SUITE")
+    logger.info("="*60)
+    
+    tests = [
+        ("Fingerprint: SHA256 Fallback", test_count_and_fingerprint_sha256_fallback),
+        ("Fingerprint: HASH_AGG", test_count_and_fingerprint_hash_agg),
+        ("Validate: Hash Method Mismatch", test_validate_model_hash_method_mismatch),
+        ("Validate: Legacy Baseline", test_validate_model_legacy_baseline),
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            logger.error(f"✗ FAILED: {test_name}")
+            logger.error(f"  Error: {str(e)}")
+            failed += 1
+        except Exception as e:
+            logger.error(f"✗ ERROR: {test_name}")
+            logger.error(f"  Error: {str(e)}")
+            failed += 1
+    
+    logger.info("\n" + "="*60)
+    logger.info(f"TEST RESULTS: {passed} passed, {failed} failed")
+    logger.info("="*60 + "\n")
+    
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -11,7 +11,7 @@ import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from report_generator import (
+from benchmark.scripts.report_generator import (
     ReportGenerator,
     MetricFormatter,
     merge_reports,
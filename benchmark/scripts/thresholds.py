@@ -14,11 +14,12 @@ Features:
 """
 
 import logging
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 
+from .serialization import yaml_load
+
 
 # Configure logging
 logging.basicConfig(
@@ -38,6 +39,14 @@ class SeverityLevel(Enum):
 class Violation:
     """Represents a single metric violation."""
     
+    # Large pipelines create one of these per violating metric, so keep
+    # instances compact and attribute access at fixed offsets
+    __slots__ = (
+        'metric_name', 'baseline_value', 'candidate_value', 'delta',
+        'delta_percent', 'threshold', 'threshold_type', 'severity',
+        'is_improvement', '_message'
+    )
+    
     def __init__(self,
                  metric_name: str,
                  baseline_value: Optional[float],
@@ -71,9 +80,27 @@ class Violation:
         self.threshold_type = threshold_type
         self.severity = severity
         self.is_improvement = is_improvement
+        self._message = None
+    
+    @property
+    def message(self) -> str:
+        """
+        Detailed violation message.
+        
+        Formatted on first access and reused, since both the text and JSON
+        reports render every violation. The message doesn't include the
+        severity, so reclassifying a violation leaves it valid.
+        """
+        if self._message is None:
+            self._message = self._format_message()
+        return self._message
     
     def get_message(self) -> str:
         """Generate a detailed violation message."""
+        return self.message
+    
+    def _format_message(self) -> str:
+        """Format the message returned by the message property."""
         improvement_text = " (IMPROVEMENT)" if self.is_improvement else ""
         
         if self.delta_percent is not None:
@@ -124,8 +151,8 @@ class ThresholdManager:
                 logger.warning(f"Thresholds config not found: {self.config_path}")
                 return False
             
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            with open(self.config_path, 'rb') as f:
+                config = yaml_load(f.read())
             
             if config and 'thresholds' in config:
                 self.thresholds = config['thresholds']
@@ -170,16 +197,27 @@ class MetricsComparer:
     
     def __init__(self,
                  threshold_manager: ThresholdManager,
-                 ignore_improvements: bool = False):
+                 ignore_improvements: bool = False,
+                 threshold_cache: Optional[Dict[str, Dict[str, Any]]] = None):
         """
         Initialize MetricsComparer.
         
         Args:
             threshold_manager: ThresholdManager instance
             ignore_improvements: If True, don't fail on improvements (negative deltas)
+            threshold_cache: Prebuilt {metric_name: threshold_config} table to
+                share with the caller; built from threshold_manager if omitted
         """
         self.threshold_manager = threshold_manager
         self.ignore_improvements = ignore_improvements
+        
+        # Resolve thresholds once so the per-metric path is a plain dict lookup
+        if threshold_cache is None:
+            threshold_cache = {
+                name: threshold_manager.get_threshold(name)
+                for name in threshold_manager.get_all_metrics()
+            }
+        self._threshold_cache = threshold_cache
     
     def calculate_delta(self,
                        baseline_value: Optional[float],
@@ -238,7 +276,7 @@ class MetricsComparer:
         ignore_impr = ignore_improvements if ignore_improvements is not None else self.ignore_improvements
         
         # Get threshold configuration
-        threshold_config = self.threshold_manager.get_threshold(metric_name)
+        threshold_config = self._threshold_cache.get(metric_name)
         if not threshold_config:
             return None
         
@@ -279,7 +317,10 @@ class MetricsComparer:
             if not is_improvement and delta_percent is not None:
                 if delta_percent > threshold:
                     # Classify by magnitude of violation
-                    severity = self._classify_severity(metric_name, delta_percent, threshold)
+                    severity = self._classify_severity(
+                        metric_name, delta_percent, threshold,
+                        threshold_config=threshold_config
+                    )
                     return Violation(
                         metric_name=metric_name,
                         baseline_value=baseline_value,
@@ -314,7 +355,10 @@ class MetricsComparer:
             
             # For regressions
             if not is_improvement and delta > threshold:
-                severity = self._classify_severity(metric_name, delta, threshold, is_absolute=True)
+                severity = self._classify_severity(
+                    metric_name, delta, threshold,
+                    is_absolute=True, threshold_config=threshold_config
+                )
                 return Violation(
                     metric_name=metric_name,
                     baseline_value=baseline_value,
@@ -333,7 +377,8 @@ class MetricsComparer:
                           metric_name: str,
                           delta: float,
                           threshold: float,
-                          is_absolute: bool = False) -> SeverityLevel:
+                          is_absolute: bool = False,
+                          threshold_config: Optional[Dict[str, Any]] = None) -> SeverityLevel:
         """
         Classify violation severity based on magnitude and metric configuration.
         
@@ -342,28 +387,27 @@ class MetricsComparer:
             delta: The delta value (absolute or percentage)
             threshold: The configured threshold
             is_absolute: True if delta is absolute, False if percentage
+            threshold_config: The metric's threshold config, if the caller
+                already resolved it
         
         Returns:
             SeverityLevel enum value
         """
-        threshold_config = self.threshold_manager.get_threshold(metric_name)
+        if threshold_config is None:
+            threshold_config = self._threshold_cache.get(metric_name)
         if not threshold_config:
             return SeverityLevel.WARNING
         
         # Get severity hint from config
         severity_hint = threshold_config.get('severity', 'medium').lower()
         
-        # Calculate magnitude of violation
-        if is_absolute:
-            magnitude = delta / threshold if threshold != 0 else float('inf')
-        else:
-            magnitude = delta / threshold if threshold != 0 else float('inf')
-        
-        # Classify based on severity hint and magnitude
+        # Classify based on severity hint; only 'high' depends on the magnitude
+        # of the violation, so it's the only branch that computes it
         if severity_hint == 'critical':
             return SeverityLevel.ERROR
         elif severity_hint == 'high':
             # High severity is ERROR if violation is >50% of threshold, else WARNING
+            magnitude = delta / threshold if threshold != 0 else float('inf')
             return SeverityLevel.ERROR if magnitude > 0.5 else SeverityLevel.WARNING
         else:  # medium or low
             return SeverityLevel.WARNING